@@ -0,0 +1,256 @@
+"""
+AVL trees keeping aggregates of their subtrees in every node.
+
+An aggregate is a monoid: an associative `combine` with an `identity` and a
+`measure` of what a single node contributes. Nodes store the aggregate of their
+subtree next to `height` and AVLTreeNode.update keeps both correct through
+inserts, deletes and rotations, so aggregates of any key range take O(log n).
+
+Based on:
+https://en.wikipedia.org/wiki/Augmented_tree
+https://en.wikipedia.org/wiki/Interval_tree#Augmented_tree
+"""
+from __future__ import annotations
+
+import operator
+from typing import Callable, Iterator, Optional
+
+from .trees import AVLTree, AVLTreeNode
+
+
+class Monoid:
+    """Associative combine with an identity and the value of a single node."""
+
+    __slots__ = ("identity", "combine", "measure")
+
+    def __init__(
+        self,
+        identity,
+        combine: Callable,
+        measure: Callable[[AVLTreeNode], object],
+    ) -> None:
+        self.identity = identity
+        self.combine = combine
+        self.measure = measure
+
+
+COUNT = Monoid(0, operator.add, lambda node: 1)
+# nodes without data (like those of bulk builds) count as the identity
+SUM = Monoid(0, operator.add, lambda node: 0 if node.data is None else node.data)
+MAXIMUM = Monoid(
+    float("-inf"),
+    max,
+    lambda node: float("-inf") if node.data is None else node.data,
+)
+MINIMUM = Monoid(
+    float("inf"),
+    min,
+    lambda node: float("inf") if node.data is None else node.data,
+)
+
+
+class AugmentedAVLTreeNode(AVLTreeNode):
+    """AVL tree node with aggregates of its subtree for every monoid."""
+
+    __slots__ = ("aggregates",)
+
+    monoids: tuple[Monoid, ...] = ()
+
+    def __init__(self, value: int, data=None) -> None:
+        super().__init__(value, data)
+        self.update(self)
+
+    @classmethod
+    def update(cls, node: AugmentedAVLTreeNode) -> None:
+        super().update(node)
+        left, right = node.left, node.right
+        node.aggregates = tuple(
+            monoid.combine(
+                monoid.combine(
+                    monoid.identity if left is None else left.aggregates[position],
+                    monoid.measure(node),
+                ),
+                monoid.identity if right is None else right.aggregates[position],
+            )
+            for position, monoid in enumerate(cls.monoids)
+        )
+
+
+class AugmentedAVLTree(AVLTree):
+    """Ordered map answering aggregate queries over ranges of keys."""
+
+    node_class = AugmentedAVLTreeNode
+
+    def __setitem__(self, key, value) -> None:
+        path = []
+        node = self.root
+        while node is not None and node.value != key:
+            path.append(node)
+            node = node.left if key < node.value else node.right
+        if node is None:
+            self.root = self.node_class.insert(self.root, key, self.threshold, value)
+            self.length += 1
+            return
+
+        # aggregates may depend on data, update them up to the root
+        node.data = value
+        self.node_class.update(node)
+        for ancestor in reversed(path):
+            self.node_class.update(ancestor)
+
+    def aggregate(self, low=None, high=None, position: int = 0):
+        """Return aggregate of keys between low and high (inclusive).
+
+        Missing bounds are unlimited. `position` selects the monoid of the
+        node class.
+        """
+        monoid = self.node_class.monoids[position]
+        node = self.root
+        # find the highest node within the range
+        while node is not None:
+            if low is not None and node.value < low:
+                node = node.right
+            elif high is not None and node.value > high:
+                node = node.left
+            else:
+                break
+        if node is None:
+            return monoid.identity
+
+        left = self._aggregate_from(node.left, low, position)
+        right = self._aggregate_until(node.right, high, position)
+        return monoid.combine(monoid.combine(left, monoid.measure(node)), right)
+
+    def _aggregate_from(self, node: Optional[AugmentedAVLTreeNode], low, position: int):
+        """Return aggregate of keys of a subtree not lower than low."""
+        if low is None:
+            return self._aggregate(node, position)
+        monoid = self.node_class.monoids[position]
+        # pieces are found from right to left
+        result = monoid.identity
+        while node is not None:
+            if node.value >= low:
+                piece = monoid.combine(
+                    monoid.measure(node), self._aggregate(node.right, position)
+                )
+                result = monoid.combine(piece, result)
+                node = node.left
+            else:
+                node = node.right
+        return result
+
+    def _aggregate_until(
+        self, node: Optional[AugmentedAVLTreeNode], high, position: int
+    ):
+        """Return aggregate of keys of a subtree not greater than high."""
+        if high is None:
+            return self._aggregate(node, position)
+        monoid = self.node_class.monoids[position]
+        result = monoid.identity
+        while node is not None:
+            if node.value <= high:
+                piece = monoid.combine(
+                    self._aggregate(node.left, position), monoid.measure(node)
+                )
+                result = monoid.combine(result, piece)
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    def _aggregate(self, node: Optional[AugmentedAVLTreeNode], position: int):
+        if node is None:
+            return self.node_class.monoids[position].identity
+        return node.aggregates[position]
+
+
+class OrderStatisticNode(AugmentedAVLTreeNode):
+    __slots__ = ()
+
+    monoids = (COUNT, SUM)
+
+
+class OrderStatisticTree(AugmentedAVLTree):
+    """Ordered map of numbers with ranks and sums of ranges of keys."""
+
+    node_class = OrderStatisticNode
+
+    def rank(self, key) -> int:
+        """Return the number of keys lower than key."""
+        rank, node = 0, self.root
+        while node is not None:
+            if key <= node.value:
+                node = node.left
+            else:
+                rank += 1 + self._aggregate(node.left, 0)
+                node = node.right
+        return rank
+
+    def select(self, k: int):
+        """Return the k-th smallest (0 based) key."""
+        if not 0 <= k < self.length:
+            raise IndexError(f"{k} is out of range for {self.length} keys")
+        node = self.root
+        while True:
+            left_size = self._aggregate(node.left, 0)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def count(self, low=None, high=None) -> int:
+        """Return the number of keys between low and high (inclusive)."""
+        return self.aggregate(low, high, 0)
+
+    def sum(self, low=None, high=None):
+        """Return the sum of values of keys between low and high (inclusive)."""
+        return self.aggregate(low, high, 1)
+
+
+class IntervalNode(AugmentedAVLTreeNode):
+    """Node of an interval (start, end) keeping the biggest end of its subtree."""
+
+    __slots__ = ()
+
+    monoids = (Monoid(float("-inf"), max, lambda node: node.value[1]),)
+
+
+class IntervalTree(AugmentedAVLTree):
+    """Set of closed intervals ordered by start, searched for overlaps.
+
+    Subtrees whose biggest end is lower than the searched range are skipped,
+    so finding k overlapping intervals takes O(log n + k) on average.
+    """
+
+    node_class = IntervalNode
+
+    def add(self, start, end) -> None:
+        if end < start:
+            raise ValueError(f"Interval end {end} is lower than its start {start}")
+        self[(start, end)] = None
+
+    def remove(self, start, end) -> None:
+        del self[(start, end)]
+
+    def overlapping(self, low, high=None) -> Iterator[tuple]:
+        """Yield intervals overlapping [low, high] (the point low) by start."""
+        if high is None:
+            high = low
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None and node.aggregates[0] >= low:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            start, end = node.value
+            if start > high:
+                return
+            if end >= low:
+                yield start, end
+            node = node.right
@@ -0,0 +1,197 @@
+"""
+Throughput benchmark of trees shared between threads.
+
+Every tree is filled with random values and then a pool of threads runs
+random lookups, inserts and deletes with a given share of reads. The results
+note whether the GIL was enabled, so runs on the regular and free-threaded
+(3.13t) builds can be told apart:
+
+    python -m datastructures.benchmarks --threads 1 2 4 8 --output gil.json
+    python3.13t -m datastructures.benchmarks --read-ratios 0.9 0.99
+
+After the timed run the tree contents are checked against the operations
+that succeeded, so the benchmark doubles as a stress test.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional
+
+from .concurrent_trees import ConcurrentBinarySearchTree
+from .trees import BinarySearchTreeNode
+
+
+class LockedBinarySearchTree:
+    """BinarySearchTreeNode behind one lock shared by readers and writers."""
+
+    def __init__(self, values: Iterable = ()) -> None:
+        self.lock = threading.Lock()
+        # values are never negative, the sentinel root keeps the tree non empty
+        self.root = BinarySearchTreeNode(-1)
+        self.length = 0
+        for value in values:
+            self.insert(value)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, value) -> bool:
+        with self.lock:
+            return self.root.depth_first_search_iterative(value)[0]
+
+    def insert(self, value) -> bool:
+        with self.lock:
+            if self.root.depth_first_search_iterative(value)[0]:
+                return False
+            self.root.insert(value)
+            self.length += 1
+            return True
+
+    def delete(self, value) -> None:
+        with self.lock:
+            self.root.delete(value)
+            self.length -= 1
+
+    def get_inorder(self) -> list:
+        with self.lock:
+            return self.root.get_inorder()[1:]
+
+
+TREES = {
+    tree.__name__: tree for tree in (LockedBinarySearchTree, ConcurrentBinarySearchTree)
+}
+
+THREADS = (1, 2, 4, 8)
+
+READ_RATIOS = (0.5, 0.9, 0.99)
+
+
+def gil_enabled() -> bool:
+    """Return whether the GIL is enabled (always on builds before 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def worker(tree, seed: int, operations: int, read_ratio: float, key_range: int):
+    """Run random operations and return counts of values added and deleted."""
+    rng = random.Random(seed)
+    added = [0] * key_range
+    for _ in range(operations):
+        value = rng.randrange(key_range)
+        if rng.random() < read_ratio:
+            value in tree
+        elif rng.random() < 0.5:
+            if tree.insert(value):
+                added[value] += 1
+        else:
+            try:
+                tree.delete(value)
+            except ValueError:
+                continue
+            added[value] -= 1
+    return added
+
+
+def measure(
+    tree_class: type,
+    threads: int,
+    read_ratio: float,
+    operations: int,
+    key_range: int,
+    seed: int,
+) -> dict:
+    """Run one mixed workload and return its throughput."""
+    rng = random.Random(seed)
+    initial = rng.sample(range(key_range), key_range // 2)
+    tree = tree_class(initial)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        futures = [
+            executor.submit(
+                worker, tree, seed + index, operations, read_ratio, key_range
+            )
+            for index in range(threads)
+        ]
+        changes = [future.result() for future in futures]
+        seconds = time.perf_counter() - start
+
+    counts = [0] * key_range
+    for value in initial:
+        counts[value] = 1
+    for added in changes:
+        for value, change in enumerate(added):
+            counts[value] += change
+    expected = [value for value, count in enumerate(counts) if count]
+    return {
+        "seconds": seconds,
+        "operations_per_second": threads * operations / seconds,
+        "consistent": tree.get_inorder() == expected and len(tree) == len(expected),
+    }
+
+
+def run(
+    trees: Iterable[str] = tuple(TREES),
+    threads: Iterable[int] = THREADS,
+    read_ratios: Iterable[float] = READ_RATIOS,
+    operations: int = 20_000,
+    key_range: int = 10_000,
+    seed: int = 0,
+    log: Optional[Callable] = None,
+) -> list[dict]:
+    """Benchmark every tree on every number of threads and read ratio."""
+    results = []
+    for read_ratio in read_ratios:
+        for count in threads:
+            for name in trees:
+                result = {"tree": name, "threads": count, "read_ratio": read_ratio}
+                result.update(
+                    measure(TREES[name], count, read_ratio, operations, key_range, seed)
+                )
+                results.append(result)
+                if log:
+                    log(result)
+    return results
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trees", nargs="+", choices=TREES, default=list(TREES))
+    parser.add_argument("--threads", nargs="+", type=int, default=list(THREADS))
+    parser.add_argument(
+        "--read-ratios", nargs="+", type=float, default=list(READ_RATIOS)
+    )
+    parser.add_argument("--operations", type=int, default=20_000)
+    parser.add_argument("--key-range", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results to this JSON file")
+    options = parser.parse_args(arguments)
+
+    results = run(
+        options.trees,
+        options.threads,
+        options.read_ratios,
+        options.operations,
+        options.key_range,
+        options.seed,
+        log=lambda result: print(json.dumps(result), file=sys.stderr),
+    )
+    report = {
+        "python": platform.python_version(),
+        "gil_enabled": gil_enabled(),
+        "seed": options.seed,
+        "results": results,
+    }
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(report, file, indent=2)
+    return 0 if all(result["consistent"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
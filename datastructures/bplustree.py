@@ -0,0 +1,378 @@
+import mmap
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Iterable, Iterator, Optional
+
+MAGIC = b"BPT1"
+# magic, page size, fanout, root, first leaf, page count, number of keys
+FILE_HEADER = struct.Struct("<4sIIqqqq")
+# leaf flag, number of keys, next leaf
+PAGE_HEADER = struct.Struct("<?3xIq")
+NO_PAGE = -1
+
+
+class Page:
+    """Decoded page of a B+tree.
+
+    Leaves hold sorted keys with their values and the number of the next leaf,
+    internal pages hold sorted separator keys and one more child page number.
+    """
+
+    __slots__ = ("number", "leaf", "keys", "items", "next_leaf", "dirty")
+
+    def __init__(
+        self,
+        number: int,
+        leaf: bool,
+        keys: list[int],
+        items: list[int],
+        next_leaf: int = NO_PAGE,
+    ) -> None:
+        self.number = number
+        self.leaf = leaf
+        self.keys = keys
+        self.items = items
+        self.next_leaf = next_leaf
+        self.dirty = False
+
+
+class BPlusTree:
+    """B+tree of integer keys and values stored in fixed size pages of a file.
+
+    The file is memory mapped and decoded pages are kept in a LRU cache of
+    `cache_size` pages, so the top levels of the tree stay in memory and a
+    lookup reads about one page per level that isn't cached. Leaves are linked,
+    so range scans read leaves one after another, and `bulk_load` writes them
+    sequentially from sorted input.
+
+    A page of `page_size` bytes holds up to `fanout` keys, by default as many
+    as fit. Deletion is lazy: keys are removed from their leaf, but underfull
+    pages are never merged.
+
+    Based on:
+    https://en.wikipedia.org/wiki/B%2B_tree
+    """
+
+    def __init__(
+        self,
+        path: str,
+        page_size: int = mmap.PAGESIZE,
+        fanout: Optional[int] = None,
+        cache_size: int = 256,
+    ) -> None:
+        if cache_size < 1:
+            raise ValueError(f"Cache has to hold at least 1 page, not {cache_size}")
+        self.cache_size = cache_size
+        self.cache: OrderedDict[int, Page] = OrderedDict()
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self.file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            self.mmap = mmap.mmap(self.file.fileno(), 0)
+            self._read_header()
+            if fanout is not None and fanout != self.fanout:
+                self.mmap.close()
+                self.file.close()
+                raise ValueError(f"{path} has fanout {self.fanout}, not {fanout}")
+            return
+
+        max_fanout = (page_size - PAGE_HEADER.size - 8) // 16
+        if fanout is None:
+            fanout = max_fanout
+        if not 3 <= fanout <= max_fanout:
+            self.file.close()
+            raise ValueError(
+                f"Fanout has to be between 3 and {max_fanout} for pages"
+                f" of {page_size} bytes, not {fanout}"
+            )
+        self.page_size = page_size
+        self.fanout = fanout
+        self.file.truncate(2 * page_size)
+        self.mmap = mmap.mmap(self.file.fileno(), 0)
+        # page 0 holds the file header, page 1 the empty root leaf
+        self.page_count = 1
+        self.length = 0
+        root = self._allocate(leaf=True)
+        self.root = self.first_leaf = root.number
+
+    def __enter__(self) -> "BPlusTree":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, key: int) -> bool:
+        return self.search(key) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        for key, _ in self.iter_range():
+            yield key
+
+    def search(self, key: int) -> Optional[int]:
+        """Return value stored for key or None."""
+        leaf = self._find_leaf(key)[-1][0]
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return leaf.items[index]
+        return None
+
+    def insert(self, key: int, value: int = 0) -> None:
+        """Insert key with value, replacing value of an existing key."""
+        path = self._find_leaf(key)
+        leaf = path[-1][0]
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            leaf.items[index] = value
+            self._mark_dirty(leaf)
+            return
+
+        leaf.keys.insert(index, key)
+        leaf.items.insert(index, value)
+        self.length += 1
+        self._mark_dirty(leaf)
+
+        # split overflowing pages bottom up
+        for depth in range(len(path) - 1, -1, -1):
+            page = path[depth][0]
+            if len(page.keys) <= self.fanout:
+                return
+            separator, sibling = self._split(page)
+            if depth == 0:
+                root = self._allocate(leaf=False)
+                root.keys = [separator]
+                root.items = [page.number, sibling.number]
+                self.root = root.number
+                return
+            parent, child_index = path[depth - 1]
+            parent.keys.insert(child_index, separator)
+            parent.items.insert(child_index + 1, sibling.number)
+            self._mark_dirty(parent)
+
+    def delete(self, key: int) -> None:
+        """Remove key from its leaf (pages are never merged)."""
+        leaf = self._find_leaf(key)[-1][0]
+        index = bisect_left(leaf.keys, key)
+        if index == len(leaf.keys) or leaf.keys[index] != key:
+            raise ValueError(f"{key} not in Tree")
+        del leaf.keys[index]
+        del leaf.items[index]
+        self.length -= 1
+        self._mark_dirty(leaf)
+
+    def iter_range(
+        self, low: Optional[int] = None, high: Optional[int] = None
+    ) -> Iterator[tuple[int, int]]:
+        """Yield (key, value) pairs with low <= key <= high in order.
+
+        Missing bounds are unlimited.
+        """
+        if low is None:
+            leaf, index = self._get_page(self.first_leaf), 0
+        else:
+            leaf = self._find_leaf(low)[-1][0]
+            index = bisect_left(leaf.keys, low)
+
+        while True:
+            for position in range(index, len(leaf.keys)):
+                key = leaf.keys[position]
+                if high is not None and key > high:
+                    return
+                yield key, leaf.items[position]
+            if leaf.next_leaf == NO_PAGE:
+                return
+            leaf, index = self._get_page(leaf.next_leaf), 0
+
+    def bulk_load(self, items: Iterable[tuple[int, int]]) -> None:
+        """Build the tree bottom up from (key, value) pairs sorted by key.
+
+        Leaves are filled completely and written one after another, then every
+        level of internal pages is built from the first keys of its children.
+        """
+        if self.page_count > 2:
+            raise ValueError("Only a new tree can be bulk loaded")
+
+        leaf = self._get_page(self.root)
+        # (page number, smallest key) of pages of the level being built
+        level = [(leaf.number, None)]
+        previous_key = None
+        for key, value in items:
+            if previous_key is not None and key <= previous_key:
+                raise ValueError(
+                    f"Keys aren't sorted and unique: {key} after {previous_key}"
+                )
+            previous_key = key
+            if len(leaf.keys) == self.fanout:
+                sibling = self._allocate(leaf=True)
+                # mark after the change, allocating may evict the leaf
+                leaf.next_leaf = sibling.number
+                self._mark_dirty(leaf)
+                leaf = sibling
+                level.append((leaf.number, key))
+            leaf.keys.append(key)
+            leaf.items.append(value)
+            self.length += 1
+        self._mark_dirty(leaf)
+
+        while len(level) > 1:
+            groups = -(-len(level) // (self.fanout + 1))
+            size, extra = divmod(len(level), groups)
+            parents = []
+            start = 0
+            for group in range(groups):
+                end = start + size + (group < extra)
+                children = level[start:end]
+                page = self._allocate(leaf=False)
+                page.keys = [key for _, key in children[1:]]
+                page.items = [number for number, _ in children]
+                self._mark_dirty(page)
+                parents.append((page.number, children[0][1]))
+                start = end
+            level = parents
+        self.root = level[0][0]
+
+    def flush(self) -> None:
+        """Write cached changes and the header to the file."""
+        for page in self.cache.values():
+            if page.dirty:
+                self._write_page(page)
+        self._write_header()
+        self.mmap.flush()
+
+    def close(self) -> None:
+        if self.mmap.closed:
+            return
+        self.flush()
+        self.cache.clear()
+        self.mmap.close()
+        self.file.close()
+
+    def _find_leaf(self, key: int) -> list[tuple[Page, int]]:
+        """Return the path of (page, index of the next child) to key's leaf."""
+        path = []
+        page = self._get_page(self.root)
+        while not page.leaf:
+            index = bisect_right(page.keys, key)
+            path.append((page, index))
+            page = self._get_page(page.items[index])
+        path.append((page, NO_PAGE))
+        return path
+
+    def _split(self, page: Page) -> tuple[int, Page]:
+        """Move the upper half of a page to a new page.
+
+        Return the separator key for the parent and the new page.
+        """
+        # shrink the page before allocating, allocating may evict and write it
+        # and an overflowing page doesn't fit its place in the file
+        middle = len(page.keys) // 2
+        if page.leaf:
+            keys, page.keys = page.keys[middle:], page.keys[:middle]
+            items, page.items = page.items[middle:], page.items[:middle]
+            separator = keys[0]
+        else:
+            separator = page.keys[middle]
+            keys, page.keys = page.keys[middle + 1 :], page.keys[:middle]
+            items, page.items = page.items[middle + 1 :], page.items[: middle + 1]
+        sibling = self._allocate(page.leaf)
+        sibling.keys, sibling.items = keys, items
+        if page.leaf:
+            sibling.next_leaf, page.next_leaf = page.next_leaf, sibling.number
+        self._mark_dirty(page)
+        self._mark_dirty(sibling)
+        return separator, sibling
+
+    def _get_page(self, number: int) -> Page:
+        page = self.cache.get(number)
+        if page is not None:
+            self.cache.move_to_end(number)
+            return page
+
+        offset = number * self.page_size
+        leaf, count, next_leaf = PAGE_HEADER.unpack_from(self.mmap, offset)
+        offset += PAGE_HEADER.size
+        keys = list(struct.unpack_from(f"<{count}q", self.mmap, offset))
+        item_count = count if leaf else count + 1
+        items = list(
+            struct.unpack_from(f"<{item_count}q", self.mmap, offset + 8 * self.fanout)
+        )
+        page = Page(number, leaf, keys, items, next_leaf)
+        self._cache(page)
+        return page
+
+    def _mark_dirty(self, page: Page) -> None:
+        page.dirty = True
+        self._cache(page)
+
+    def _cache(self, page: Page) -> None:
+        self.cache[page.number] = page
+        self.cache.move_to_end(page.number)
+        while len(self.cache) > self.cache_size:
+            _, evicted = self.cache.popitem(last=False)
+            if evicted.dirty:
+                self._write_page(evicted)
+
+    def _write_page(self, page: Page) -> None:
+        offset = page.number * self.page_size
+        PAGE_HEADER.pack_into(
+            self.mmap, offset, page.leaf, len(page.keys), page.next_leaf
+        )
+        offset += PAGE_HEADER.size
+        struct.pack_into(f"<{len(page.keys)}q", self.mmap, offset, *page.keys)
+        struct.pack_into(
+            f"<{len(page.items)}q", self.mmap, offset + 8 * self.fanout, *page.items
+        )
+        page.dirty = False
+
+    def _allocate(self, leaf: bool) -> Page:
+        """Return a new empty page, growing the file when it's full."""
+        number = self.page_count
+        self.page_count += 1
+        size = self.page_count * self.page_size
+        if size > len(self.mmap):
+            # grow by doubling, pages are decoded objects so nothing points
+            # into the old mapping
+            self.mmap.close()
+            self.file.truncate(max(size, 2 * self.file.seek(0, os.SEEK_END)))
+            self.mmap = mmap.mmap(self.file.fileno(), 0)
+        page = Page(number, leaf, [], [] if leaf else [NO_PAGE])
+        self._mark_dirty(page)
+        return page
+
+    def _read_header(self) -> None:
+        (
+            magic,
+            page_size,
+            fanout,
+            root,
+            first_leaf,
+            page_count,
+            length,
+        ) = FILE_HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC:
+            self.mmap.close()
+            self.file.close()
+            raise ValueError(f"{self.file.name} is not a B+tree file")
+        self.page_size = page_size
+        self.fanout = fanout
+        self.root = root
+        self.first_leaf = first_leaf
+        self.page_count = page_count
+        self.length = length
+
+    def _write_header(self) -> None:
+        FILE_HEADER.pack_into(
+            self.mmap,
+            0,
+            MAGIC,
+            self.page_size,
+            self.fanout,
+            self.root,
+            self.first_leaf,
+            self.page_count,
+            self.length,
+        )
@@ -0,0 +1,267 @@
+from array import array
+from collections import deque
+from typing import Iterable, Iterator
+
+# index of a missing child
+NIL = -1
+
+
+class CompactAVLTree:
+    """AVL tree stored in parallel arrays instead of node objects.
+
+    Node i is made of `values[i]`, `left[i]`, `right[i]` and `heights[i]`,
+    children are indices into the same arrays (NIL when missing). A node costs
+    20 bytes with the default 'q' values, instead of a Python object per node.
+    Slots of deleted nodes are chained through `left` into a free list and
+    reused by following inserts.
+
+    The API follows AVLTreeNode and BinarySearchTreeNode: insert, delete
+    (ValueError for a missing value), depth first search and traversals.
+    Equal values go to the left subtree.
+    """
+
+    def __init__(
+        self, values: Iterable[int] = (), threshold: int = 1, typecode: str = "q"
+    ) -> None:
+        self.values = array(typecode)
+        self.left = array("i")
+        self.right = array("i")
+        self.heights = array("i")
+        self.threshold = threshold
+        self.root = NIL
+        self.free = NIL
+        self.length = 0
+        for value in values:
+            self.insert(value)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, value: int) -> bool:
+        return self.search(value) != NIL
+
+    @property
+    def nbytes(self) -> int:
+        """Return bytes taken by the node arrays."""
+        return sum(
+            buffer.itemsize * len(buffer)
+            for buffer in (self.values, self.left, self.right, self.heights)
+        )
+
+    @property
+    def height(self) -> int:
+        return self.get_height(self.root)
+
+    def get_height(self, node: int) -> int:
+        """Return height of a subtree if it exists."""
+        if node == NIL:
+            return 0
+        return self.heights[node]
+
+    def get_balance(self, node: int) -> int:
+        """Return the balance of a node's subtrees (positives - left heavy)."""
+        return self.get_height(self.left[node]) - self.get_height(self.right[node])
+
+    def search(self, value: int) -> int:
+        """Return index of the node holding value or NIL."""
+        values, left, right = self.values, self.left, self.right
+        node = self.root
+        while node != NIL:
+            current = values[node]
+            if value == current:
+                return node
+            node = left[node] if value < current else right[node]
+        return NIL
+
+    def depth_first_search(self, value: int) -> tuple[bool, list]:
+        """Binary search returning whether value was found and the visited path."""
+        path = []
+        node = self.root
+        while node != NIL:
+            current = self.values[node]
+            path.append(current)
+            if value == current:
+                return True, path
+            node = self.left[node] if value < current else self.right[node]
+        return False, path
+
+    def insert(self, value: int) -> None:
+        path = []
+        node = self.root
+        while node != NIL:
+            path.append(node)
+            node = self.left[node] if value <= self.values[node] else self.right[node]
+
+        child = self._allocate(value)
+        if not path:
+            self.root = child
+        elif value <= self.values[path[-1]]:
+            self.left[path[-1]] = child
+        else:
+            self.right[path[-1]] = child
+        self.length += 1
+        self._rebalance_path(path)
+
+    def delete(self, value: int) -> None:
+        path = []
+        node = self.root
+        while node != NIL and self.values[node] != value:
+            path.append(node)
+            node = self.left[node] if value < self.values[node] else self.right[node]
+        if node == NIL:
+            raise ValueError(f"{value} not in Tree")
+
+        if self.left[node] != NIL and self.right[node] != NIL:
+            # move the smallest value of the right subtree here and delete its
+            # node instead
+            path.append(node)
+            successor = self.right[node]
+            while self.left[successor] != NIL:
+                path.append(successor)
+                successor = self.left[successor]
+            self.values[node] = self.values[successor]
+            node = successor
+
+        child = self.left[node] if self.left[node] != NIL else self.right[node]
+        self._replace_child(path[-1] if path else NIL, node, child)
+        self._release(node)
+        self.length -= 1
+        self._rebalance_path(path)
+
+    def iter_inorder(self) -> Iterator[int]:
+        stack = []
+        node = self.root
+        while stack or node != NIL:
+            while node != NIL:
+                stack.append(node)
+                node = self.left[node]
+            node = stack.pop()
+            yield self.values[node]
+            node = self.right[node]
+
+    def iter_preorder(self) -> Iterator[int]:
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            node = stack.pop()
+            yield self.values[node]
+            if self.right[node] != NIL:
+                stack.append(self.right[node])
+            if self.left[node] != NIL:
+                stack.append(self.left[node])
+
+    def iter_postorder(self) -> Iterator[int]:
+        stack = []
+        previous = NIL
+        node = self.root
+        while stack or node != NIL:
+            while node != NIL:
+                stack.append(node)
+                node = self.left[node]
+            node = stack[-1]
+            right = self.right[node]
+            if right != NIL and right != previous:
+                node = right
+                continue
+            stack.pop()
+            yield self.values[node]
+            previous = node
+            node = NIL
+
+    def iter_level_order(self) -> Iterator[int]:
+        queue = deque([self.root] if self.root != NIL else [])
+        while queue:
+            node = queue.popleft()
+            yield self.values[node]
+            if self.left[node] != NIL:
+                queue.append(self.left[node])
+            if self.right[node] != NIL:
+                queue.append(self.right[node])
+
+    def get_inorder(self) -> list:
+        return list(self.iter_inorder())
+
+    def get_preorder(self) -> list:
+        return list(self.iter_preorder())
+
+    def get_postorder(self) -> list:
+        return list(self.iter_postorder())
+
+    def _allocate(self, value: int) -> int:
+        """Return index of a new leaf, reusing a free slot when there is one."""
+        if self.free == NIL:
+            self.values.append(value)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.heights.append(1)
+            return len(self.values) - 1
+
+        node = self.free
+        self.free = self.left[node]
+        self.values[node] = value
+        self.left[node] = self.right[node] = NIL
+        self.heights[node] = 1
+        return node
+
+    def _release(self, node: int) -> None:
+        self.left[node] = self.free
+        self.right[node] = NIL
+        self.free = node
+
+    def _replace_child(self, parent: int, child: int, new_child: int) -> None:
+        if parent == NIL:
+            self.root = new_child
+        elif self.left[parent] == child:
+            self.left[parent] = new_child
+        else:
+            self.right[parent] = new_child
+
+    def _rebalance_path(self, path: list[int]) -> None:
+        """Rebalance nodes of a changed path bottom up.
+
+        Stops early at the first node whose height didn't change and which
+        didn't need a rotation, its ancestors can't be affected.
+        """
+        for position in range(len(path) - 1, -1, -1):
+            node = path[position]
+            height = self.heights[node]
+            subtree = self._rebalance(node)
+            if subtree != node:
+                parent = path[position - 1] if position else NIL
+                self._replace_child(parent, node, subtree)
+            elif self.heights[node] == height:
+                return
+
+    def _update(self, node: int) -> None:
+        self.heights[node] = 1 + max(
+            self.get_height(self.left[node]), self.get_height(self.right[node])
+        )
+
+    def _rebalance(self, node: int) -> int:
+        """Update height of a node and rotate it if unbalanced."""
+        self._update(node)
+        balance = self.get_balance(node)
+        if balance > self.threshold:
+            if self.get_balance(self.left[node]) < 0:
+                self.left[node] = self._rotate_left(self.left[node])
+            return self._rotate_right(node)
+        if balance < -self.threshold:
+            if self.get_balance(self.right[node]) > 0:
+                self.right[node] = self._rotate_right(self.right[node])
+            return self._rotate_left(node)
+        return node
+
+    def _rotate_right(self, node: int) -> int:
+        child = self.left[node]
+        self.left[node] = self.right[child]
+        self.right[child] = node
+        self._update(node)
+        self._update(child)
+        return child
+
+    def _rotate_left(self, node: int) -> int:
+        child = self.right[node]
+        self.right[node] = self.left[child]
+        self.left[child] = node
+        self._update(node)
+        self._update(child)
+        return child
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import threading
+from typing import Iterable, Iterator, Optional
+
+
+class ConcurrentTreeNode:
+    __slots__ = ("value", "left", "right", "deleted", "lock")
+
+    def __init__(self, value) -> None:
+        self.value = value
+        self.left: Optional[ConcurrentTreeNode] = None
+        self.right: Optional[ConcurrentTreeNode] = None
+        self.deleted = False
+        self.lock = threading.Lock()
+
+
+class ConcurrentBinarySearchTree:
+    """Binary search tree of unique values safe to share between threads.
+
+    Writers descend with hand-over-hand locking: a node is locked before the
+    lock of its parent is released, so writers only block each other on the
+    same path and never the whole tree. Reads take no locks at all.
+
+    Values never move between nodes and an unlinked node keeps its children,
+    so a reader standing on a node which is being deleted still reaches every
+    value below it. Deleting a node with two children only marks it deleted
+    (a tombstone), writers passing by unlink tombstones once they have at most
+    one child.
+
+    Based on:
+    https://en.wikipedia.org/wiki/Lock_(computer_science)#Granularity
+    """
+
+    def __init__(self, values: Iterable = ()) -> None:
+        # the tree hangs on the right of a head node without value
+        self.head = ConcurrentTreeNode(None)
+        self.length = 0
+        self.length_lock = threading.Lock()
+        for value in values:
+            self.insert(value)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, value) -> bool:
+        node = self.head.right
+        while node is not None:
+            if value == node.value:
+                return not node.deleted
+            node = node.left if value < node.value else node.right
+        return False
+
+    def __iter__(self) -> Iterator:
+        return self.iter_inorder()
+
+    def insert(self, value) -> bool:
+        """Add value and return whether it wasn't in the tree yet."""
+        parent, node = self._locate(value)
+        try:
+            if node is not None:
+                if not node.deleted:
+                    return False
+                node.deleted = False
+            elif parent is self.head or value > parent.value:
+                parent.right = ConcurrentTreeNode(value)
+            else:
+                parent.left = ConcurrentTreeNode(value)
+        finally:
+            parent.lock.release()
+            if node is not None:
+                node.lock.release()
+        self._add_length(1)
+        return True
+
+    def delete(self, value) -> None:
+        parent, node = self._locate(value)
+        try:
+            if node is None or node.deleted:
+                raise ValueError(f"{value} not in Tree")
+            node.deleted = True
+            if node.left is None or node.right is None:
+                self._unlink(parent, node)
+        finally:
+            parent.lock.release()
+            if node is not None:
+                node.lock.release()
+        self._add_length(-1)
+
+    def iter_inorder(self) -> Iterator:
+        """Yield values in order without locking.
+
+        Values inserted or deleted during the iteration may or may not be
+        yielded.
+        """
+        stack = []
+        node = self.head.right
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            if not node.deleted:
+                yield node.value
+            node = node.right
+
+    def get_inorder(self) -> list:
+        return list(self.iter_inorder())
+
+    def _locate(self, value) -> tuple[ConcurrentTreeNode, Optional[ConcurrentTreeNode]]:
+        """Find value with lock coupling.
+
+        Return the locked parent and the locked node holding value, or the
+        locked parent a new node with value belongs to and None.
+        """
+        parent = self.head
+        parent.lock.acquire()
+        node = parent.right
+        while node is not None:
+            node.lock.acquire()
+            if value == node.value:
+                return parent, node
+            if node.deleted and (node.left is None or node.right is None):
+                # tombstone with at most one child, take it out of the way
+                child = self._unlink(parent, node)
+                node.lock.release()
+                node = child
+                continue
+            parent.lock.release()
+            parent = node
+            node = node.left if value < node.value else node.right
+        return parent, None
+
+    def _unlink(
+        self, parent: ConcurrentTreeNode, node: ConcurrentTreeNode
+    ) -> Optional[ConcurrentTreeNode]:
+        """Replace a node with at most one child by the child (both locked)."""
+        child = node.left if node.left is not None else node.right
+        if parent.right is node:
+            parent.right = child
+        else:
+            parent.left = child
+        return child
+
+    def _add_length(self, change: int) -> None:
+        with self.length_lock:
+            self.length += change
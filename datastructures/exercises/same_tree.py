@@ -1,23 +1,84 @@
 """
 Task: https://leetcode.com/problems/same-tree/
 """
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+
+from .. import merkle
 
 
 # Definition for a binary tree node.
 class TreeNode:
+    """Binary tree node caching a Merkle hash of its subtree.
+
+    Setting `val`, `left` or `right` clears cached hashes up to the roots
+    through parent pointers. A node shared by several trees knows all of its
+    parents, so changes to it clear the hashes of every tree.
+    """
+
     def __init__(self, val=0, left=None, right=None):
-        self.val = val
+        self.parent = None
+        # every parent when the node is in several trees (see merkle.link)
+        self._parents = None
+        self._hash = None
+        self._val = val
+        self._left = None
+        self._right = None
         self.left = left
         self.right = right
 
+    @property
+    def val(self):
+        return self._val
+
+    @val.setter
+    def val(self, val) -> None:
+        self._val = val
+        merkle.invalidate(self)
+
+    @property
+    def left(self) -> Optional["TreeNode"]:
+        return self._left
+
+    @left.setter
+    def left(self, node: Optional["TreeNode"]) -> None:
+        self._adopt(self._left, node)
+        self._left = node
+
+    @property
+    def right(self) -> Optional["TreeNode"]:
+        return self._right
+
+    @right.setter
+    def right(self, node: Optional["TreeNode"]) -> None:
+        self._adopt(self._right, node)
+        self._right = node
+
+    def _adopt(self, previous: Optional["TreeNode"], node: Optional["TreeNode"]):
+        if previous is node:
+            return
+        if previous is not None:
+            merkle.unlink(self, previous)
+        if node is not None:
+            merkle.link(self, node)
+        merkle.invalidate(self)
+
+    @property
+    def hash(self) -> bytes:
+        return merkle.subtree_hash(self, lambda node: node._val)
+
 
 class Solution:
     @staticmethod
     def is_same_tree(p: Optional[TreeNode], q: Optional[TreeNode]) -> bool:
+        # different exact hashes prove the trees differ, the rest is verified
+        if p is not None and q is not None and merkle.differ(p.hash, q.hash):
+            return False
+
         stack = [(p, q)]
         while stack:
             p, q = stack.pop()
+            if p is q:
+                continue
             if p and q and p.val == q.val:
                 stack.extend(
                     [
@@ -28,3 +89,86 @@ class Solution:
             elif p or q:
                 return False
         return True
+
+    @staticmethod
+    def diff_trees(
+        p: Optional[TreeNode], q: Optional[TreeNode]
+    ) -> Iterator[tuple[str, tuple[str, ...], Optional[TreeNode], Optional[TreeNode]]]:
+        """Yield (kind, path, old node, new node) of differences from p to q.
+
+        Kind is "added" or "removed" for a whole subtree missing in p or q and
+        "changed" for a node with another value, whose children are compared
+        further. Path is a tuple of "left"/"right" steps from the root.
+        Subtrees which are the same object or have equal cached exact hashes
+        are skipped, so with cached hashes the cost follows the size of the
+        change. Subtrees with values without exact encodings (see
+        merkle.encode) are always walked, their equal hashes don't prove the
+        values are equal.
+        """
+        stack = [((), p, q)]
+        while stack:
+            path, p, q = stack.pop()
+            if p is q:
+                continue
+            if p is None:
+                yield "added", path, None, q
+            elif q is None:
+                yield "removed", path, p, None
+            elif p._hash is None or p._hash != q._hash or not merkle.is_exact(p._hash):
+                if p.val != q.val:
+                    yield "changed", path, p, q
+                stack.append((path + ("right",), p.right, q.right))
+                stack.append((path + ("left",), p.left, q.left))
+
+    @staticmethod
+    def group_same_trees(trees: Iterable[Optional[TreeNode]]) -> list[list[int]]:
+        """Return indices of trees grouped into classes of same trees.
+
+        Every distinct subtree gets one id in a hash-consing table (keyed by
+        value and ids of children), so identical subtrees are compared once
+        and trees are the same exactly when their ids are equal.
+        """
+        interner = TreeInterner()
+        groups = {}
+        for index, tree in enumerate(trees):
+            groups.setdefault(interner.intern(tree), []).append(index)
+        return list(groups.values())
+
+
+class TreeInterner:
+    """Hash-consing table giving identical subtrees the same id."""
+
+    def __init__(self) -> None:
+        # (value, left id, right id) -> id, 0 is the id of an empty tree
+        self.ids = {}
+
+    def __len__(self) -> int:
+        """Return number of distinct subtrees seen."""
+        return len(self.ids)
+
+    def intern(self, root: Optional[TreeNode]) -> int:
+        """Return id of a tree, adding its new subtrees to the table."""
+        # ids of nodes of this tree, so shared nodes are interned once
+        node_ids = {}
+        stack = [root] if root is not None else []
+        while stack:
+            node = stack[-1]
+            if id(node) in node_ids:
+                stack.pop()
+                continue
+            children = [
+                child
+                for child in (node.left, node.right)
+                if child is not None and id(child) not in node_ids
+            ]
+            if children:
+                stack.extend(children)
+                continue
+            key = (
+                node.val,
+                0 if node.left is None else node_ids[id(node.left)],
+                0 if node.right is None else node_ids[id(node.right)],
+            )
+            node_ids[id(node)] = self.ids.setdefault(key, len(self.ids) + 1)
+            stack.pop()
+        return node_ids[id(root)] if root is not None else 0
@@ -1,6 +1,25 @@
+from decimal import Decimal
+from fractions import Fraction
 from unittest import TestCase
 
-from ..same_tree import Solution, TreeNode
+from ..same_tree import Solution, TreeInterner, TreeNode
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional
+    numpy = None
+
+
+class Point:
+    """Value equal to other points with the same coordinates."""
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x, self.y = x, y
+
+    def __eq__(self, other) -> bool:
+        return (self.x, self.y) == (other.x, other.y)
+
+    __hash__ = None
 
 
 class SameTreeTestCases(TestCase):
@@ -24,3 +43,158 @@ class SameTreeTestCases(TestCase):
         result = self.solution.is_same_tree(p, q)
 
         self.assertEqual(expected_result, result)
+
+    def test_different_values(self):
+        p = TreeNode(1, left=TreeNode(2), right=TreeNode(3))
+        q = TreeNode(1, left=TreeNode(2), right=TreeNode(4))
+
+        self.assertFalse(self.solution.is_same_tree(p, q))
+        self.assertTrue(self.solution.is_same_tree(None, None))
+        self.assertFalse(self.solution.is_same_tree(p, None))
+
+    def test_hash_is_invalidated_on_changes(self):
+        leaf = TreeNode(3)
+        p = TreeNode(1, left=TreeNode(2), right=TreeNode(5, left=leaf))
+        q = TreeNode(1, left=TreeNode(2), right=TreeNode(5, left=TreeNode(3)))
+        self.assertEqual(p.hash, q.hash)
+
+        leaf.val = 4
+        self.assertNotEqual(p.hash, q.hash)
+        self.assertFalse(self.solution.is_same_tree(p, q))
+
+        q.right.left = TreeNode(4)
+        self.assertEqual(p.hash, q.hash)
+        self.assertTrue(self.solution.is_same_tree(p, q))
+
+        p.right.right = TreeNode(6)
+        self.assertFalse(self.solution.is_same_tree(p, q))
+
+    def test_hash_of_shared_node_is_invalidated_in_every_tree(self):
+        shared = TreeNode(5)
+        p = TreeNode(1, left=shared)
+        q = TreeNode(2, left=shared, right=shared)
+        p.hash, q.hash
+
+        shared.val = 6
+
+        self.assertTrue(self.solution.is_same_tree(p, TreeNode(1, TreeNode(6))))
+        self.assertTrue(
+            self.solution.is_same_tree(q, TreeNode(2, TreeNode(6), TreeNode(6)))
+        )
+        q.left = None
+        shared.val = 7
+        self.assertTrue(self.solution.is_same_tree(q, TreeNode(2, None, TreeNode(7))))
+
+    def test_equal_values_of_different_types(self):
+        p = TreeNode(1, left=TreeNode(2))
+        q = TreeNode(1.0, left=TreeNode(2.0))
+
+        self.assertTrue(self.solution.is_same_tree(p, q))
+
+    def test_equal_values_without_exact_encoding(self):
+        pairs = [
+            (1, Decimal(1)),
+            (0.5, Fraction(1, 2)),
+            (1, 1 + 0j),
+            (Point(1, 2), Point(1, 2)),
+            ((1, Decimal(2)), (1.0, Decimal("2.0"))),
+        ]
+        if numpy is not None:
+            pairs.append((5, numpy.int64(5)))
+        for first, second in pairs:
+            with self.subTest(values=(first, second)):
+                p = TreeNode(0, left=TreeNode(first))
+                q = TreeNode(0, left=TreeNode(second))
+                p.hash, q.hash
+
+                self.assertTrue(self.solution.is_same_tree(p, q))
+
+    def test_group_same_trees(self):
+        shared = TreeNode(2, left=TreeNode(4))
+        trees = [
+            TreeNode(1, left=TreeNode(2, left=TreeNode(4))),
+            TreeNode(1, right=TreeNode(2)),
+            TreeNode(1, left=shared),
+            None,
+            TreeNode(1, right=TreeNode(2)),
+            TreeNode(3, left=shared, right=shared),
+            None,
+        ]
+
+        result = self.solution.group_same_trees(trees)
+
+        self.assertEqual([[0, 2], [1, 4], [3, 6], [5]], sorted(result))
+
+    def test_diff_trees(self):
+        p = TreeNode(1, left=TreeNode(2, right=TreeNode(4)), right=TreeNode(3))
+        q = TreeNode(1, left=TreeNode(5, left=TreeNode(6)), right=TreeNode(3))
+
+        result = [
+            (kind, path, old and old.val, new and new.val)
+            for kind, path, old, new in self.solution.diff_trees(p, q)
+        ]
+
+        self.assertEqual(
+            [
+                ("changed", ("left",), 2, 5),
+                ("added", ("left", "left"), None, 6),
+                ("removed", ("left", "right"), 4, None),
+            ],
+            result,
+        )
+
+    def test_diff_of_same_trees_is_empty(self):
+        p = TreeNode(1, left=TreeNode(2), right=TreeNode(3))
+        q = TreeNode(1, left=TreeNode(2), right=TreeNode(3))
+
+        self.assertEqual([], list(self.solution.diff_trees(p, q)))
+        self.assertEqual([], list(self.solution.diff_trees(None, None)))
+        self.assertEqual(
+            [("added", (), None, q)], list(self.solution.diff_trees(None, q))
+        )
+
+    def test_diff_of_values_with_equal_python_hashes(self):
+        p = TreeNode(1, left=TreeNode(-1))
+        q = TreeNode(1, left=TreeNode(-2))
+        p.hash, q.hash
+
+        result = list(self.solution.diff_trees(p, q))
+
+        self.assertEqual([("changed", ("left",), p.left, q.left)], result)
+
+    def test_diff_of_values_without_exact_encoding(self):
+        values = [1, 2]
+        p = TreeNode(1, left=TreeNode(values))
+        q = TreeNode(1, left=TreeNode([1, 2]))
+        p.hash, q.hash
+        # changed in place, the cached hash isn't cleared
+        values.append(3)
+
+        result = list(self.solution.diff_trees(p, q))
+
+        self.assertEqual([("changed", ("left",), p.left, q.left)], result)
+
+    def test_diff_skips_subtrees_with_equal_hashes(self):
+        p = TreeNode(1, left=TreeNode(2, left=TreeNode(4)), right=TreeNode(3))
+        q = TreeNode(1, left=TreeNode(2, left=TreeNode(4)), right=TreeNode(5))
+        p.hash, q.hash
+        # change the value behind the cache's back, a walk would notice it
+        p.left.left._val = 7
+
+        result = list(self.solution.diff_trees(p, q))
+
+        self.assertEqual([("changed", ("right",), p.right, q.right)], result)
+
+
+class TreeInternerTestCase(TestCase):
+    def test_identical_subtrees_share_ids(self):
+        interner = TreeInterner()
+
+        first = interner.intern(TreeNode(1, left=TreeNode(2), right=TreeNode(2)))
+        second = interner.intern(TreeNode(1, left=TreeNode(2), right=TreeNode(2)))
+        third = interner.intern(TreeNode(2))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, third)
+        # the leaf 2 and the root
+        self.assertEqual(2, len(interner))
@@ -0,0 +1,174 @@
+"""
+Merkle hashes of binary trees.
+
+A node's hash covers its value and the hashes of its children, so equal
+subtrees have equal hashes. Values with an exact encoding (see `encode`) make
+the hash exact: exact hashes differ for different subtrees up to collisions of
+blake2b. Other values are hashed by their type and repr, which may differ for
+equal values, so only different exact hashes prove subtrees differ.
+
+Nodes cache their hash in `_hash` and clear it along the paths to the roots of
+every tree they are in when they change, `link` and `unlink` keep track of
+their parents in `parent` and `_parents`.
+"""
+import struct
+from hashlib import blake2b
+from typing import Callable, Iterable, Optional
+
+DIGEST_SIZE = 16
+# the first byte of a hash tells whether all values of the subtree have an
+# exact encoding
+EXACT, INEXACT = b"\x01", b"\x00"
+EMPTY_HASH = EXACT + bytes(DIGEST_SIZE)
+
+
+def combine(value, left: bytes, right: bytes) -> bytes:
+    """Return hash of a node from its value and hashes of its children."""
+    encoded = encode(value)
+    exact = encoded is not None and is_exact(left) and is_exact(right)
+    if encoded is None:
+        cls = type(value)
+        encoded = f"{cls.__module__}.{cls.__qualname__}:{value!r}".encode(
+            "utf-8", "surrogatepass"
+        )
+    digest = blake2b(left, digest_size=DIGEST_SIZE)
+    digest.update(right)
+    digest.update(encoded)
+    return (EXACT if exact else INEXACT) + digest.digest()
+
+
+def is_exact(digest: bytes) -> bool:
+    """Return whether a hash covers exactly encoded values only."""
+    return digest[:1] == EXACT
+
+
+def differ(first: bytes, second: bytes) -> bool:
+    """Return whether two hashes prove their subtrees differ."""
+    return first != second and is_exact(first) and is_exact(second)
+
+
+def encode(value) -> Optional[bytes]:
+    """Return bytes identifying a value exactly or None if there aren't any.
+
+    Values of the built in types int, bool, float, str, bytes, None and tuples
+    of them are encoded, equal ones (like True, 1 and 1.0) equally. Values of
+    other types, subclasses included, can equal values of any type, and NaN
+    doesn't equal itself, so they get None.
+    """
+    cls = type(value)
+    if cls is float:
+        if value != value:
+            return None
+        if value.is_integer():
+            value, cls = int(value), int
+    if cls is int or cls is bool:
+        size = value.bit_length() // 8 + 1
+        return b"i" + value.to_bytes(size, "little", signed=True)
+    if cls is float:
+        return b"f" + struct.pack("<d", value)
+    if cls is str:
+        return b"s" + value.encode("utf-8", "surrogatepass")
+    if cls is bytes:
+        return b"b" + value
+    if value is None:
+        return b"n"
+    if cls is tuple:
+        return _encode_tuple(value)
+    return None
+
+
+def _encode_tuple(values: tuple) -> Optional[bytes]:
+    parts = [b"t"]
+    for value in values:
+        item = encode(value)
+        if item is None:
+            return None
+        parts.append(len(item).to_bytes(8, "little") + item)
+    return b"".join(parts)
+
+
+def subtree_hash(root, value: Callable) -> bytes:
+    """Return hash of a subtree, computing missing hashes of its nodes.
+
+    Nodes are visited bottom up from an explicit stack, subtrees which already
+    have a cached hash are not entered.
+    """
+    if root is None:
+        return EMPTY_HASH
+    stack = [root]
+    while stack:
+        node = stack[-1]
+        if node._hash is not None:
+            stack.pop()
+            continue
+        left, right = node.left, node.right
+        missing = [
+            child
+            for child in (left, right)
+            if child is not None and child._hash is None
+        ]
+        if missing:
+            stack.extend(missing)
+            continue
+        node._hash = combine(
+            value(node),
+            EMPTY_HASH if left is None else left._hash,
+            EMPTY_HASH if right is None else right._hash,
+        )
+        stack.pop()
+    return root._hash
+
+
+def link(parent, child) -> None:
+    """Record that parent links to child.
+
+    A node linked from one parent keeps it in `parent` only. More links (from
+    other trees sharing the node or from both children of a parent) are
+    counted in a `_parents` dict created on demand, `parent` is then the last
+    parent linked.
+    """
+    parents = child._parents
+    if parents is None:
+        if child.parent is None:
+            child.parent = parent
+            return
+        parents = child._parents = {child.parent: 1}
+    parents[parent] = parents.get(parent, 0) + 1
+    child.parent = parent
+
+
+def unlink(parent, child) -> None:
+    """Record that parent no longer links to child (once)."""
+    parents = child._parents
+    if parents is None:
+        if child.parent is parent:
+            child.parent = None
+        return
+    count = parents.pop(parent, 0) - 1
+    if count > 0:
+        parents[parent] = count
+    elif child.parent is parent:
+        child.parent = next(reversed(parents), None)
+
+
+def parents_of(node) -> Iterable:
+    """Return every parent linking to a node."""
+    if node._parents is not None:
+        return node._parents
+    return (node.parent,)
+
+
+def invalidate(node) -> None:
+    """Clear cached hashes of a node and its ancestors in every tree.
+
+    A cached hash of a node implies cached hashes of its whole subtree, so the
+    walk stops at nodes without one.
+    """
+    if node is None or node._hash is None:
+        return
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node is not None and node._hash is not None:
+            node._hash = None
+            stack.extend(parents_of(node))
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional
+
+from .trees import inorder_nodes
+
+
+class PersistentAVLNode:
+    """Node of an AVL tree that is never changed after it's created.
+
+    Updates copy only the nodes on the path from the root to the changed node
+    (O(log n) new nodes) and return a new root sharing every other subtree with
+    the old one. Old roots stay valid snapshots and can be read from other
+    threads without any locking.
+
+    Based on:
+    https://en.wikipedia.org/wiki/Persistent_data_structure#Trees
+    """
+
+    __slots__ = ("value", "data", "left", "right", "height")
+
+    def __init__(
+        self,
+        value: int,
+        data=None,
+        left: Optional[PersistentAVLNode] = None,
+        right: Optional[PersistentAVLNode] = None,
+    ) -> None:
+        self.value = value
+        self.data = data
+        self.left = left
+        self.right = right
+        self.height = 1 + max(self.get_height(left), self.get_height(right))
+
+    @staticmethod
+    def get_height(node: Optional[PersistentAVLNode]) -> int:
+        """Return height of a subtree if it exists."""
+        if not node:
+            return 0
+        return node.height
+
+    @classmethod
+    def get_balance(cls, node: PersistentAVLNode) -> int:
+        """Return the balance of a node's subtrees (positives - left heavy)."""
+        return cls.get_height(node.left) - cls.get_height(node.right)
+
+    @classmethod
+    def insert(
+        cls,
+        node: Optional[PersistentAVLNode],
+        value: int,
+        data=None,
+        threshold: int = 1,
+    ) -> PersistentAVLNode:
+        """Return a new root with value set to data."""
+        if not node:
+            return cls(value, data)
+        if value == node.value:
+            return cls(value, data, node.left, node.right)
+        if value < node.value:
+            left = cls.insert(node.left, value, data, threshold)
+            return cls.balance(node.value, node.data, left, node.right, threshold)
+        right = cls.insert(node.right, value, data, threshold)
+        return cls.balance(node.value, node.data, node.left, right, threshold)
+
+    @classmethod
+    def delete(
+        cls, node: Optional[PersistentAVLNode], value: int, threshold: int = 1
+    ) -> Optional[PersistentAVLNode]:
+        """Return a new root without value."""
+        if not node:
+            raise ValueError(f"{value} not in Tree")
+        if value < node.value:
+            left = cls.delete(node.left, value, threshold)
+            return cls.balance(node.value, node.data, left, node.right, threshold)
+        if value > node.value:
+            right = cls.delete(node.right, value, threshold)
+            return cls.balance(node.value, node.data, node.left, right, threshold)
+
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        successor = node.right.find_minimum()
+        right = cls.delete_minimum(node.right, threshold)
+        return cls.balance(successor.value, successor.data, node.left, right, threshold)
+
+    @classmethod
+    def delete_minimum(
+        cls, node: PersistentAVLNode, threshold: int = 1
+    ) -> Optional[PersistentAVLNode]:
+        if node.left is None:
+            return node.right
+        left = cls.delete_minimum(node.left, threshold)
+        return cls.balance(node.value, node.data, left, node.right, threshold)
+
+    @classmethod
+    def balance(
+        cls,
+        value: int,
+        data,
+        left: Optional[PersistentAVLNode],
+        right: Optional[PersistentAVLNode],
+        threshold: int = 1,
+    ) -> PersistentAVLNode:
+        """Return a new node of the given fields, rotated if unbalanced."""
+        difference = cls.get_height(left) - cls.get_height(right)
+        if difference > threshold:
+            # left heavy, rotate the left child first when it's right heavy
+            if cls.get_balance(left) < 0:
+                left = cls.rotate_left(left)
+            return cls.rotate_right(cls(value, data, left, right))
+        if difference < -threshold:
+            if cls.get_balance(right) > 0:
+                right = cls.rotate_right(right)
+            return cls.rotate_left(cls(value, data, left, right))
+        return cls(value, data, left, right)
+
+    @classmethod
+    def rotate_right(cls, node: PersistentAVLNode) -> PersistentAVLNode:
+        """Return a rotated copy of a subtree."""
+        child = node.left
+        return cls(
+            child.value,
+            child.data,
+            child.left,
+            cls(node.value, node.data, child.right, node.right),
+        )
+
+    @classmethod
+    def rotate_left(cls, node: PersistentAVLNode) -> PersistentAVLNode:
+        """Return a rotated copy of a subtree."""
+        child = node.right
+        return cls(
+            child.value,
+            child.data,
+            cls(node.value, node.data, node.left, child.left),
+            child.right,
+        )
+
+    def search(self, value: int) -> Optional[PersistentAVLNode]:
+        """Return the node holding value or None."""
+        node = self
+        while node is not None:
+            if value == node.value:
+                return node
+            node = node.left if value < node.value else node.right
+        return None
+
+    def find_minimum(self) -> PersistentAVLNode:
+        node = self
+        while node.left is not None:
+            node = node.left
+        return node
+
+    def find_maximum(self) -> PersistentAVLNode:
+        node = self
+        while node.right is not None:
+            node = node.right
+        return node
+
+    def _inorder_nodes(self) -> Iterator[PersistentAVLNode]:
+        return inorder_nodes(self)
+
+
+class PersistentAVLTree:
+    """Immutable ordered map, every update returns a new tree.
+
+    A tree is a snapshot: it never changes, so readers can keep using and
+    iterating it while writers publish new versions, e.g. by swapping a
+    shared reference to the latest tree.
+    """
+
+    __slots__ = ("root", "length", "threshold")
+
+    node_class = PersistentAVLNode
+
+    def __init__(
+        self,
+        items: Iterable = (),
+        threshold: int = 1,
+        root: Optional[PersistentAVLNode] = None,
+        length: int = 0,
+    ) -> None:
+        if threshold < 1:
+            raise ValueError(f"Threshold has to be at least 1, not {threshold}")
+        self.threshold = threshold
+        for key, value in items:
+            if root is None or root.search(key) is None:
+                length += 1
+            root = self.node_class.insert(root, key, value, threshold)
+        self.root = root
+        self.length = length
+
+    def set(self, key, value) -> PersistentAVLTree:
+        """Return a new tree with key set to value."""
+        length = self.length if key in self else self.length + 1
+        root = self.node_class.insert(self.root, key, value, self.threshold)
+        return self.__class__(threshold=self.threshold, root=root, length=length)
+
+    def remove(self, key) -> PersistentAVLTree:
+        """Return a new tree without key."""
+        if key not in self:
+            raise KeyError(key)
+        root = self.node_class.delete(self.root, key, self.threshold)
+        length = self.length - 1
+        return self.__class__(threshold=self.threshold, root=root, length=length)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, key) -> bool:
+        return self._search(key) is not None
+
+    def __getitem__(self, key):
+        node = self._search(key)
+        if node is None:
+            raise KeyError(key)
+        return node.data
+
+    def get(self, key, default=None):
+        node = self._search(key)
+        return default if node is None else node.data
+
+    def __iter__(self) -> Iterator:
+        for node in self._nodes():
+            yield node.value
+
+    def items(self) -> Iterator[tuple]:
+        for node in self._nodes():
+            yield node.value, node.data
+
+    def minimum(self):
+        """Return the smallest key."""
+        if self.root is None:
+            raise ValueError("Tree is empty")
+        return self.root.find_minimum().value
+
+    def maximum(self):
+        """Return the biggest key."""
+        if self.root is None:
+            raise ValueError("Tree is empty")
+        return self.root.find_maximum().value
+
+    @property
+    def height(self) -> int:
+        return self.node_class.get_height(self.root)
+
+    def _search(self, key) -> Optional[PersistentAVLNode]:
+        if self.root is None:
+            return None
+        return self.root.search(key)
+
+    def _nodes(self) -> Iterator[PersistentAVLNode]:
+        if self.root is None:
+            return iter(())
+        return self.root._inorder_nodes()
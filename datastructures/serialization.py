@@ -0,0 +1,217 @@
+"""
+Compact binary format of BinaryTreeNode, BinarySearchTreeNode and AVLTreeNode.
+
+A file holds a header, the shape of the tree as a bitmap with two bits per
+node in preorder (has left child, has right child), the values packed in order
+and, for AVL trees, node heights in order (unsigned 32 bit, trees with a
+relaxed threshold can be taller than a byte holds). Every section starts at a
+multiple of 8 bytes.
+
+`load` builds the nodes again without any insertion or rotation. `MappedTree`
+maps the file instead and answers lookups with binary search over the packed
+values of search trees, so opening an index takes no time whatever its size.
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import BinaryIO, Iterator, Optional
+
+from .trees import (
+    AVLTreeNode,
+    BinarySearchTreeNode,
+    BinaryTreeNode,
+    inorder_nodes,
+    preorder_nodes,
+)
+
+MAGIC = b"TREE"
+VERSION = 2
+# magic, version, kind, typecode, number of nodes
+HEADER = struct.Struct("<4sBBcxQ")
+KINDS = (BinaryTreeNode, BinarySearchTreeNode, AVLTreeNode)
+HEIGHT_TYPECODE = "I"
+
+
+def dumps(root: Optional[BinaryTreeNode | AVLTreeNode], typecode: str = "q") -> bytes:
+    """Return a tree packed in the binary format.
+
+    Values have to fit the array typecode. Data of AVL nodes isn't stored.
+    """
+    kind = 0
+    if root is not None:
+        kind = max(
+            (index for index, cls in enumerate(KINDS) if isinstance(root, cls)),
+            default=None,
+        )
+        if kind is None:
+            raise TypeError(f"{type(root).__name__} trees can't be serialized")
+    preorder = list(preorder_nodes(root))
+    shape = bytearray((2 * len(preorder) + 7) // 8)
+    for index, node in enumerate(preorder):
+        if node.left is not None:
+            shape[index >> 2] |= 1 << (2 * (index & 3))
+        if node.right is not None:
+            shape[index >> 2] |= 2 << (2 * (index & 3))
+
+    inorder = list(inorder_nodes(root))
+    sections = [
+        HEADER.pack(MAGIC, VERSION, kind, typecode.encode(), len(preorder)),
+        bytes(shape),
+        array(typecode, [node.value for node in inorder]).tobytes(),
+    ]
+    if KINDS[kind] is AVLTreeNode:
+        sections.append(
+            array(HEIGHT_TYPECODE, [node.height for node in inorder]).tobytes()
+        )
+    return b"".join(_pad(section) for section in sections)
+
+
+def dump(
+    root: Optional[BinaryTreeNode | AVLTreeNode], file: BinaryIO, typecode: str = "q"
+) -> None:
+    file.write(dumps(root, typecode))
+
+
+def loads(data) -> Optional[BinaryTreeNode | AVLTreeNode]:
+    """Build a tree from bytes or any buffer in the binary format."""
+    view = memoryview(data)
+    try:
+        cls, count, shape, values, heights = _sections(view)
+        if not count:
+            return None
+
+        # create nodes in preorder from the shape bitmap
+        root = cls(0)
+        preorder = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            bits = shape[len(preorder) >> 2] >> (2 * (len(preorder) & 3))
+            preorder.append(node)
+            if bits & 2:
+                node.right = cls(0)
+                stack.append(node.right)
+            if bits & 1:
+                node.left = cls(0)
+                stack.append(node.left)
+
+        for index, node in enumerate(inorder_nodes(root)):
+            node.value = values[index]
+            if heights is not None:
+                node.height = heights[index]
+        if cls is BinarySearchTreeNode:
+            # children follow their parent in preorder
+            for node in reversed(preorder):
+                node.size = 1 + cls.get_size(node.left) + cls.get_size(node.right)
+        return root
+    finally:
+        view.release()
+
+
+def load(file: BinaryIO) -> Optional[BinaryTreeNode | AVLTreeNode]:
+    return loads(file.read())
+
+
+class MappedTree:
+    """Read only view of a serialized tree in a memory mapped file.
+
+    No nodes are created. Search trees answer membership, rank, select and
+    range queries with binary search over their packed in order values, plain
+    binary trees can only be scanned.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mmap)
+        try:
+            self.node_class, self.length, _, self.values, _ = _sections(self.view)
+        except ValueError:
+            self.view.release()
+            self.mmap.close()
+            raise
+        self.ordered = self.node_class is not BinaryTreeNode
+
+    def __enter__(self) -> MappedTree:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, value) -> bool:
+        if not self.ordered:
+            return value in self.values
+        index = bisect_left(self.values, value)
+        return index < self.length and self.values[index] == value
+
+    def rank(self, value) -> int:
+        """Return the number of values lower than value."""
+        self._check_ordered()
+        return bisect_left(self.values, value)
+
+    def select(self, k: int):
+        """Return the k-th smallest (0 based) value."""
+        self._check_ordered()
+        if not 0 <= k < self.length:
+            raise IndexError(f"{k} is out of range for {self.length} values")
+        return self.values[k]
+
+    def iter_range(self, low, high) -> Iterator:
+        """Yield values between low and high (inclusive) in order."""
+        self._check_ordered()
+        start = bisect_left(self.values, low)
+        end = bisect_right(self.values, high)
+        yield from self.values[start:end].tolist()
+
+    def load(self) -> Optional[BinaryTreeNode | AVLTreeNode]:
+        """Build the nodes of the mapped tree."""
+        return loads(self.view)
+
+    def close(self) -> None:
+        self.values.release()
+        self.view.release()
+        self.mmap.close()
+
+    def _check_ordered(self) -> None:
+        if not self.ordered:
+            raise TypeError(f"{self.node_class.__name__} values aren't ordered")
+
+
+def _sections(view: memoryview) -> tuple:
+    """Return node class, count, shape, values and heights views of a buffer."""
+    if len(view) < HEADER.size:
+        raise ValueError("Data is too short for a serialized tree")
+    magic, version, kind, typecode, count = HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION or kind >= len(KINDS):
+        raise ValueError("Data is not a serialized tree")
+
+    typecode = typecode.decode()
+    offset = _padded(HEADER.size)
+    shape = view[offset : offset + (2 * count + 7) // 8]
+    offset += _padded(len(shape))
+    size = count * array(typecode).itemsize
+    heights_size = 0
+    if KINDS[kind] is AVLTreeNode:
+        heights_size = count * array(HEIGHT_TYPECODE).itemsize
+    if len(view) < offset + _padded(size) + heights_size:
+        raise ValueError("Data of the serialized tree is truncated")
+    values = view[offset : offset + size].cast(typecode)
+    offset += _padded(size)
+    heights = None
+    if KINDS[kind] is AVLTreeNode:
+        heights = view[offset : offset + heights_size].cast(HEIGHT_TYPECODE)
+    return KINDS[kind], count, shape, values, heights
+
+
+def _padded(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _pad(section: bytes) -> bytes:
+    return section + bytes(_padded(len(section)) - len(section))
@@ -0,0 +1,183 @@
+import random
+from unittest import TestCase
+
+from ..augmented_trees import (
+    MAXIMUM,
+    MINIMUM,
+    AugmentedAVLTree,
+    AugmentedAVLTreeNode,
+    IntervalTree,
+    Monoid,
+    OrderStatisticNode,
+    OrderStatisticTree,
+)
+
+
+class ConcatenationNode(AugmentedAVLTreeNode):
+    __slots__ = ()
+
+    monoids = (Monoid("", str.__add__, lambda node: str(node.value)), MAXIMUM, MINIMUM)
+
+
+class ConcatenationTree(AugmentedAVLTree):
+    node_class = ConcatenationNode
+
+
+class AugmentedAVLTreeTestCase(TestCase):
+    """TestCase for AugmentedAVLTree."""
+
+    def setUp(self) -> None:
+        keys = random.Random(1).sample(range(10), 10)
+        self.tree = ConcatenationTree((key, -key) for key in keys)
+
+    def assert_aggregates(self, node: AugmentedAVLTreeNode) -> list:
+        if node is None:
+            return []
+        keys = self.assert_aggregates(node.left) + [node.value]
+        keys += self.assert_aggregates(node.right)
+        self.assertEqual("".join(map(str, keys)), node.aggregates[0])
+        return keys
+
+    def test_aggregate_keeps_order(self):
+        for low in range(10):
+            for high in range(low, 10):
+                expected = "".join(map(str, range(low, high + 1)))
+                self.assertEqual(expected, self.tree.aggregate(low, high))
+
+    def test_aggregate_without_bounds(self):
+        self.assertEqual("0123456789", self.tree.aggregate())
+        self.assertEqual("789", self.tree.aggregate(7))
+        self.assertEqual("0123", self.tree.aggregate(high=3))
+        self.assertEqual("", self.tree.aggregate(20))
+        self.assertEqual("", self.tree.aggregate(4.2, 4.8))
+
+    def test_aggregate_other_monoids(self):
+        self.assertEqual(-2, self.tree.aggregate(2, 6, 1))
+        self.assertEqual(-6, self.tree.aggregate(2, 6, 2))
+        self.assertEqual(float("-inf"), self.tree.aggregate(11, position=1))
+
+    def test_aggregates_follow_changes(self):
+        self.tree[4] = 100
+        self.assertEqual(100, self.tree.aggregate(position=1))
+        for key in (3, 7, 0):
+            del self.tree[key]
+            self.assert_aggregates(self.tree.root)
+        for key in range(20, 40):
+            self.tree[key] = key
+            self.assert_aggregates(self.tree.root)
+        self.assertEqual("1245689", self.tree.aggregate(high=19))
+
+
+class OrderStatisticTreeTestCase(TestCase):
+    """TestCase for OrderStatisticTree."""
+
+    def setUp(self) -> None:
+        rng = random.Random(0)
+        self.tree = OrderStatisticTree()
+        self.expected = {}
+        for _ in range(2000):
+            key = rng.randrange(300)
+            if key in self.expected and rng.random() < 0.4:
+                del self.tree[key]
+                del self.expected[key]
+            else:
+                self.tree[key] = self.expected[key] = rng.randrange(-50, 50)
+
+    def test_rank_and_select(self):
+        keys = sorted(self.expected)
+        for index, key in enumerate(keys):
+            self.assertEqual(index, self.tree.rank(key))
+            self.assertEqual(key, self.tree.select(index))
+        self.assertEqual(len(keys), self.tree.rank(1000))
+
+    def test_select_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.tree.select(len(self.tree))
+        with self.assertRaises(IndexError):
+            self.tree.select(-1)
+
+    def test_count_and_sum(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            low, high = sorted(rng.randrange(-10, 310) for _ in range(2))
+            keys = [key for key in self.expected if low <= key <= high]
+            self.assertEqual(len(keys), self.tree.count(low, high))
+            expected = sum(self.expected[key] for key in keys)
+            self.assertEqual(expected, self.tree.sum(low, high))
+
+    def test_sum_after_replacing_value(self):
+        key = next(iter(self.expected))
+        total = self.tree.sum()
+        self.tree[key] += 1000
+        self.assertEqual(total + 1000, self.tree.sum())
+        self.assertEqual(len(self.expected), self.tree.count())
+
+
+class OrderStatisticNodeTestCase(TestCase):
+    """TestCase for OrderStatisticNode."""
+
+    def test_from_iterable_without_data(self):
+        root = OrderStatisticNode.from_iterable([3, 1, 2, 5, 4])
+
+        self.assertEqual((5, 0), root.aggregates)
+        self.assertEqual((2, 0), root.left.aggregates)
+
+    def test_bulk_built_nodes_in_other_monoids(self):
+        root = ConcatenationNode.from_iterable(range(5))
+
+        self.assertEqual(("01234", float("-inf"), float("inf")), root.aggregates)
+
+
+class IntervalTreeTestCase(TestCase):
+    """TestCase for IntervalTree."""
+
+    def setUp(self) -> None:
+        rng = random.Random(0)
+        self.tree = IntervalTree()
+        self.intervals = set()
+        for _ in range(1000):
+            start = rng.randrange(1000)
+            interval = start, start + rng.randrange(50)
+            if interval in self.intervals and rng.random() < 0.5:
+                self.tree.remove(*interval)
+                self.intervals.remove(interval)
+            else:
+                self.tree.add(*interval)
+                self.intervals.add(interval)
+
+    def overlapping(self, low: int, high: int) -> list:
+        return sorted(
+            (start, end)
+            for start, end in self.intervals
+            if start <= high and low <= end
+        )
+
+    def test_overlapping_point(self):
+        for point in range(0, 1100, 7):
+            self.assertEqual(
+                self.overlapping(point, point), list(self.tree.overlapping(point))
+            )
+
+    def test_overlapping_range(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            low = rng.randrange(1100)
+            high = low + rng.randrange(30)
+            self.assertEqual(
+                self.overlapping(low, high), list(self.tree.overlapping(low, high))
+            )
+
+    def test_overlapping_empty(self):
+        self.assertEqual([], list(IntervalTree().overlapping(3)))
+        self.assertEqual([], list(self.tree.overlapping(2000)))
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            self.tree.add(5, 4)
+
+    def test_remove(self):
+        for interval in list(self.intervals):
+            self.tree.remove(*interval)
+        self.assertEqual(0, len(self.tree))
+        with self.assertRaises(KeyError):
+            self.tree.remove(1, 2)
@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+from contextlib import redirect_stderr
+from io import StringIO
+from unittest import TestCase
+
+from ..benchmarks import TREES, gil_enabled, main, run
+
+
+class BenchmarksTestCase(TestCase):
+    """TestCase for the concurrent tree benchmarks."""
+
+    def test_run_is_consistent(self):
+        results = run(threads=[1, 3], read_ratios=[0.5], operations=500, key_range=200)
+
+        self.assertEqual(len(results), 2 * len(TREES))
+        for result in results:
+            with self.subTest(result=result):
+                self.assertTrue(result["consistent"])
+                self.assertGreater(result["operations_per_second"], 0)
+
+    def test_main_writes_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            with redirect_stderr(StringIO()):
+                status = main(
+                    [
+                        "--threads",
+                        "2",
+                        "--read-ratios",
+                        "0.9",
+                        "--operations",
+                        "200",
+                        "--output",
+                        output,
+                    ]
+                )
+            with open(output) as file:
+                report = json.load(file)
+
+        self.assertEqual(0, status)
+        self.assertEqual(gil_enabled(), report["gil_enabled"])
+        self.assertEqual(len(TREES), len(report["results"]))
@@ -0,0 +1,126 @@
+import os
+import random
+import tempfile
+from unittest import TestCase
+
+from ..bplustree import BPlusTree
+
+
+class BPlusTreeTestCase(TestCase):
+    """TestCase for BPlusTree."""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "index.bpt")
+
+    def make_tree(self, **kwargs) -> BPlusTree:
+        tree = BPlusTree(self.path, **kwargs)
+        self.addCleanup(tree.close)
+        return tree
+
+    def test_insert_and_search(self):
+        tree = self.make_tree(fanout=4, cache_size=3)
+        keys = random.Random(0).sample(range(10_000), 2_000)
+        for key in keys:
+            tree.insert(key, -key)
+
+        self.assertEqual(2_000, len(tree))
+        self.assertEqual(sorted(keys), list(tree))
+        for key in keys:
+            self.assertEqual(-key, tree.search(key))
+        self.assertIsNone(tree.search(10_001))
+
+    def test_insert_replaces_value(self):
+        tree = self.make_tree()
+        tree.insert(1, 10)
+        tree.insert(1, 20)
+
+        self.assertEqual(1, len(tree))
+        self.assertEqual(20, tree.search(1))
+
+    def test_splits_with_small_cache_and_tight_pages(self):
+        keys = random.Random(2).sample(range(3_000), 3_000)
+        for page_size in (120, 136):
+            with self.subTest(page_size=page_size):
+                with BPlusTree(self.path, page_size=page_size, cache_size=1) as tree:
+                    for key in keys:
+                        tree.insert(key, -key)
+
+                    self.assertEqual(list(range(3_000)), list(tree))
+
+                with BPlusTree(self.path) as tree:
+                    self.assertEqual(3_000, len(tree))
+                    self.assertEqual(list(range(3_000)), list(tree))
+                    self.assertEqual(-1_234, tree.search(1_234))
+                os.remove(self.path)
+
+    def test_iter_range(self):
+        tree = self.make_tree(fanout=4)
+        for key in range(0, 200, 2):
+            tree.insert(key, key * 10)
+
+        result = list(tree.iter_range(15, 31))
+
+        self.assertEqual([(key, key * 10) for key in range(16, 31, 2)], result)
+        self.assertEqual([], list(tree.iter_range(300, 400)))
+        self.assertEqual(100, len(list(tree.iter_range())))
+
+    def test_delete(self):
+        tree = self.make_tree(fanout=4, cache_size=2)
+        for key in range(100):
+            tree.insert(key)
+
+        for key in range(0, 100, 3):
+            tree.delete(key)
+
+        self.assertEqual([key for key in range(100) if key % 3], list(tree))
+        self.assertNotIn(3, tree)
+        with self.assertRaises(ValueError):
+            tree.delete(3)
+
+    def test_bulk_load(self):
+        tree = self.make_tree(fanout=5)
+
+        tree.bulk_load((key, key + 1) for key in range(1_000))
+        tree.insert(-1, 0)
+        tree.insert(1_000, 1_001)
+
+        self.assertEqual(list(range(-1, 1_001)), list(tree))
+        for key in range(-1, 1_001, 7):
+            self.assertEqual(key + 1, tree.search(key))
+
+    def test_bulk_load_with_small_cache(self):
+        for fanout in (3, 4, 7):
+            with self.subTest(fanout=fanout):
+                items = [(key, -key) for key in range(200)]
+                with BPlusTree(self.path, fanout=fanout, cache_size=1) as tree:
+                    tree.bulk_load(items)
+
+                    self.assertEqual(items, list(tree.iter_range()))
+
+                with BPlusTree(self.path) as tree:
+                    self.assertEqual(items, list(tree.iter_range()))
+                os.remove(self.path)
+
+    def test_bulk_load_requires_sorted_keys(self):
+        tree = self.make_tree()
+
+        with self.assertRaises(ValueError):
+            tree.bulk_load([(2, 0), (1, 0)])
+
+    def test_reopen_file(self):
+        with BPlusTree(self.path, fanout=8, cache_size=4) as tree:
+            for key in random.Random(1).sample(range(5_000), 1_000):
+                tree.insert(key, key * 2)
+            expected = list(tree.iter_range())
+
+        tree = self.make_tree()
+
+        self.assertEqual(8, tree.fanout)
+        self.assertEqual(1_000, len(tree))
+        self.assertEqual(expected, list(tree.iter_range()))
+
+    def test_invalid_fanout(self):
+        with self.assertRaises(ValueError):
+            BPlusTree(self.path, page_size=64, fanout=4)
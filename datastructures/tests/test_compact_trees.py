@@ -0,0 +1,93 @@
+import random
+from unittest import TestCase
+
+from ..compact_trees import NIL, CompactAVLTree
+from ..trees import BinarySearchTreeNode
+
+
+class CompactAVLTreeTestCase(TestCase):
+    """TestCase for CompactAVLTree."""
+
+    def setUp(self) -> None:
+        values = [18, 12, 30, 10, 15, 28, 45, 1, 11, 14, 16, 20, 29, 40, 60]
+        self.tree = CompactAVLTree(values)
+
+    def assert_balanced(self, tree: CompactAVLTree, node: int) -> int:
+        if node == NIL:
+            return 0
+        left = self.assert_balanced(tree, tree.left[node])
+        right = self.assert_balanced(tree, tree.right[node])
+        self.assertLessEqual(abs(left - right), tree.threshold)
+        self.assertEqual(1 + max(left, right), tree.heights[node])
+        return tree.heights[node]
+
+    def test_traversals_match_binary_search_tree(self):
+        values = [18, 12, 30, 10, 15, 28, 45, 1, 11, 14, 16, 20, 29, 40, 60]
+        root = BinarySearchTreeNode(values[0])
+        for value in values[1:]:
+            root.insert(value)
+
+        # values inserted in this order never need a rotation
+        self.assertEqual(root.get_inorder(), self.tree.get_inorder())
+        self.assertEqual(root.get_preorder(), self.tree.get_preorder())
+        self.assertEqual(root.get_postorder(), self.tree.get_postorder())
+        self.assertEqual(
+            list(root.iter_level_order()), list(self.tree.iter_level_order())
+        )
+
+    def test_depth_first_search(self):
+        self.assertEqual((True, [18, 12, 15]), self.tree.depth_first_search(15))
+        self.assertEqual((False, [18, 12, 15, 16]), self.tree.depth_first_search(17))
+
+    def test_sorted_inserts_stay_balanced(self):
+        tree = CompactAVLTree(range(1000))
+
+        self.assertEqual(list(range(1000)), tree.get_inorder())
+        self.assertEqual(10, tree.height)
+        self.assert_balanced(tree, tree.root)
+
+    def test_delete(self):
+        self.tree.delete(18)
+        self.tree.delete(1)
+
+        self.assertNotIn(18, self.tree)
+        self.assertEqual(13, len(self.tree))
+        self.assertEqual(
+            [10, 11, 12, 14, 15, 16, 20, 28, 29, 30, 40, 45, 60],
+            self.tree.get_inorder(),
+        )
+        self.assert_balanced(self.tree, self.tree.root)
+
+    def test_delete_missing_value_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.tree.delete(17)
+
+    def test_deleted_slots_are_reused(self):
+        for value in [1, 11, 14]:
+            self.tree.delete(value)
+
+        self.tree.insert(2)
+        self.tree.insert(3)
+
+        self.assertEqual(15, len(self.tree.values))
+        self.assertIn(2, self.tree)
+        self.assertIn(3, self.tree)
+
+    def test_random_operations(self):
+        rng = random.Random(0)
+        tree = CompactAVLTree(threshold=2)
+        expected = []
+        for _ in range(2000):
+            value = rng.randrange(200)
+            if value in expected and rng.random() < 0.5:
+                tree.delete(value)
+                expected.remove(value)
+            else:
+                tree.insert(value)
+                expected.append(value)
+
+        self.assertEqual(sorted(expected), tree.get_inorder())
+        self.assert_balanced(tree, tree.root)
+
+    def test_nbytes(self):
+        self.assertEqual(15 * 20, self.tree.nbytes)
@@ -0,0 +1,88 @@
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from ..concurrent_trees import ConcurrentBinarySearchTree
+
+
+class ConcurrentBinarySearchTreeTestCase(TestCase):
+    """TestCase for ConcurrentBinarySearchTree."""
+
+    def setUp(self) -> None:
+        values = [18, 12, 30, 10, 15, 28, 45, 1, 11, 14, 16, 20, 29, 40, 60]
+        self.tree = ConcurrentBinarySearchTree(values)
+
+    def test_insert(self):
+        self.assertTrue(self.tree.insert(17))
+        self.assertFalse(self.tree.insert(17))
+
+        self.assertIn(17, self.tree)
+        self.assertEqual(16, len(self.tree))
+
+    def test_delete(self):
+        self.tree.delete(45)
+        self.tree.delete(1)
+
+        self.assertNotIn(45, self.tree)
+        self.assertEqual(
+            [10, 11, 12, 14, 15, 16, 18, 20, 28, 29, 30, 40, 60],
+            self.tree.get_inorder(),
+        )
+        with self.assertRaises(ValueError):
+            self.tree.delete(45)
+
+    def test_delete_node_with_two_children_leaves_tombstone(self):
+        self.tree.delete(12)
+
+        self.assertNotIn(12, self.tree)
+        self.assertTrue(self.tree.head.right.left.deleted)
+        self.assertEqual(14, len(self.tree))
+
+        self.assertTrue(self.tree.insert(12))
+        self.assertIn(12, self.tree)
+        self.assertEqual(15, len(self.tree))
+
+    def test_writers_unlink_tombstones(self):
+        self.tree.delete(12)
+        self.tree.delete(10)
+        self.tree.delete(1)
+        self.tree.delete(11)
+
+        # tombstone of 12 has only the right child left
+        self.tree.insert(13)
+
+        self.assertEqual(15, self.tree.head.right.left.value)
+        self.assertEqual(
+            [13, 14, 15, 16, 18, 20, 28, 29, 30, 40, 45, 60],
+            self.tree.get_inorder(),
+        )
+
+    @staticmethod
+    def work(tree: ConcurrentBinarySearchTree, seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(2000):
+            # every worker owns the values equal to its seed modulo 4, so the
+            # result doesn't depend on the order of the workers
+            value = rng.randrange(250) * 4 + seed
+            rng.randrange(1000) in tree
+            if value in tree:
+                tree.delete(value)
+            else:
+                tree.insert(value)
+
+    def test_concurrent_writers_and_readers(self):
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        values = random.Random(0).sample(range(1000), 500)
+        tree = ConcurrentBinarySearchTree(values)
+        expected = ConcurrentBinarySearchTree(values)
+        for seed in range(4):
+            self.work(expected, seed)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(self.work, [tree] * 4, range(4)))
+
+        self.assertEqual(expected.get_inorder(), tree.get_inorder())
+        self.assertEqual(len(expected), len(tree))
@@ -0,0 +1,85 @@
+import random
+from unittest import TestCase
+
+from ..persistent_trees import PersistentAVLNode, PersistentAVLTree
+
+
+class PersistentAVLTreeTestCase(TestCase):
+    """TestCase for PersistentAVLTree."""
+
+    def setUp(self) -> None:
+        self.tree = PersistentAVLTree((key, str(key)) for key in range(100))
+
+    def assert_balanced(self, node: PersistentAVLNode) -> int:
+        if node is None:
+            return 0
+        left = self.assert_balanced(node.left)
+        right = self.assert_balanced(node.right)
+        self.assertLessEqual(abs(left - right), 1)
+        self.assertEqual(1 + max(left, right), node.height)
+        return node.height
+
+    @staticmethod
+    def nodes(node: PersistentAVLNode) -> set:
+        return {id(item) for item in node._inorder_nodes()}
+
+    def test_set_keeps_old_snapshot(self):
+        tree = self.tree.set(100, "100").set(5, "five")
+
+        self.assertEqual(100, len(self.tree))
+        self.assertEqual(101, len(tree))
+        self.assertNotIn(100, self.tree)
+        self.assertEqual("5", self.tree[5])
+        self.assertEqual("five", tree[5])
+        self.assert_balanced(tree.root)
+
+    def test_remove_keeps_old_snapshot(self):
+        tree = self.tree
+        for key in range(0, 100, 2):
+            tree = tree.remove(key)
+            self.assert_balanced(tree.root)
+
+        self.assertEqual(list(range(1, 100, 2)), list(tree))
+        self.assertEqual(list(range(100)), list(self.tree))
+        with self.assertRaises(KeyError):
+            tree.remove(0)
+
+    def test_update_copies_only_one_path(self):
+        tree = self.tree.set(50, "fifty")
+
+        new_nodes = self.nodes(tree.root) - self.nodes(self.tree.root)
+        self.assertLessEqual(len(new_nodes), self.tree.height)
+
+    def test_snapshot_iteration_during_updates(self):
+        snapshot = self.tree
+        tree = self.tree
+        keys = []
+        for key in snapshot:
+            keys.append(key)
+            tree = tree.remove(key).set(key + 1000, key)
+
+        self.assertEqual(list(range(100)), keys)
+        self.assertEqual(list(range(1000, 1100)), list(tree))
+
+    def test_random_operations(self):
+        rng = random.Random(0)
+        tree = PersistentAVLTree()
+        expected = {}
+        for _ in range(1000):
+            key = rng.randrange(100)
+            if key in expected and rng.random() < 0.5:
+                tree = tree.remove(key)
+                del expected[key]
+            else:
+                tree = tree.set(key, -key)
+                expected[key] = -key
+
+        self.assertEqual(sorted(expected.items()), list(tree.items()))
+        self.assertEqual(len(expected), len(tree))
+        self.assert_balanced(tree.root)
+
+    def test_minimum_and_maximum(self):
+        self.assertEqual(0, self.tree.minimum())
+        self.assertEqual(99, self.tree.maximum())
+        with self.assertRaises(ValueError):
+            PersistentAVLTree().maximum()
@@ -0,0 +1,131 @@
+import io
+import os
+import random
+import tempfile
+from unittest import TestCase
+
+from .. import serialization
+from ..serialization import MappedTree, dump, dumps, load, loads
+from ..trees import AVLTreeNode, BinarySearchTreeNode, BinaryTreeNode
+
+
+class SerializationTestCase(TestCase):
+    """TestCase for the binary tree format."""
+
+    def setUp(self) -> None:
+        values = [18, 12, 30, 10, 15, 28, 45, 1, 11, 14, 16, 20, 29, 40, 60]
+        self.root = BinarySearchTreeNode(values[0])
+        for value in values[1:]:
+            self.root.insert(value)
+
+    def test_binary_tree(self):
+        root = BinaryTreeNode(1)
+        root.insert_left(2).insert_right(-4)
+        root.insert_right(3).insert_right(5).insert_left(6)
+
+        result = loads(dumps(root))
+
+        self.assertIs(type(result), BinaryTreeNode)
+        self.assertEqual(root.get_preorder(), result.get_preorder())
+        self.assertEqual(root.get_inorder(), result.get_inorder())
+
+    def test_binary_search_tree(self):
+        result = loads(dumps(self.root))
+
+        self.assertIs(type(result), BinarySearchTreeNode)
+        self.assertEqual(self.root.get_preorder(), result.get_preorder())
+        self.assertEqual(self.root.get_inorder(), result.get_inorder())
+        self.assertEqual(15, result.size)
+        self.assertEqual(16, result.select(6))
+
+    def test_avl_tree_keeps_heights(self):
+        root = AVLTreeNode.create_tree(random.Random(0).sample(range(1000), 300))
+
+        result = loads(dumps(root, typecode="h"))
+
+        self.assertEqual(list(root.iter_inorder()), list(result.iter_inorder()))
+        for node, copy in zip(root._inorder_nodes(), result._inorder_nodes()):
+            self.assertEqual(node.height, copy.height)
+        # the loaded tree stays balanced on following inserts
+        for value in range(1000, 1100):
+            result = AVLTreeNode.insert(result, value)
+        self.assertLessEqual(result.height, 12)
+
+    def test_avl_tree_taller_than_a_byte(self):
+        root = AVLTreeNode.create_tree(range(2_000), threshold=400)
+        self.assertGreater(root.height, 255)
+
+        result = loads(dumps(root))
+
+        for node, copy in zip(root._inorder_nodes(), result._inorder_nodes()):
+            self.assertEqual(node.height, copy.height)
+
+    def test_empty_tree(self):
+        self.assertIsNone(loads(dumps(None)))
+
+    def test_sections_are_aligned(self):
+        data = dumps(self.root)
+
+        self.assertEqual(0, len(data) % 8)
+        self.assertEqual(16 + 8 + 15 * 8, len(data))
+
+    def test_file(self):
+        file = io.BytesIO()
+
+        dump(self.root, file)
+        file.seek(0)
+
+        self.assertEqual(self.root.get_preorder(), load(file).get_preorder())
+
+    def test_invalid_data(self):
+        with self.assertRaises(ValueError):
+            loads(b"not a tree")
+        with self.assertRaises(ValueError):
+            loads(b"x" * serialization.HEADER.size)
+        with self.assertRaises(ValueError):
+            loads(dumps(self.root)[:-8])
+
+
+class MappedTreeTestCase(TestCase):
+    """TestCase for MappedTree."""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "tree.bin")
+
+    def write(self, root) -> MappedTree:
+        with open(self.path, "wb") as file:
+            dump(root, file)
+        tree = MappedTree(self.path)
+        self.addCleanup(tree.close)
+        return tree
+
+    def test_search_tree_queries(self):
+        tree = self.write(BinarySearchTreeNode.from_iterable(range(0, 2000, 2)))
+
+        self.assertEqual(1000, len(tree))
+        self.assertIn(1998, tree)
+        self.assertNotIn(7, tree)
+        self.assertEqual(4, tree.rank(7))
+        self.assertEqual(20, tree.select(10))
+        self.assertEqual([10, 12, 14], list(tree.iter_range(9, 15)))
+
+    def test_load(self):
+        root = AVLTreeNode.from_iterable(range(100))
+        tree = self.write(root)
+
+        result = tree.load()
+
+        self.assertEqual(list(range(100)), list(result.iter_inorder()))
+        self.assertEqual(root.height, result.height)
+
+    def test_binary_tree_is_not_ordered(self):
+        root = BinaryTreeNode(3)
+        root.insert_left(1)
+        root.insert_right(2)
+        tree = self.write(root)
+
+        self.assertIn(2, tree)
+        with self.assertRaises(TypeError):
+            tree.rank(2)
@@ -1,6 +1,20 @@
+from decimal import Decimal
+from fractions import Fraction
 from unittest import TestCase
 
-from ..trees import BinarySearchTreeNode, BinaryTreeNode
+from ..trees import AVLTree, AVLTreeNode, BinarySearchTreeNode, BinaryTreeNode
+
+
+def index_snapshot(root: BinaryTreeNode) -> tuple[dict, dict]:
+    """Return node ids by value of the tree and of its index."""
+    expected = {}
+    for node in root._preorder_nodes():
+        assert node._index is root._index
+        expected.setdefault(node.value, set()).add(id(node))
+    result = {
+        value: {id(node) for node in nodes} for value, nodes in root._index.items()
+    }
+    return expected, result
 
 
 class BinaryTreeNodeTestCase(TestCase):
@@ -47,6 +61,164 @@ class BinaryTreeNodeTestCase(TestCase):
 
         self.assertEqual(expected_value, result)
 
+    def test_iter_level_order(self):
+        expected_value = [1, 10, 21, 33, 18, 3, 128, 25, 300, 5, 82]
+
+        result = self.root.iter_level_order()
+
+        self.assertEqual(expected_value, list(result))
+
+    def test_iterators_are_lazy(self):
+        testcases = {
+            self.root.iter_inorder: 25,
+            self.root.iter_preorder: 1,
+            self.root.iter_postorder: 25,
+            self.root.iter_level_order: 1,
+        }
+        for method, expected_value in testcases.items():
+            with self.subTest(method=method.__name__):
+                iterator = method()
+
+                self.assertEqual(expected_value, next(iterator))
+
+    def test_degenerate_tree_does_not_overflow_the_stack(self):
+        size = 5_000
+        root = node = BinaryTreeNode(0)
+        for value in range(1, size):
+            node = node.insert_left(value)
+        expected_order = list(range(size - 1, -1, -1))
+
+        self.assertEqual(expected_order, root.get_inorder())
+        self.assertEqual(expected_order[::-1], root.get_preorder())
+        self.assertEqual(expected_order, root.get_postorder())
+        self.assertEqual(
+            (True, expected_order[::-1]), root.depth_first_search(size - 1)
+        )
+
+    def test_parent_pointers(self):
+        for node in self.root._preorder_nodes():
+            for child in (node.left, node.right):
+                if child is not None:
+                    self.assertIs(node, child.parent)
+        self.assertIsNone(self.root.parent)
+
+    def test_hash_of_equal_trees(self):
+        values = [1, 10, 21, 33, 18, 3, 128, 25, None, None, 300, None, None, 5, 82]
+        other = self.create_tree(values)
+
+        self.assertEqual(self.root.hash, other.hash)
+        self.assertTrue(self.root.is_same_tree(other))
+
+    def test_hash_of_values_with_equal_python_hashes(self):
+        for first, second in [(-1, -2), (0, 2**61 - 1), (1.5, "1.5"), (0, None)]:
+            with self.subTest(values=(first, second)):
+                self.assertNotEqual(
+                    BinaryTreeNode(first).hash, BinaryTreeNode(second).hash
+                )
+        self.assertEqual(BinaryTreeNode(True).hash, BinaryTreeNode(1.0).hash)
+        self.assertEqual(BinaryTreeNode((1, "a")).hash, BinaryTreeNode((1.0, "a")).hash)
+
+    def test_hash_of_shared_node_is_invalidated_in_every_tree(self):
+        shared = BinaryTreeNode(5)
+        first, second = BinaryTreeNode(1), BinaryTreeNode(2)
+        first.left = shared
+        second.left = second.right = shared
+        first.hash, second.hash
+
+        shared.value = 6
+        expected = BinaryTreeNode(1)
+        expected.insert_left(6)
+
+        self.assertIs(second, shared.parent)
+        self.assertTrue(first.is_same_tree(expected))
+        second.left = second.right = None
+        self.assertIs(first, shared.parent)
+        first.left = None
+        self.assertIsNone(shared.parent)
+
+    def test_same_tree_with_equal_values_without_exact_encoding(self):
+        for first, second in [(1, Decimal(1)), (0.5, Fraction(1, 2)), (1, 1 + 0j)]:
+            with self.subTest(values=(first, second)):
+                node = BinaryTreeNode(first)
+
+                self.assertTrue(node.is_same_tree(BinaryTreeNode(second)))
+
+    def test_hash_is_invalidated_on_changes(self):
+        values = [1, 10, 21, 33, 18, 3, 128, 25, None, None, 300, None, None, 5, 82]
+        other = self.create_tree(values)
+        self.assertEqual(self.root.hash, other.hash)
+        leaf = self.root.left.left.left
+
+        leaf.value = 26
+        self.assertNotEqual(self.root.hash, other.hash)
+        self.assertFalse(self.root.is_same_tree(other))
+
+        other.left.left.left.value = 26
+        self.assertTrue(self.root.is_same_tree(other))
+
+        self.root.right.right = None
+        self.assertFalse(self.root.is_same_tree(other))
+        self.assertFalse(self.root.right.is_same_tree(other.right))
+
+    def test_find(self):
+        for enabled in (False, True):
+            with self.subTest(enabled=enabled):
+                if enabled:
+                    self.root.enable_index()
+
+                node = self.root.find(300)
+
+                self.assertEqual(300, node.value)
+                self.assertEqual([300, 18, 10, 1], node.path_to_root())
+                self.assertIsNone(self.root.find(7))
+
+    def test_index_follows_changes(self):
+        self.root.enable_index()
+        self.assertTrue(self.root.index_enabled)
+
+        self.root.left.insert_left(7).insert_right(8)
+        self.root.right.value = 22
+        self.root.left.right = self.root.right.right
+        self.root.right.right = None
+
+        self.assertEqual(8, self.root.find(8).value)
+        self.assertIsNone(self.root.find(33))
+        self.assertIsNone(self.root.find(18))
+        self.assertEqual([128, 10, 1], self.root.find(128).path_to_root())
+        self.assertEqual(*index_snapshot(self.root))
+
+        self.root.disable_index()
+        self.assertFalse(self.root.index_enabled)
+        self.assertEqual(5, self.root.find(5).value)
+
+    def test_index_of_subtree_moved_between_trees(self):
+        first, second = BinaryTreeNode(1), BinaryTreeNode(3)
+        subtree = first.insert_left(2)
+        subtree.insert_left(4)
+        first.enable_index()
+        second.enable_index()
+
+        second.left = subtree
+        first.left = None
+
+        self.assertIsNone(first.find(2))
+        self.assertIsNone(first.find(4))
+        self.assertIs(subtree, second.find(2))
+        self.assertEqual(*index_snapshot(first))
+        self.assertEqual(*index_snapshot(second))
+
+    def test_index_of_subtree_moved_to_tree_without_index(self):
+        first, second = BinaryTreeNode(1), BinaryTreeNode(3)
+        subtree = first.insert_left(2)
+        first.enable_index()
+
+        second.left = subtree
+        self.assertIs(subtree, first.find(2))
+        first.left = None
+
+        self.assertIsNone(first.find(2))
+        self.assertFalse(subtree.index_enabled)
+
     def test_breadth_first_search_finds_value(self):
         expected_path = [1, 10, 21, 33, 18]
 
@@ -188,3 +360,208 @@ class BinarySearchTreeNodeTestCase(TestCase):
 
         result = self.root.get_inorder()
         self.assertEqual(expected_order, result)
+
+    def test_from_iterable_builds_balanced_tree(self):
+        root = BinarySearchTreeNode.from_iterable(range(1023))
+
+        self.assertEqual(list(range(1023)), root.get_inorder())
+        self.assertEqual(511, root.value)
+        self.assertEqual(1023, root.size)
+        found, path = root.depth_first_search_iterative(0)
+        self.assertTrue(found)
+        self.assertEqual(10, len(path))
+
+    def test_from_iterable_sorts_values(self):
+        root = BinarySearchTreeNode.from_iterable([5, 1, 4, 1, 3])
+
+        self.assertEqual([1, 1, 3, 4, 5], root.get_inorder())
+        self.assertEqual(2, root.rank(3))
+
+    def test_from_iterable_of_no_values(self):
+        self.assertIsNone(BinarySearchTreeNode.from_iterable([]))
+
+    def test_merge(self):
+        root = self.root.merge([17, 2, 70])
+
+        expected_order = sorted(self.root.get_inorder() + [2, 17, 70])
+        self.assertEqual(expected_order, root.get_inorder())
+        self.assertEqual(18, root.size)
+        self.assertEqual(15, self.root.size)
+
+    def test_index_follows_inserts_and_deletes(self):
+        self.root.enable_index()
+
+        for value in [13, 17, 2]:
+            self.root.insert(value)
+        for value in [15, 12, 1, 13, 30]:
+            self.root.delete(value)
+
+        self.assertIsNone(self.root.find(15))
+        self.assertEqual([17, 16, 14, 18], self.root.find(17).path_to_root())
+        self.assertEqual(*index_snapshot(self.root))
+
+    def test_delete_root_with_one_child(self):
+        root = self.create_tree([5, 3, 1, 4])
+
+        root.delete(5)
+
+        self.assertEqual([1, 3, 4], root.get_inorder())
+        self.assertEqual(3, root.size)
+
+    def test_delete_last_value_raises_value_error(self):
+        root = BinarySearchTreeNode(5)
+
+        with self.assertRaises(ValueError):
+            root.delete(5)
+
+    def test_sizes_are_maintained(self):
+        self.root.delete(15)
+        self.root.delete(11)
+        self.root.insert(13)
+
+        for node in self.root._preorder_nodes():
+            self.assertEqual(len(node.get_inorder()), node.size)
+
+    def test_rank(self):
+        self.assertEqual(0, self.root.rank(1))
+        self.assertEqual(7, self.root.rank(18))
+        self.assertEqual(8, self.root.rank(19))
+        self.assertEqual(15, self.root.rank(100))
+
+    def test_select(self):
+        expected_order = self.root.get_inorder()
+
+        result = [self.root.select(k) for k in range(self.root.size)]
+
+        self.assertEqual(expected_order, result)
+        with self.assertRaises(IndexError):
+            self.root.select(15)
+
+    def test_floor_and_ceiling(self):
+        self.assertEqual(16, self.root.floor(17))
+        self.assertEqual(18, self.root.ceiling(17))
+        self.assertEqual(20, self.root.floor(20))
+        self.assertEqual(20, self.root.ceiling(20))
+        self.assertIsNone(self.root.floor(0))
+        self.assertIsNone(self.root.ceiling(61))
+
+    def test_iter_range(self):
+        self.assertEqual([12, 14, 15, 16, 18, 20], list(self.root.iter_range(12, 20)))
+        self.assertEqual([], list(self.root.iter_range(61, 70)))
+        self.assertEqual([1], list(self.root.iter_range(-5, 1)))
+
+
+class AVLTreeNodeTestCase(TestCase):
+    """TestCase for AVLTreeNode."""
+
+    def assert_balanced(self, node: AVLTreeNode) -> int:
+        if node is None:
+            return 0
+        left = self.assert_balanced(node.left)
+        right = self.assert_balanced(node.right)
+        self.assertLessEqual(abs(left - right), 1)
+        self.assertEqual(1 + max(left, right), node.height)
+        return node.height
+
+    def test_from_iterable_builds_balanced_tree(self):
+        root = AVLTreeNode.from_iterable(range(1000))
+
+        self.assertEqual(list(range(1000)), list(root.iter_inorder()))
+        self.assertEqual(10, root.height)
+        self.assert_balanced(root)
+
+    def test_from_iterable_sorts_values(self):
+        root = AVLTreeNode.from_iterable([3, 9, 1, 7, 5, 3])
+
+        self.assertEqual([1, 3, 3, 5, 7, 9], list(root.iter_inorder()))
+        self.assert_balanced(root)
+
+    def test_merge(self):
+        root = AVLTreeNode.from_iterable(range(0, 100, 2))
+
+        merged = root.merge(range(1, 100, 2))
+
+        self.assertEqual(list(range(100)), list(merged.iter_inorder()))
+        self.assertEqual(list(range(0, 100, 2)), list(root.iter_inorder()))
+        self.assert_balanced(merged)
+
+    def test_create_tree(self):
+        values = [18, 12, 30, 10, 15, 28, 45, 1, 11, 14, 16, 20, 29, 40, 60]
+
+        root = AVLTreeNode.create_tree(sorted(values))
+
+        self.assertEqual(sorted(values), list(root.iter_inorder()))
+        self.assert_balanced(root)
+
+    def test_delete_keeps_tree_balanced(self):
+        root = AVLTreeNode.create_tree(range(200))
+
+        for value in range(0, 200, 3):
+            root = AVLTreeNode.delete(root, value)
+            self.assert_balanced(root)
+
+        expected_order = [value for value in range(200) if value % 3]
+        self.assertEqual(expected_order, list(root.iter_inorder()))
+
+    def test_delete_missing_value_raises_value_error(self):
+        root = AVLTreeNode.create_tree([1, 2, 3])
+
+        with self.assertRaises(ValueError):
+            AVLTreeNode.delete(root, 4)
+
+    def test_search(self):
+        root = AVLTreeNode.create_tree(range(10))
+
+        self.assertEqual(7, root.search(7).value)
+        self.assertIsNone(root.search(10))
+
+
+class AVLTreeTestCase(TestCase):
+    """TestCase for AVLTree."""
+
+    def setUp(self) -> None:
+        self.tree = AVLTree((key, str(key)) for key in [5, 3, 8, 1, 4, 7, 9])
+
+    def test_getitem_and_setitem(self):
+        self.tree[4] = "four"
+        self.tree[6] = "six"
+
+        self.assertEqual("four", self.tree[4])
+        self.assertEqual("six", self.tree[6])
+        self.assertEqual(8, len(self.tree))
+        with self.assertRaises(KeyError):
+            self.tree[2]
+
+    def test_delitem(self):
+        del self.tree[5]
+
+        self.assertNotIn(5, self.tree)
+        self.assertEqual([1, 3, 4, 7, 8, 9], list(self.tree))
+        with self.assertRaises(KeyError):
+            del self.tree[5]
+
+    def test_ordered_iteration(self):
+        expected_items = [(key, str(key)) for key in [1, 3, 4, 5, 7, 8, 9]]
+
+        self.assertEqual(expected_items, list(self.tree.items()))
+
+    def test_minimum_and_maximum(self):
+        self.assertEqual(1, self.tree.minimum())
+        self.assertEqual(9, self.tree.maximum())
+        with self.assertRaises(ValueError):
+            AVLTree().minimum()
+
+    def test_relaxed_threshold_trades_height_for_rotations(self):
+        strict = AVLTree(((key, key) for key in range(1000)), threshold=1)
+        relaxed = AVLTree(((key, key) for key in range(1000)), threshold=3)
+
+        self.assertEqual(list(range(1000)), list(relaxed))
+        self.assertLessEqual(strict.height, relaxed.height)
+        self.assertLessEqual(relaxed.height, 2 * strict.height)
+
+    def test_empty_tree(self):
+        tree = AVLTree()
+
+        self.assertEqual(0, len(tree))
+        self.assertEqual([], list(tree))
+        self.assertEqual("missing", tree.get(1, "missing"))
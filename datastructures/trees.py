@@ -1,18 +1,218 @@
 from __future__ import annotations
 
+import heapq
 from collections import deque
-from typing import Optional
+from itertools import pairwise
+from operator import attrgetter
+from typing import Iterable, Iterator, Optional
+
+from . import merkle
+
+
+def sorted_values(values: Iterable[int]) -> list[int]:
+    """Return values as a list, sorted only when they aren't sorted yet."""
+    values = list(values)
+    if any(previous > value for previous, value in pairwise(values)):
+        values.sort()
+    return values
+
+
+def inorder_nodes(root, left: str = "left", right: str = "right") -> Iterator:
+    """Yield nodes of a subtree (or none for None) in order without recursion.
+
+    `left` and `right` name the child attributes of the nodes.
+    """
+    get_left, get_right = attrgetter(left), attrgetter(right)
+    stack = []
+    node = root
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = get_left(node)
+        node = stack.pop()
+        yield node
+        node = get_right(node)
+
+
+def preorder_nodes(root, left: str = "left", right: str = "right") -> Iterator:
+    """Yield nodes of a subtree (or none for None) parent first."""
+    get_left, get_right = attrgetter(left), attrgetter(right)
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if get_right(node) is not None:
+            stack.append(get_right(node))
+        if get_left(node) is not None:
+            stack.append(get_left(node))
 
 
 class BinaryTreeNode:
+    """Node of a binary tree.
+
+    Nodes know their parent and cache a Merkle hash of their subtree (see
+    merkle module). Setting a value or a child clears cached hashes up to the
+    root, so `hash` is O(1) for unchanged subtrees.
+
+    A tree can keep an index from values to nodes (`enable_index`), shared by
+    all its nodes and updated whenever a value or a child is set, so `find` is
+    O(1) instead of a scan. Trees without the index don't pay for it.
+    """
+
+    __slots__ = ("_value", "_left", "_right", "parent", "_parents", "_hash", "_index")
+
     def __init__(self, value: int) -> None:
-        self.value = value
-        self.left = None
-        self.right = None
+        self._value = value
+        self._left: Optional[BinaryTreeNode] = None
+        self._right: Optional[BinaryTreeNode] = None
+        self.parent: Optional[BinaryTreeNode] = None
+        # every parent when the node is in several trees (see merkle.link)
+        self._parents: Optional[dict[BinaryTreeNode, int]] = None
+        self._hash: Optional[bytes] = None
+        self._index: Optional[dict[int, list[BinaryTreeNode]]] = None
 
     def __str__(self):
         return f"[{self.value}] left: {self.left}, right: {self.right}"
 
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        if self._index is not None:
+            self._remove_from_index()
+            self._index.setdefault(value, []).append(self)
+        self._value = value
+        merkle.invalidate(self)
+
+    @property
+    def left(self) -> Optional[BinaryTreeNode]:
+        return self._left
+
+    @left.setter
+    def left(self, node: Optional[BinaryTreeNode]) -> None:
+        self._adopt(self._left, node)
+        self._left = node
+
+    @property
+    def right(self) -> Optional[BinaryTreeNode]:
+        return self._right
+
+    @right.setter
+    def right(self, node: Optional[BinaryTreeNode]) -> None:
+        self._adopt(self._right, node)
+        self._right = node
+
+    def _adopt(
+        self, previous: Optional[BinaryTreeNode], node: Optional[BinaryTreeNode]
+    ) -> None:
+        if previous is node:
+            return
+        if node is not None:
+            merkle.link(self, node)
+            if self._index is not None and node._index is not self._index:
+                # a subtree moved from another indexed tree leaves its index
+                if node._index is not None:
+                    self._drop_from_index(node)
+                self._add_to_index(node, self._index)
+        if previous is not None:
+            merkle.unlink(self, previous)
+            if previous._index is not None and not self._indexed_parent(previous):
+                self._drop_from_index(previous)
+        merkle.invalidate(self)
+
+    @staticmethod
+    def _indexed_parent(node: BinaryTreeNode) -> bool:
+        """Return whether a parent in the index of node still links to it."""
+        return any(
+            parent is not None and parent._index is node._index
+            for parent in merkle.parents_of(node)
+        )
+
+    @property
+    def index_enabled(self) -> bool:
+        return self._index is not None
+
+    def enable_index(self) -> None:
+        """Index values of nodes of this subtree and keep the index updated."""
+        if self._index is None:
+            self._add_to_index(self, {})
+
+    def disable_index(self) -> None:
+        for node in self._preorder_nodes():
+            node._index = None
+
+    def find(self, value: int) -> Optional[BinaryTreeNode]:
+        """Return a node holding value, looked up in the index when enabled."""
+        if self._index is not None:
+            nodes = self._index.get(value)
+            return nodes[0] if nodes else None
+        for node in self._level_order_nodes():
+            if node._value == value:
+                return node
+        return None
+
+    def path_to_root(self) -> list[int]:
+        """Return values from this node up to the root in O(depth)."""
+        path = []
+        node = self
+        while node is not None:
+            path.append(node._value)
+            node = node.parent
+        return path
+
+    @staticmethod
+    def _add_to_index(root: BinaryTreeNode, index: dict) -> None:
+        for node in root._preorder_nodes():
+            node._index = index
+            index.setdefault(node._value, []).append(node)
+
+    @staticmethod
+    def _drop_from_index(root: BinaryTreeNode) -> None:
+        """Remove a detached or moved subtree from its index.
+
+        Nodes already moved to another parent are skipped, they stay indexed.
+        """
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            node._remove_from_index()
+            node._index = None
+            for child in (node._left, node._right):
+                if child is not None and child.parent is node:
+                    stack.append(child)
+
+    def _remove_from_index(self) -> None:
+        nodes = self._index[self._value]
+        nodes.remove(self)
+        if not nodes:
+            del self._index[self._value]
+
+    @property
+    def hash(self) -> bytes:
+        """Merkle hash of the subtree, equal for equal subtrees."""
+        return merkle.subtree_hash(self, lambda node: node._value)
+
+    def is_same_tree(self, other: Optional[BinaryTreeNode]) -> bool:
+        """Return whether other has the same shape and values.
+
+        Different exact hashes answer in O(1) once hashes are cached, other
+        cases are verified by walking both trees (skipping shared subtrees).
+        """
+        if other is None or merkle.differ(self.hash, other.hash):
+            return False
+        stack = [(self, other)]
+        while stack:
+            first, second = stack.pop()
+            if first is second:
+                continue
+            if first is None or second is None or first._value != second._value:
+                return False
+            stack.append((first._left, second._left))
+            stack.append((first._right, second._right))
+        return True
+
     def insert_left(self, value: int):
         self.left = BinaryTreeNode(value)
         return self.left
@@ -23,66 +223,101 @@ class BinaryTreeNode:
 
     def get_inorder(self) -> list:
         """First left, then parent, then right."""
-        result = []
-        if self.left:
-            result.extend(self.left.get_inorder())
-        result.append(self.value)
-        if self.right:
-            result.extend(self.right.get_inorder())
-        return result
+        return list(self.iter_inorder())
 
     def get_preorder(self) -> list:
         """First parent, then left, then right."""
-        result = [self.value]
-        if self.left:
-            result.extend(self.left.get_preorder())
-        if self.right:
-            result.extend(self.right.get_preorder())
-        return result
+        return list(self.iter_preorder())
 
     def get_postorder(self) -> list:
         """First left, then right, then parent."""
-        result = []
-        if self.left:
-            result.extend(self.left.get_postorder())
-        if self.right:
-            result.extend(self.right.get_postorder())
-        result.append(self.value)
-        return result
+        return list(self.iter_postorder())
+
+    def iter_inorder(self) -> Iterator[int]:
+        """Lazily yield values in-order, keeping O(h) nodes on a stack."""
+        for node in self._inorder_nodes():
+            yield node.value
+
+    def iter_preorder(self) -> Iterator[int]:
+        """Lazily yield values pre-order, keeping O(h) nodes on a stack."""
+        for node in self._preorder_nodes():
+            yield node.value
+
+    def iter_postorder(self) -> Iterator[int]:
+        """Lazily yield values post-order, keeping O(h) nodes on a stack."""
+        for node in self._postorder_nodes():
+            yield node.value
+
+    def iter_level_order(self) -> Iterator[int]:
+        """Lazily yield values level by level, from left to right."""
+        for node in self._level_order_nodes():
+            yield node.value
+
+    def _inorder_nodes(self) -> Iterator[BinaryTreeNode]:
+        return inorder_nodes(self, "_left", "_right")
+
+    def _preorder_nodes(self) -> Iterator[BinaryTreeNode]:
+        return preorder_nodes(self, "_left", "_right")
+
+    def _postorder_nodes(self) -> Iterator[BinaryTreeNode]:
+        stack = []
+        node, last_visited = self, None
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node._left
+                continue
+            parent = stack[-1]
+            if parent._right is not None and parent._right is not last_visited:
+                node = parent._right
+            else:
+                last_visited = stack.pop()
+                yield last_visited
+
+    def _level_order_nodes(self) -> Iterator[BinaryTreeNode]:
+        queue = deque([self])
+        while queue:
+            node = queue.popleft()
+            yield node
+            if node._left is not None:
+                queue.append(node._left)
+            if node._right is not None:
+                queue.append(node._right)
 
     def breadth_first_search(self, value: int) -> tuple[bool, list[int]]:
         path = []
-        stack = deque([self])
-        while len(stack) > 0:
-            node = stack.popleft()
-            path.append(node.value)
-            if node.value == value:
+        for node_value in self.iter_level_order():
+            path.append(node_value)
+            if node_value == value:
                 return True, path
-            if node.left:
-                stack.append(node.left)
-            if node.right:
-                stack.append(node.right)
         return False, path
 
     def depth_first_search(self, value: int) -> tuple[bool, list[int]]:
         """Depth-first search using pre-order traversal."""
-        path = [self.value]
-        if self.value == value:
-            return True, path
-        if self.left:
-            found, traversed_path = self.left.depth_first_search(value)
-            path.extend(traversed_path)
-            if found:
-                return found, path
-        if self.right:
-            found, traversed_path = self.right.depth_first_search(value)
-            path.extend(traversed_path)
-            if found:
-                return found, path
+        path = []
+        for node_value in self.iter_preorder():
+            path.append(node_value)
+            if node_value == value:
+                return True, path
         return False, path
 
 
 class BinarySearchTreeNode(BinaryTreeNode):
+    """Binary search tree node keeping the size of its subtree.
+
+    Sizes are maintained by insert() and delete() and give order statistics
+    (rank, select) in O(h).
+
+    Based on:
+    https://en.wikipedia.org/wiki/Order_statistic_tree
+    """
+
+    __slots__ = ("size",)
+
+    def __init__(self, value: int) -> None:
+        super().__init__(value)
+        self.size = 1
+
     def insert_left(self, value: int):
         raise NotImplementedError(
             f"{self.__class__.__name__} does not allow manual insertion!"
@@ -96,36 +331,24 @@ class BinarySearchTreeNode(BinaryTreeNode):
         )
 
     def insert(self, value: int):
-        if value <= self.value:
-            if self.left:
-                self.left.insert(value)
-            else:
-                self.left = BinarySearchTreeNode(value)
-
-        if value > self.value:
-            if self.right:
-                self.right.insert(value)
+        node = self
+        while True:
+            node.size += 1
+            if value <= node._value:
+                if node._left is None:
+                    node.left = self.__class__(value)
+                    return
+                node = node._left
             else:
-                self.right = BinarySearchTreeNode(value)
+                if node._right is None:
+                    node.right = self.__class__(value)
+                    return
+                node = node._right
 
     def depth_first_search(self, value: int) -> tuple[bool, list[int]]:
-        """Depth-first search using recursive binary search algorithm."""
-        found, path = False, [self.value]
-        if self.value == value:
-            return True, path
-        if value < self.value:
-            if self.left:
-                found, traversed_path = self.left.depth_first_search(value)
-                path.extend(traversed_path)
-            else:
-                return False, path
-        if value > self.value:
-            if self.right:
-                found, traversed_path = self.right.depth_first_search(value)
-                path.extend(traversed_path)
-            else:
-                return False, path
-        return found, path
+        """Depth-first search using binary search algorithm."""
+        found, path = self.depth_first_search_iterative(value)
+        return found, [node.value for node in path]
 
     def depth_first_search_iterative(self, value: int) -> tuple[bool, list]:
         """Depth-first search using iterative binary search algorithm."""
@@ -152,6 +375,11 @@ class BinarySearchTreeNode(BinaryTreeNode):
             parent, node = parent, path[0]
         else:
             parent, node = path[-2:]
+        if parent is None and not (node.left and node.right):
+            node._pull_up_child()
+            return
+        for ancestor in path:
+            ancestor.size -= 1
 
         # leaf node
         if not any([node.left, node.right]):
@@ -173,70 +401,280 @@ class BinarySearchTreeNode(BinaryTreeNode):
             node.value = smallest_node.value
             node.right.delete(smallest_node.value, node)
 
+    def _pull_up_child(self) -> None:
+        """Delete root of the tree by moving its only child into it."""
+        child = self.left if self.left else self.right
+        if child is None:
+            raise ValueError(f"{self.value} is the last value in Tree")
+        self.value, self.size = child.value, child.size
+        self.left, self.right = child.left, child.right
+
     def find_minimum(self):
-        if self.left:
-            return self.left.find_minimum()
-        return self
+        node = self
+        while node.left is not None:
+            node = node.left
+        return node
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int]) -> Optional[BinarySearchTreeNode]:
+        """Build a balanced tree in O(n) from sorted values.
+
+        Unsorted values are sorted first. Returns None for no values.
+        """
+        values = sorted_values(values)
+        return cls._build_balanced(values, 0, len(values))
+
+    @classmethod
+    def _build_balanced(
+        cls, values: list[int], low: int, high: int
+    ) -> Optional[BinarySearchTreeNode]:
+        if low >= high:
+            return None
+        middle = (low + high) // 2
+        node = cls(values[middle])
+        node.left = cls._build_balanced(values, low, middle)
+        node.right = cls._build_balanced(values, middle + 1, high)
+        node.size = high - low
+        return node
+
+    def merge(self, values: Iterable[int]) -> BinarySearchTreeNode:
+        """Return a new balanced tree with values of this tree and new values.
+
+        Both sequences are merged in order, so it costs O(n + m) for sorted
+        values. This tree stays unchanged.
+        """
+        values = heapq.merge(self.iter_inorder(), sorted_values(values))
+        return self.from_iterable(values)
+
+    @staticmethod
+    def get_size(node: Optional[BinarySearchTreeNode]) -> int:
+        """Return size of a subtree if it exists."""
+        if not node:
+            return 0
+        return node.size
+
+    def rank(self, value: int) -> int:
+        """Return the number of values lower than value."""
+        rank, node = 0, self
+        while node is not None:
+            if value <= node.value:
+                node = node.left
+            else:
+                rank += 1 + self.get_size(node.left)
+                node = node.right
+        return rank
+
+    def select(self, k: int) -> int:
+        """Return the k-th smallest (0 based) value."""
+        if not 0 <= k < self.size:
+            raise IndexError(f"{k} is out of range for {self.size} values")
+        node = self
+        while True:
+            left_size = self.get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def floor(self, value: int) -> Optional[int]:
+        """Return the biggest value lower than or equal to value."""
+        result, node = None, self
+        while node is not None:
+            if node.value == value:
+                return value
+            if node.value < value:
+                result = node.value
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    def ceiling(self, value: int) -> Optional[int]:
+        """Return the smallest value greater than or equal to value."""
+        result, node = None, self
+        while node is not None:
+            if node.value == value:
+                return value
+            if node.value > value:
+                result = node.value
+                node = node.left
+            else:
+                node = node.right
+        return result
+
+    def iter_range(self, low: int, high: int) -> Iterator[int]:
+        """Yield values between low and high (inclusive) in order.
+
+        Subtrees entirely outside of the range are never visited, so it
+        costs O(h + k) for k yielded values.
+        """
+        stack = []
+        node = self
+        while stack or node is not None:
+            while node is not None:
+                if node.value < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.value > high:
+                return
+            yield node.value
+            node = node.right
 
 
 class AVLTreeNode:
     """Class representing an AVL Tree.
 
+    Nodes are ordered by `value` and can carry any `data` (AVLTree uses them
+    as keys and values of a map). Methods changing the shape of a tree take
+    the root of a subtree and return its new root, so they can be called on the
+    class for empty trees too.
+
+    `threshold` is the biggest allowed difference of subtree heights. The
+    classic AVL tree uses 1, bigger values relax the balance and trade deeper
+    lookups for fewer rotations.
+
     Based on:
     https://youtu.be/vRwi_UcZGjU
     https://backtobackswe.com/platform/content/avl-trees-rotations/solutions
     """
 
-    def __init__(self, value: int) -> None:
+    __slots__ = ("value", "data", "height", "left", "right")
+
+    def __init__(self, value: int, data=None) -> None:
         self.value: int = value
-        self.height: int = 0
+        self.data = data
+        self.height: int = 1
         self.left: Optional[AVLTreeNode] = None
         self.right: Optional[AVLTreeNode] = None
 
-    def create_tree(self, items: list, threshold: int) -> None:
-        if not items:
-            return
+    @classmethod
+    def from_iterable(cls, values: Iterable[int]) -> Optional[AVLTreeNode]:
+        """Build a perfectly balanced tree in O(n) from sorted values.
+
+        Unsorted values are sorted first. No rotations are needed, heights are
+        set bottom up. Returns None for no values.
+        """
+        values = sorted_values(values)
+        return cls._build_balanced(values, 0, len(values))
+
+    @classmethod
+    def _build_balanced(
+        cls, values: list[int], low: int, high: int
+    ) -> Optional[AVLTreeNode]:
+        if low >= high:
+            return None
+        middle = (low + high) // 2
+        node = cls(values[middle])
+        node.left = cls._build_balanced(values, low, middle)
+        node.right = cls._build_balanced(values, middle + 1, high)
+        cls.update(node)
+        return node
 
-        root = items[0]
-        for index in range(1, len(items)):  # omit slicing so we don't iterate twice
-            self.insert(root, items[index], threshold)
+    def merge(self, values: Iterable[int]) -> AVLTreeNode:
+        """Return a new balanced tree with values of this tree and new values.
 
-    def insert(self, node: AVLTreeNode, value: int, threshold: int) -> AVLTreeNode:
+        Both sequences are merged in order, so it costs O(n + m) for sorted
+        values. This tree stays unchanged.
+        """
+        values = heapq.merge(self.iter_inorder(), sorted_values(values))
+        return self.from_iterable(values)
+
+    @classmethod
+    def create_tree(
+        cls, items: Iterable[int], threshold: int = 1
+    ) -> Optional[AVLTreeNode]:
+        """Insert items one by one and return the root."""
+        root = None
+        for item in items:
+            root = cls.insert(root, item, threshold)
+        return root
+
+    @classmethod
+    def insert(
+        cls, node: Optional[AVLTreeNode], value: int, threshold: int = 1, data=None
+    ) -> AVLTreeNode:
         # return a child when we find a empty spot
         # (refactor of BinarySearchTreeNode.insert else statements)
         if not node:
-            return AVLTreeNode(value)
+            return cls(value, data)
 
         if value <= node.value:
-            node.left = node.left.insert(node.left, value, threshold)
+            node.left = cls.insert(node.left, value, threshold, data)
         else:
-            node.right = node.right.insert(node.right, value, threshold)
+            node.right = cls.insert(node.right, value, threshold, data)
+        return cls.rebalance(node, threshold)
+
+    @classmethod
+    def delete(
+        cls, node: Optional[AVLTreeNode], value: int, threshold: int = 1
+    ) -> Optional[AVLTreeNode]:
+        """Delete a value from the subtree and return its new root."""
+        if not node:
+            raise ValueError(f"{value} not in Tree")
 
-        node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
-        balance = self.get_balance(node)
+        if value < node.value:
+            node.left = cls.delete(node.left, value, threshold)
+        elif value > node.value:
+            node.right = cls.delete(node.right, value, threshold)
+        elif node.left is None:
+            return node.right
+        elif node.right is None:
+            return node.left
+        else:
+            # replace the node with the smallest node of its right subtree
+            successor = node.right.find_minimum()
+            node.right = cls.delete_minimum(node.right, threshold)
+            successor.left, successor.right = node.left, node.right
+            node = successor
+        return cls.rebalance(node, threshold)
+
+    @classmethod
+    def delete_minimum(
+        cls, node: AVLTreeNode, threshold: int = 1
+    ) -> Optional[AVLTreeNode]:
+        """Unlink the smallest node of the subtree and return its new root."""
+        if node.left is None:
+            return node.right
+        node.left = cls.delete_minimum(node.left, threshold)
+        return cls.rebalance(node, threshold)
+
+    def search(self, value: int) -> Optional[AVLTreeNode]:
+        """Return the node holding value or None."""
+        node = self
+        while node is not None:
+            if value == node.value:
+                return node
+            node = node.left if value < node.value else node.right
+        return None
 
-        if balance > threshold:
-            # left heavy - positive balance
-            if self.get_balance(node.left) >= 0:
-                # left node is left heavy ->
-                # only rotate right
-                node = self.rotate_right(node)
-            else:
-                # left node is right heavy ->
-                # rotate left then right (left_right rotation)
-                node = self.rotate_left_right(node)
-        elif balance < -threshold:
-            # right heavy - negative balance
-            if self.get_balance(node.right) <= 0:
-                # right node is right heavy ->
-                # rotate left
-                node = self.rotate_left(node)
-            else:
-                # right node is left heavy ->
-                # rotate right then left (right_left rotation)
-                node = self.rotate_right_left(node)
+    def find_minimum(self) -> AVLTreeNode:
+        node = self
+        while node.left is not None:
+            node = node.left
+        return node
+
+    def find_maximum(self) -> AVLTreeNode:
+        node = self
+        while node.right is not None:
+            node = node.right
         return node
 
+    def iter_inorder(self) -> Iterator[int]:
+        """Yield values of the subtree in order."""
+        for node in self._inorder_nodes():
+            yield node.value
+
+    def _inorder_nodes(self) -> Iterator[AVLTreeNode]:
+        return inorder_nodes(self)
+
     @staticmethod
     def get_height(node: AVLTreeNode) -> int:
         """Return height of a subtree if it exists."""
@@ -244,41 +682,169 @@ class AVLTreeNode:
             return 0
         return node.height
 
-    def get_balance(self, node: AVLTreeNode):
+    @classmethod
+    def get_balance(cls, node: AVLTreeNode):
         """Return the balance of a node's subtrees.
 
         positives - left heavy (left side is taller than right)
         0 - full balanced
         negatives - right heavy (right side is taller than left)
         """
-        return self.get_height(node.left) - self.get_height(node.right)
+        return cls.get_height(node.left) - cls.get_height(node.right)
+
+    @classmethod
+    def update(cls, node: AVLTreeNode) -> None:
+        """Recompute fields derived from the children of a node.
+
+        Called bottom up for every node whose children changed.
+        """
+        node.height = 1 + max(cls.get_height(node.left), cls.get_height(node.right))
+
+    @classmethod
+    def rebalance(cls, node: AVLTreeNode, threshold: int = 1) -> AVLTreeNode:
+        """Update a node with changed children and rotate it if unbalanced."""
+        cls.update(node)
+        balance = cls.get_balance(node)
+
+        if balance > threshold:
+            # left heavy - positive balance
+            if cls.get_balance(node.left) >= 0:
+                # left node is left heavy ->
+                # only rotate right
+                node = cls.rotate_right(node)
+            else:
+                # left node is right heavy ->
+                # rotate left then right (left_right rotation)
+                node = cls.rotate_left_right(node)
+        elif balance < -threshold:
+            # right heavy - negative balance
+            if cls.get_balance(node.right) <= 0:
+                # right node is right heavy ->
+                # rotate left
+                node = cls.rotate_left(node)
+            else:
+                # right node is left heavy ->
+                # rotate right then left (right_left rotation)
+                node = cls.rotate_right_left(node)
+        return node
 
-    def rotate_right(self, node: AVLTreeNode) -> AVLTreeNode:
+    @classmethod
+    def rotate_right(cls, node: AVLTreeNode) -> AVLTreeNode:
         """Rotate right and return root of the subtree."""
         child = node.left
         node.left = child.right
         child.right = node
 
-        node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
-        child.height = 1 + max(self.get_height(child.left), node.height)
+        cls.update(node)
+        cls.update(child)
         return child
 
-    def rotate_left(self, node: AVLTreeNode) -> AVLTreeNode:
+    @classmethod
+    def rotate_left(cls, node: AVLTreeNode) -> AVLTreeNode:
         """Rotate left and return root of the subtree."""
         child = node.right
         node.right = child.left
         child.left = node
 
-        node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
-        child.height = 1 + max(self.get_height(child.left), node.height)
+        cls.update(node)
+        cls.update(child)
         return child
 
-    def rotate_left_right(self, node: AVLTreeNode) -> AVLTreeNode:
+    @classmethod
+    def rotate_left_right(cls, node: AVLTreeNode) -> AVLTreeNode:
         """Rotate left then right."""
-        node.left = self.rotate_left(node.left)
-        return self.rotate_right(node)
+        node.left = cls.rotate_left(node.left)
+        return cls.rotate_right(node)
 
-    def rotate_right_left(self, node: AVLTreeNode) -> AVLTreeNode:
+    @classmethod
+    def rotate_right_left(cls, node: AVLTreeNode) -> AVLTreeNode:
         """Rotate right then left."""
-        node.right = self.rotate_right(node.right)
-        return self.rotate_left(node)
+        node.right = cls.rotate_right(node.right)
+        return cls.rotate_left(node)
+
+
+class AVLTree:
+    """Ordered map stored in an AVL tree.
+
+    Keys are kept in order, so besides O(log n) lookups, updates and deletes
+    the map gives its smallest and biggest key and iterates keys in order.
+    """
+
+    node_class = AVLTreeNode
+
+    def __init__(self, items: Iterable = (), threshold: int = 1) -> None:
+        if threshold < 1:
+            raise ValueError(f"Threshold has to be at least 1, not {threshold}")
+        self.root: Optional[AVLTreeNode] = None
+        self.threshold = threshold
+        self.length = 0
+        for key, value in items:
+            self[key] = value
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, key) -> bool:
+        return self._search(key) is not None
+
+    def __getitem__(self, key):
+        node = self._search(key)
+        if node is None:
+            raise KeyError(key)
+        return node.data
+
+    def __setitem__(self, key, value) -> None:
+        node = self._search(key)
+        if node is not None:
+            node.data = value
+            return
+        self.root = self.node_class.insert(self.root, key, self.threshold, value)
+        self.length += 1
+
+    def __delitem__(self, key) -> None:
+        if self._search(key) is None:
+            raise KeyError(key)
+        self.root = self.node_class.delete(self.root, key, self.threshold)
+        self.length -= 1
+
+    def __iter__(self) -> Iterator:
+        for node in self._nodes():
+            yield node.value
+
+    def items(self) -> Iterator[tuple]:
+        for node in self._nodes():
+            yield node.value, node.data
+
+    def values(self) -> Iterator:
+        for node in self._nodes():
+            yield node.data
+
+    def get(self, key, default=None):
+        node = self._search(key)
+        return default if node is None else node.data
+
+    def minimum(self):
+        """Return the smallest key."""
+        if self.root is None:
+            raise ValueError("Tree is empty")
+        return self.root.find_minimum().value
+
+    def maximum(self):
+        """Return the biggest key."""
+        if self.root is None:
+            raise ValueError("Tree is empty")
+        return self.root.find_maximum().value
+
+    @property
+    def height(self) -> int:
+        return self.node_class.get_height(self.root)
+
+    def _search(self, key) -> Optional[AVLTreeNode]:
+        if self.root is None:
+            return None
+        return self.root.search(key)
+
+    def _nodes(self) -> Iterator[AVLTreeNode]:
+        if self.root is None:
+            return iter(())
+        return self.root._inorder_nodes()
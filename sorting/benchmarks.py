@@ -0,0 +1,220 @@
+"""
+Benchmarks of the sorters on standard input distributions.
+
+Every sorter runs on seeded inputs of given sizes. A run records wall time,
+number of comparisons and swaps and peak memory traced with tracemalloc, the
+results are written as JSON and can be compared against a stored baseline:
+
+    python -m sorting.benchmarks --sizes 1000 100000 --output current.json
+    python -m sorting.benchmarks --baseline current.json --threshold 0.2
+
+The command exits with status 1 when any metric got worse than the baseline by
+more than the threshold.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from math import isqrt
+from typing import Callable, Iterable, Optional
+
+from .instrumentation import SortStats
+from .mergesort import BottomUpMergeSort, MergeSort, NaturalMergeSort
+from .quicksort import IntroSort, QuickSortHoare, QuickSortLomuto
+
+
+def random_values(size: int, rng: random.Random) -> list:
+    return [rng.randrange(size) for _ in range(size)]
+
+
+def sorted_values(size: int, rng: random.Random) -> list:
+    return list(range(size))
+
+
+def reversed_values(size: int, rng: random.Random) -> list:
+    return list(range(size, 0, -1))
+
+
+def organ_pipe_values(size: int, rng: random.Random) -> list:
+    middle = size // 2
+    return list(range(middle)) + list(range(size - middle, 0, -1))
+
+
+def few_unique_values(size: int, rng: random.Random) -> list:
+    return [rng.randrange(10) for _ in range(size)]
+
+
+def sawtooth_values(size: int, rng: random.Random) -> list:
+    period = max(2, isqrt(size))
+    return [index % period for index in range(size)]
+
+
+def nearly_sorted_values(size: int, rng: random.Random) -> list:
+    values = list(range(size))
+    for _ in range(max(1, size // 100)):
+        first, second = rng.randrange(size), rng.randrange(size)
+        values[first], values[second] = values[second], values[first]
+    return values
+
+
+DISTRIBUTIONS = {
+    "random": random_values,
+    "sorted": sorted_values,
+    "reversed": reversed_values,
+    "organ pipe": organ_pipe_values,
+    "few unique": few_unique_values,
+    "sawtooth": sawtooth_values,
+    "nearly sorted": nearly_sorted_values,
+}
+
+SORTERS = {
+    sorter.__name__: sorter
+    for sorter in (
+        QuickSortLomuto,
+        QuickSortHoare,
+        IntroSort,
+        MergeSort,
+        BottomUpMergeSort,
+        NaturalMergeSort,
+    )
+}
+
+SIZES = (10**3, 10**4, 10**5)
+
+METRICS = ("seconds", "comparisons", "swaps", "peak_memory", "allocated_items")
+
+
+def generate(distribution: str, size: int, seed: int) -> list:
+    """Return the same input for the same distribution, size and seed."""
+    return DISTRIBUTIONS[distribution](size, random.Random(f"{seed}:{size}"))
+
+
+def measure(sorter_class: type, values: list, counts: bool, memory: bool) -> dict:
+    """Run one sorter on copies of values and return its metrics."""
+    sorter = sorter_class()
+    start = time.perf_counter()
+    sorter.sort(list(values))
+    result = {"seconds": time.perf_counter() - start}
+
+    if counts:
+        stats = SortStats()
+        sorter_class(stats=stats).sort(list(values))
+        result["comparisons"] = stats.comparisons
+        result["swaps"] = stats.swaps
+        result["max_depth"] = stats.max_depth
+        result["allocated_items"] = stats.allocated_items
+
+    if memory:
+        copy = list(values)
+        tracemalloc.start()
+        try:
+            sorter.sort(copy)
+            result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run(
+    sorters: Iterable[str] = tuple(SORTERS),
+    distributions: Iterable[str] = tuple(DISTRIBUTIONS),
+    sizes: Iterable[int] = SIZES,
+    seed: int = 0,
+    counts: bool = True,
+    memory: bool = True,
+    log: Optional[Callable] = None,
+) -> list[dict]:
+    """Benchmark every sorter on every distribution and size."""
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            values = generate(distribution, size, seed)
+            for name in sorters:
+                result = {"sorter": name, "distribution": distribution, "size": size}
+                try:
+                    result.update(measure(SORTERS[name], values, counts, memory))
+                except RecursionError:
+                    result["error"] = "RecursionError"
+                results.append(result)
+                if log:
+                    log(result)
+    return results
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> list:
+    """Return (result, metric, baseline value) of metrics worse than baseline."""
+    previous = {
+        (item["sorter"], item["distribution"], item["size"]): item for item in baseline
+    }
+    regressions = []
+    for result in results:
+        reference = previous.get(
+            (result["sorter"], result["distribution"], result["size"])
+        )
+        if reference is None:
+            continue
+        if "error" in result and "error" not in reference:
+            regressions.append((result, "error", None))
+            continue
+        for metric in METRICS:
+            if metric not in result or not reference.get(metric):
+                continue
+            if result[metric] > reference[metric] * (1 + threshold):
+                regressions.append((result, metric, reference[metric]))
+    return regressions
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sorters", nargs="+", choices=SORTERS, default=list(SORTERS))
+    parser.add_argument(
+        "--distributions",
+        nargs="+",
+        choices=DISTRIBUTIONS,
+        default=list(DISTRIBUTIONS),
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-counts", action="store_true")
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare results with this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    options = parser.parse_args(arguments)
+
+    results = run(
+        options.sorters,
+        options.distributions,
+        options.sizes,
+        options.seed,
+        counts=not options.no_counts,
+        memory=not options.no_memory,
+        log=lambda result: print(json.dumps(result), file=sys.stderr),
+    )
+    report = {
+        "python": platform.python_version(),
+        "seed": options.seed,
+        "results": results,
+    }
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if not options.baseline:
+        return 0
+    with open(options.baseline) as file:
+        baseline = json.load(file)["results"]
+    regressions = compare(results, baseline, options.threshold)
+    for result, metric, reference in regressions:
+        print(
+            f"{result['sorter']} on {result['size']} {result['distribution']}"
+            f" values: {metric} {result.get(metric)} (baseline {reference})",
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+from .quicksort import IntroSort
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional
+    numpy = None
+
+# native memoryview formats of fixed width numbers
+NUMERIC_FORMATS = frozenset("bBhHiIlLqQnNfd")
+
+
+class TypedBufferSort(IntroSort):
+    """
+    In place sort of fixed width numbers stored in typed buffers.
+
+    `array.array`, `bytearray`, `mmap` and any other writable one dimensional
+    buffer of native numbers are sorted with introsort through a typed
+    memoryview, so values are never copied into a list of Python objects.
+
+    NumPy arrays (when NumPy is installed) are partitioned in bulk: every range
+    is split with vectorised three way partition around a median of three
+    pivot and ranges of up to `numpy_threshold` elements are finished with
+    `ndarray.sort`.
+    """
+
+    numpy_threshold = 1024
+
+    def sort(self, buffer, strategy: str = "median of three pivot"):
+        if numpy is not None and isinstance(buffer, numpy.ndarray):
+            return self.sort_ndarray(buffer)
+
+        values = self.typed_view(buffer)
+        try:
+            length = len(values)
+            if values.format in "fd":
+                length = self.move_nans_to_end(values)
+            self.quicksort(values, 0, length - 1, strategy)
+        finally:
+            values.release()
+        return buffer
+
+    @staticmethod
+    def typed_view(buffer) -> memoryview:
+        """Return a writable one dimensional memoryview of numbers."""
+        view = memoryview(buffer)
+        if view.readonly:
+            view.release()
+            raise TypeError(f"{type(buffer).__name__} buffer is read only!")
+        if view.ndim != 1:
+            view.release()
+            raise ValueError("Only one dimensional buffers can be sorted!")
+
+        typecode = view.format.removeprefix("@")
+        if typecode not in NUMERIC_FORMATS:
+            view.release()
+            raise TypeError(f"Buffer format {view.format!r} is not a native number!")
+        if typecode != view.format:
+            return view.cast("B").cast(typecode)
+        return view
+
+    @staticmethod
+    def move_nans_to_end(values: memoryview) -> int:
+        """Move NaNs behind the numbers like numpy.sort, return count of numbers.
+
+        NaNs compare false with everything, so they can't stay among the values
+        being sorted. Numbers keep their order, NaNs are swapped, not rewritten.
+        """
+        length = 0
+        for index in range(len(values)):
+            value = values[index]
+            if value == value:
+                values[index], values[length] = values[length], value
+                length += 1
+        return length
+
+    def sort_ndarray(self, values):
+        """Sort a one dimensional NumPy array in place."""
+        if values.ndim != 1:
+            raise ValueError("Only one dimensional buffers can be sorted!")
+        if not values.flags.writeable:
+            raise TypeError(f"{type(values).__name__} buffer is read only!")
+
+        length = len(values)
+        if values.dtype.kind == "f":
+            # NaNs compare false with everything, move them to the end like
+            # numpy.sort does and sort the rest
+            nan_mask = numpy.isnan(values)
+            if nan_mask.any():
+                numbers = values[~nan_mask]
+                length = len(numbers)
+                values[:length] = numbers
+                values[length:] = numpy.nan
+
+        max_depth = 2 * length.bit_length()
+        stack = [(0, length, 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            segment = values[low:high]
+            if high - low <= self.numpy_threshold or depth > max_depth:
+                segment.sort()
+                continue
+
+            pivot = numpy.sort(segment[[0, (high - low) // 2, -1]])[1]
+            lower = segment[segment < pivot]
+            upper = segment[segment > pivot]
+            equal_start = len(lower)
+            equal_end = len(segment) - len(upper)
+            segment[:equal_start] = lower
+            segment[equal_start:equal_end] = pivot
+            segment[equal_end:] = upper
+            stack.append((low, low + equal_start, depth + 1))
+            stack.append((low + equal_end, high, depth + 1))
+        return values
@@ -0,0 +1,123 @@
+import heapq
+import mmap
+import os
+import tempfile
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from .mergesort import BottomUpMergeSort
+
+# a list slot plus a boxed int/float held while a chunk is sorted in memory
+BOXED_ITEM_SIZE = 40
+
+
+class ExternalMergeSort:
+    """
+    External (out-of-core) merge sort for numbers.
+
+    The input is consumed in chunks which fit in `max_memory` bytes, every chunk
+    is sorted with an in-memory sorter and spilled to a temporary file as packed
+    machine values (an `array` typecode). The sorted runs are memory mapped and
+    merged with a heap, at most `fan_in` runs at a time, and the result is
+    streamed out as a generator.
+
+    Based on:
+    https://en.wikipedia.org/wiki/External_sorting#External_merge_sort
+    """
+
+    def __init__(
+        self,
+        max_memory: int = 64 * 1024 * 1024,
+        fan_in: int = 64,
+        typecode: str = "q",
+        sorter=None,
+        directory: Optional[str] = None,
+    ) -> None:
+        if fan_in < 2:
+            raise ValueError(f"fan_in has to be at least 2, got {fan_in}!")
+        self.max_memory = max_memory
+        self.fan_in = fan_in
+        self.typecode = typecode
+        self.sorter = sorter or BottomUpMergeSort()
+        self.directory = directory
+        self.itemsize = array(typecode).itemsize
+        self.chunk_size = max(1, max_memory // (self.itemsize + BOXED_ITEM_SIZE))
+
+    def sort(self, source) -> Iterator:
+        """
+        Yield values of the source in ascending order.
+
+        `source` is either an iterable of numbers or a binary file object with
+        values packed with the sorter's typecode.
+        """
+        with tempfile.TemporaryDirectory(dir=self.directory) as directory:
+            runs = [self.spill(chunk, directory) for chunk in self.read_chunks(source)]
+            while len(runs) > self.fan_in:
+                runs = self.merge_pass(runs, directory)
+            yield from self.merge_runs(runs)
+
+    def read_chunks(self, source) -> Iterator[array]:
+        """Split the source into arrays of at most `chunk_size` values."""
+        if hasattr(source, "read"):
+            while True:
+                data = source.read(self.chunk_size * self.itemsize)
+                if not data:
+                    return
+                chunk = array(self.typecode)
+                chunk.frombytes(data)
+                yield chunk
+
+        iterator = iter(source)
+        while True:
+            chunk = array(self.typecode, islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def spill(self, chunk: array, directory: str) -> str:
+        """Sort a chunk and write it to a new run file."""
+        values = self.sorter.sort(chunk.tolist())
+        return self.write_run(values, directory)
+
+    def write_run(self, values: Iterable, directory: str) -> str:
+        """Write values to a new run file in buffered batches."""
+        descriptor, path = tempfile.mkstemp(suffix=".run", dir=directory)
+        with os.fdopen(descriptor, "wb") as file:
+            iterator = iter(values)
+            while True:
+                batch = array(self.typecode, islice(iterator, self.chunk_size))
+                if not batch:
+                    break
+                batch.tofile(file)
+        return path
+
+    def merge_pass(self, runs: list[str], directory: str) -> list[str]:
+        """Merge groups of `fan_in` runs into longer runs."""
+        merged_runs = []
+        for start in range(0, len(runs), self.fan_in):
+            group = runs[start : start + self.fan_in]
+            merged_runs.append(self.write_run(self.merge_runs(group), directory))
+            for path in group:
+                os.remove(path)
+        return merged_runs
+
+    def merge_runs(self, runs: list[str]) -> Iterator:
+        """Heap based k-way merge of memory mapped runs."""
+        readers = [self.read_run(path) for path in runs]
+        try:
+            yield from heapq.merge(*readers)
+        finally:
+            for reader in readers:
+                reader.close()
+
+    def read_run(self, path: str) -> Iterator:
+        """Yield values of a run file straight from its memory map."""
+        with open(path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            values = memoryview(mapped).cast(self.typecode)
+            try:
+                yield from values
+            finally:
+                values.release()
@@ -0,0 +1,123 @@
+from collections import Counter
+from functools import wraps
+from typing import Callable, Iterable
+
+
+class SortStats:
+    """
+    Counters collected from the internals of a sorter.
+
+    Attach an instance to a sorter (`IntroSort(stats=SortStats())`) to count
+    comparisons, writes of elements into the sorted list, partition sizes,
+    the histogram of partition/recursion depths and buffer allocations.
+    Sorters without stats run their plain code paths.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.comparisons = 0
+        self.writes = 0
+        self.partition_sizes = []
+        self.depths = Counter()
+        self.allocations = 0
+        self.allocated_items = 0
+
+    @property
+    def swaps(self) -> int:
+        """Swaps are counted as two element writes."""
+        return self.writes // 2
+
+    @property
+    def max_depth(self) -> int:
+        return max(self.depths, default=0)
+
+    def record_partition(self, size: int, depth: int) -> None:
+        self.partition_sizes.append(size)
+        self.depths[depth] += 1
+
+    def record_allocation(self, size: int) -> None:
+        self.allocations += 1
+        self.allocated_items += size
+
+    def as_dict(self) -> dict:
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "writes": self.writes,
+            "partitions": len(self.partition_sizes),
+            "max_depth": self.max_depth,
+            "depths": dict(sorted(self.depths.items())),
+            "allocations": self.allocations,
+            "allocated_items": self.allocated_items,
+        }
+
+
+class CountingItem:
+    """Element counting every comparison it takes part in."""
+
+    __slots__ = ("value", "stats")
+
+    def __init__(self, value, stats: SortStats) -> None:
+        self.value = value
+        self.stats = stats
+
+    def __lt__(self, other: "CountingItem") -> bool:
+        self.stats.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: "CountingItem") -> bool:
+        self.stats.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: "CountingItem") -> bool:
+        self.stats.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: "CountingItem") -> bool:
+        self.stats.comparisons += 1
+        return self.value >= other.value
+
+
+class CountingList(list):
+    """List counting element writes made through indexing."""
+
+    def __init__(self, values: Iterable, stats: SortStats) -> None:
+        super().__init__(values)
+        self.stats = stats
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            self.stats.writes += len(value)
+        else:
+            self.stats.writes += 1
+        super().__setitem__(index, value)
+
+
+def instrumented(sort: Callable) -> Callable:
+    """
+    Count comparisons and writes of a sort method when stats are attached.
+
+    Without stats the method is called directly. With stats the elements are
+    wrapped in counting items inside a counting list, so the sorting code
+    itself stays the same, and unwrapped afterwards.
+    """
+
+    @wraps(sort)
+    def wrapper(self, elements, *args, **kwargs):
+        if self.stats is None:
+            return sort(self, elements, *args, **kwargs)
+
+        items = CountingList(
+            (CountingItem(value, self.stats) for value in elements), self.stats
+        )
+        result = sort(self, items, *args, **kwargs)
+        values = [item.value for item in result]
+        if result is items:
+            elements[:] = values
+            return elements
+        return values
+
+    return wrapper
@@ -0,0 +1,54 @@
+from functools import wraps
+from typing import Callable, Optional
+
+
+def keyed(sort: Callable) -> Callable:
+    """
+    Add `key` and `reverse` keyword arguments to a sort method.
+
+    Keys are computed once per element and the method sorts (key, index) pairs
+    (decorate-sort-undecorate), the index keeps equal keys in input order and
+    the values themselves are never compared. For `reverse` the values are
+    reversed before and after sorting, so a stable sorter stays stable, like
+    `sorted(..., reverse=True)`.
+
+    Sorters working in place keep doing so, the result is written back to the
+    given list.
+
+    Based on:
+    https://docs.python.org/3/howto/sorting.html#decorate-sort-undecorate
+    """
+
+    @wraps(sort)
+    def wrapper(
+        self,
+        elements,
+        *args,
+        key: Optional[Callable] = None,
+        reverse: bool = False,
+        **kwargs,
+    ):
+        if key is None and not reverse:
+            return sort(self, elements, *args, **kwargs)
+
+        values = list(elements)
+        if reverse:
+            values.reverse()
+
+        if key is None:
+            result = sort(self, values, *args, **kwargs)
+            in_place = result is values
+        else:
+            decorated = [(key(value), index) for index, value in enumerate(values)]
+            result = sort(self, decorated, *args, **kwargs)
+            in_place = result is decorated
+            result = [values[index] for _, index in result]
+
+        if reverse:
+            result.reverse()
+        if in_place:
+            elements[:] = result
+            return elements
+        return result
+
+    return wrapper
@@ -1,3 +1,10 @@
+from bisect import bisect_left, bisect_right
+from typing import Callable, Iterable, Optional
+
+from .instrumentation import CountingList, SortStats, instrumented
+from .keys import keyed
+
+
 class MergeSort:
     """
     Merge sort algorithm based on:
@@ -5,23 +12,39 @@ class MergeSort:
     https://youtu.be/cVZMah9kEjI
     https://en.wikipedia.org/wiki/Merge_sort#Top-down_implementation
     """
+    def __init__(self, stats: Optional[SortStats] = None) -> None:
+        self.stats = stats
+
+    def new_buffer(self, values: Iterable) -> list:
+        """Return a list of values counting its writes when stats are attached."""
+        if self.stats is None:
+            return list(values)
+        return CountingList(values, self.stats)
+
+    @keyed
+    @instrumented
     def sort(self, elements: list) -> list:
         return self.divide(elements)
 
-    def divide(self, elements: list):
+    def divide(self, elements: list, depth: int = 0):
         length = len(elements)
-        if length == 1:
+        if length <= 1:
             return elements
 
         middle = length // 2
         left, right = elements[:middle], elements[middle:]
-        # print(f'{left=}, {right=}')
 
-        left = self.divide(left)
-        right = self.divide(right)
+        left = self.divide(left, depth + 1)
+        right = self.divide(right, depth + 1)
 
         merged = self.merge(left, right)
-        # print(f'{merged=}')
+        if self.stats is not None:
+            # every element is written once into the merged list
+            self.stats.writes += length
+            # halves sliced off and the merged list
+            self.stats.record_partition(length, depth)
+            self.stats.record_allocation(length)
+            self.stats.record_allocation(length)
 
         return merged
 
@@ -32,7 +55,7 @@ class MergeSort:
         while left_index < len(left) and right_index < len(right):
             left_value = left[left_index]
             right_value = right[right_index]
-            if left_value < right_value:
+            if left_value <= right_value:
                 merged.append(left_value)
                 left_index += 1
             else:
@@ -46,3 +69,371 @@ class MergeSort:
             merged.extend(right[right_index:])
 
         return merged
+
+
+class BottomUpMergeSort(MergeSort):
+    """
+    Iterative merge sort without recursion and slicing.
+
+    Runs of width 1, 2, 4, ... are merged by index ranges back and forth
+    between a copy of the input and one auxiliary buffer of the same size.
+    Runs which are already in order are copied without merging.
+
+    Based on:
+    https://en.wikipedia.org/wiki/Merge_sort#Bottom-up_implementation
+    """
+
+    @keyed
+    @instrumented
+    def sort(self, elements: list) -> list:
+        source = self.new_buffer(elements)
+        length = len(source)
+        target = self.new_buffer([None] * length)
+        if self.stats is not None:
+            self.stats.record_allocation(length)
+            self.stats.record_allocation(length)
+
+        width, depth = 1, 0
+        while width < length:
+            for low in range(0, length, 2 * width):
+                middle = min(low + width, length)
+                high = min(low + 2 * width, length)
+                self.merge_ranges(source, target, low, middle, high)
+                if self.stats is not None:
+                    # the pass is the depth of the merge
+                    self.stats.record_partition(high - low, depth)
+            source, target = target, source
+            width, depth = width * 2, depth + 1
+        return source
+
+    @staticmethod
+    def merge_ranges(
+        source: list, target: list, low: int, middle: int, high: int
+    ) -> None:
+        """Merge source[low:middle] with source[middle:high] into target.
+
+        Elements are copied one by one, slices would allocate temporary lists.
+        """
+        if middle == high or source[middle - 1] <= source[middle]:
+            for index in range(low, high):
+                target[index] = source[index]
+            return
+
+        left_index, right_index, current_index = low, middle, low
+        while left_index < middle and right_index < high:
+            left_value = source[left_index]
+            right_value = source[right_index]
+            if left_value <= right_value:
+                target[current_index] = left_value
+                left_index += 1
+            else:
+                target[current_index] = right_value
+                right_index += 1
+            current_index += 1
+
+        # copy what is left of either run
+        if left_index < middle:
+            rest = range(left_index, middle)
+        else:
+            rest = range(right_index, high)
+        for index in rest:
+            target[current_index] = source[index]
+            current_index += 1
+
+
+class NaturalMergeSort(MergeSort):
+    """
+    Run-adaptive merge sort (simplified TimSort).
+
+    The input is split into natural runs (non-descending or strictly
+    descending, the latter reversed in place), runs shorter than `min_run` are
+    extended with binary insertion sort and pushed on a stack which keeps the
+    TimSort invariants, so merged runs stay balanced. Merges switch to
+    galloping after `min_gallop` consecutive wins of one side, so already
+    ordered input is sorted in close to O(n) comparisons.
+
+    Based on:
+    https://github.com/python/cpython/blob/main/Objects/listsort.txt
+    https://en.wikipedia.org/wiki/Timsort
+    """
+
+    min_gallop = 7
+
+    @keyed
+    @instrumented
+    def sort(self, elements: list) -> list:
+        result = self.new_buffer(elements)
+        length = len(result)
+        if self.stats is not None:
+            self.stats.record_allocation(length)
+        if length < 2:
+            return result
+
+        min_run = self.compute_min_run(length)
+        # stack of (start, length, merges below) of runs, natural runs have
+        # no merges below them
+        runs = []
+        low = 0
+        while low < length:
+            run_length = self.count_run(result, low, length)
+            if run_length < min_run:
+                forced_length = min(min_run, length - low)
+                self.binary_insertion_sort(
+                    result, low, low + forced_length, low + run_length
+                )
+                run_length = forced_length
+            runs.append((low, run_length, 0))
+            self.merge_collapse(result, runs)
+            low += run_length
+
+        self.merge_force_collapse(result, runs)
+        return result
+
+    @staticmethod
+    def compute_min_run(length: int) -> int:
+        """Return a run length between 32 and 64 which splits length evenly."""
+        remainder = 0
+        while length >= 64:
+            remainder |= length & 1
+            length >>= 1
+        return length + remainder
+
+    @staticmethod
+    def count_run(elements: list, low: int, high: int) -> int:
+        """Return length of the run starting at low, reversing descending runs."""
+        run_high = low + 1
+        if run_high == high:
+            return 1
+
+        if elements[run_high] < elements[low]:
+            # strictly descending, so reversing it keeps the sort stable
+            while run_high + 1 < high and elements[run_high + 1] < elements[run_high]:
+                run_high += 1
+            elements[low : run_high + 1] = elements[low : run_high + 1][::-1]
+        else:
+            while run_high + 1 < high and elements[run_high] <= elements[run_high + 1]:
+                run_high += 1
+        return run_high - low + 1
+
+    @staticmethod
+    def binary_insertion_sort(elements: list, low: int, high: int, start: int) -> None:
+        """Sort elements[low:high] in place, elements[low:start] are sorted."""
+        for index in range(start, high):
+            value = elements[index]
+            position = bisect_right(elements, value, low, index)
+            elements[position + 1 : index + 1] = elements[position:index]
+            elements[position] = value
+
+    def merge_collapse(self, elements: list, runs: list) -> None:
+        """Merge runs on top of the stack until TimSort invariants hold."""
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or (
+                n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]
+            ):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self.merge_at(elements, runs, n)
+
+    def merge_force_collapse(self, elements: list, runs: list) -> None:
+        """Merge all remaining runs into one."""
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self.merge_at(elements, runs, n)
+
+    def merge_at(self, elements: list, runs: list, index: int) -> None:
+        """Merge the runs at index and index + 1 of the run stack."""
+        base_a, length_a, merges_a = runs[index]
+        base_b, length_b, merges_b = runs[index + 1]
+        depth = max(merges_a, merges_b)
+        runs[index] = (base_a, length_a + length_b, depth + 1)
+        del runs[index + 1]
+        if self.stats is not None:
+            # merges of natural runs are the first pass
+            self.stats.record_partition(length_a + length_b, depth)
+
+        # leading elements of A and trailing elements of B are already in place
+        start = self.gallop(
+            bisect_right, elements[base_b], elements, base_a, base_a + length_a
+        )
+        length_a -= start - base_a
+        base_a = start
+        if length_a == 0:
+            return
+        end = self.gallop(
+            bisect_left,
+            elements[base_a + length_a - 1],
+            elements,
+            base_b,
+            base_b + length_b,
+            from_right=True,
+        )
+        length_b = end - base_b
+        if length_b == 0:
+            return
+
+        if length_a <= length_b:
+            self.merge_low(elements, base_a, length_a, base_b, length_b)
+        else:
+            self.merge_high(elements, base_a, length_a, base_b, length_b)
+
+    def merge_low(
+        self, elements: list, base_a: int, length_a: int, base_b: int, length_b: int
+    ) -> None:
+        """Merge adjacent runs A <= B from the left, using a copy of A."""
+        temp = elements[base_a : base_a + length_a]
+        if self.stats is not None:
+            self.stats.record_allocation(length_a)
+        left_index, right_index, current_index = 0, base_b, base_a
+        end_b = base_b + length_b
+        min_gallop = self.min_gallop
+
+        while left_index < length_a and right_index < end_b:
+            count_a = count_b = 0
+            while left_index < length_a and right_index < end_b:
+                if elements[right_index] < temp[left_index]:
+                    elements[current_index] = elements[right_index]
+                    right_index += 1
+                    count_a, count_b = 0, count_b + 1
+                else:
+                    elements[current_index] = temp[left_index]
+                    left_index += 1
+                    count_a, count_b = count_a + 1, 0
+                current_index += 1
+                if count_a >= min_gallop or count_b >= min_gallop:
+                    break
+
+            # galloping mode - copy whole blocks while it pays off
+            while left_index < length_a and right_index < end_b:
+                index = self.gallop(
+                    bisect_right, elements[right_index], temp, left_index, length_a
+                )
+                count_a = index - left_index
+                elements[current_index : current_index + count_a] = temp[
+                    left_index:index
+                ]
+                current_index += count_a
+                left_index = index
+                if left_index == length_a:
+                    break
+
+                index = self.gallop(
+                    bisect_left, temp[left_index], elements, right_index, end_b
+                )
+                count_b = index - right_index
+                elements[current_index : current_index + count_b] = elements[
+                    right_index:index
+                ]
+                current_index += count_b
+                right_index = index
+                if count_a < min_gallop and count_b < min_gallop:
+                    break
+
+        # what is left of B is already in place
+        if left_index < length_a:
+            elements[current_index:end_b] = temp[left_index:]
+
+    def merge_high(
+        self, elements: list, base_a: int, length_a: int, base_b: int, length_b: int
+    ) -> None:
+        """Merge adjacent runs A > B from the right, using a copy of B."""
+        temp = elements[base_b : base_b + length_b]
+        if self.stats is not None:
+            self.stats.record_allocation(length_b)
+        left_index, right_index = base_a + length_a - 1, length_b - 1
+        current_index = base_b + length_b - 1
+        min_gallop = self.min_gallop
+
+        while left_index >= base_a and right_index >= 0:
+            count_a = count_b = 0
+            while left_index >= base_a and right_index >= 0:
+                if temp[right_index] < elements[left_index]:
+                    elements[current_index] = elements[left_index]
+                    left_index -= 1
+                    count_a, count_b = count_a + 1, 0
+                else:
+                    elements[current_index] = temp[right_index]
+                    right_index -= 1
+                    count_a, count_b = 0, count_b + 1
+                current_index -= 1
+                if count_a >= min_gallop or count_b >= min_gallop:
+                    break
+
+            # galloping mode - copy whole blocks while it pays off
+            while left_index >= base_a and right_index >= 0:
+                index = self.gallop(
+                    bisect_right,
+                    temp[right_index],
+                    elements,
+                    base_a,
+                    left_index + 1,
+                    from_right=True,
+                )
+                count_a = left_index + 1 - index
+                elements[current_index - count_a + 1 : current_index + 1] = elements[
+                    index : left_index + 1
+                ]
+                current_index -= count_a
+                left_index = index - 1
+                if left_index < base_a:
+                    break
+
+                index = self.gallop(
+                    bisect_left,
+                    elements[left_index],
+                    temp,
+                    0,
+                    right_index + 1,
+                    from_right=True,
+                )
+                count_b = right_index + 1 - index
+                elements[current_index - count_b + 1 : current_index + 1] = temp[
+                    index : right_index + 1
+                ]
+                current_index -= count_b
+                right_index = index - 1
+                if count_a < min_gallop and count_b < min_gallop:
+                    break
+
+        # what is left of A is already in place
+        if right_index >= 0:
+            elements[base_a : base_a + right_index + 1] = temp[: right_index + 1]
+
+    @staticmethod
+    def gallop(
+        search: Callable,
+        key,
+        elements: list,
+        low: int,
+        high: int,
+        from_right: bool = False,
+    ) -> int:
+        """
+        Exponential search for the insertion point of key in elements[low:high].
+
+        `search` is bisect_left or bisect_right. Probes are taken 1, 2, 4, ...
+        positions away from one end and the bracketed range is then bisected.
+        """
+        step = 1
+        if from_right:
+            last = high
+            while high - step >= low:
+                probe = high - step
+                if search(elements, key, probe, probe + 1) > probe:
+                    return search(elements, key, probe + 1, last)
+                last = probe
+                step *= 2
+            return search(elements, key, low, last)
+
+        last = low
+        while low + step - 1 < high:
+            probe = low + step - 1
+            if search(elements, key, probe, probe + 1) == probe:
+                return search(elements, key, last, probe)
+            last = probe + 1
+            step *= 2
+        return search(elements, key, last, high)
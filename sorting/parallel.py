@@ -0,0 +1,165 @@
+import heapq
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+from .quicksort import IntroSort
+
+
+class ParallelSort:
+    """
+    Multi-core sort of numbers using a process pool and shared memory.
+
+    Values are packed into a `multiprocessing.shared_memory` block, so workers
+    attach to it by name instead of receiving pickled copies. Every worker sorts
+    one chunk in place, then the output is split by sampled splitter values
+    into segments which the workers k-way merge in parallel straight into a
+    second shared block. Inputs shorter than `threshold` are sorted in process.
+
+    Based on:
+    https://en.wikipedia.org/wiki/Samplesort
+    https://en.wikipedia.org/wiki/Merge_sort#Parallel_multiway_merge_sort
+    """
+
+    oversampling = 8
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        threshold: int = 100_000,
+        typecode: str = "q",
+        sorter=None,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self.typecode = typecode
+        self.sorter = sorter or IntroSort()
+
+    def sort(self, elements) -> list:
+        if len(elements) < max(self.threshold, 2) or self.workers < 2:
+            return self.sorter.sort(list(elements))
+
+        values = array(self.typecode, elements)
+        size = len(values) * values.itemsize
+        source = SharedMemory(create=True, size=size)
+        target = SharedMemory(create=True, size=size)
+        try:
+            source.buf[:size] = memoryview(values).cast("B")
+            del values
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                chunks = self.sort_chunks(executor, source.name, len(elements))
+                self.merge_chunks(executor, source, target.name, chunks)
+            result = target.buf[:size].cast(self.typecode)
+            try:
+                return result.tolist()
+            finally:
+                result.release()
+        finally:
+            for block in (source, target):
+                block.close()
+                block.unlink()
+
+    def sort_chunks(
+        self, executor: ProcessPoolExecutor, name: str, length: int
+    ) -> list[tuple[int, int]]:
+        """Sort equal chunks of the shared block in parallel."""
+        step = -(-length // self.workers)
+        chunks = [(low, min(low + step, length)) for low in range(0, length, step)]
+        futures = [
+            executor.submit(_sort_chunk, name, self.typecode, low, high, self.sorter)
+            for low, high in chunks
+        ]
+        for future in futures:
+            future.result()
+        return chunks
+
+    def merge_chunks(
+        self,
+        executor: ProcessPoolExecutor,
+        source: SharedMemory,
+        target_name: str,
+        chunks: list[tuple[int, int]],
+    ) -> None:
+        """Split sorted chunks by splitter values and merge the parts in parallel."""
+        values = source.buf.cast(self.typecode)
+        try:
+            splitters = self.choose_splitters(values, chunks)
+            # bounds[c][s] - first index of chunk c which belongs to segment s
+            bounds = [
+                [low]
+                + [bisect_left(values, splitter, low, high) for splitter in splitters]
+                + [high]
+                for low, high in chunks
+            ]
+        finally:
+            values.release()
+
+        futures = []
+        offset = 0
+        for segment in range(len(splitters) + 1):
+            ranges = [(bound[segment], bound[segment + 1]) for bound in bounds]
+            futures.append(
+                executor.submit(
+                    _merge_ranges,
+                    source.name,
+                    target_name,
+                    self.typecode,
+                    ranges,
+                    offset,
+                )
+            )
+            offset += sum(high - low for low, high in ranges)
+        for future in futures:
+            future.result()
+
+    def choose_splitters(
+        self, values: memoryview, chunks: list[tuple[int, int]]
+    ) -> list:
+        """Pick values splitting the sorted chunks into `workers` even segments."""
+        samples = []
+        count = self.workers * self.oversampling
+        for low, high in chunks:
+            step = max(1, (high - low) // count)
+            samples.extend(values[index] for index in range(low, high, step))
+        samples = self.sorter.sort(samples)
+        step = len(samples) / self.workers
+        return [samples[int(step * index)] for index in range(1, self.workers)]
+
+
+def _sort_chunk(name: str, typecode: str, low: int, high: int, sorter) -> None:
+    """Sort values[low:high] of a shared block in place (worker process)."""
+    block = SharedMemory(name=name)
+    values = block.buf.cast(typecode)
+    try:
+        values[low:high] = array(typecode, sorter.sort(values[low:high].tolist()))
+    finally:
+        values.release()
+        block.close()
+
+
+def _merge_ranges(
+    source_name: str,
+    target_name: str,
+    typecode: str,
+    ranges: list[tuple[int, int]],
+    offset: int,
+) -> None:
+    """K-way merge sorted ranges of one block into another at offset (worker)."""
+    source = SharedMemory(name=source_name)
+    target = SharedMemory(name=target_name)
+    values = source.buf.cast(typecode)
+    result = target.buf.cast(typecode)
+    runs = [values[low:high] for low, high in ranges]
+    try:
+        merged = array(typecode, heapq.merge(*runs))
+        result[offset : offset + len(merged)] = merged
+    finally:
+        for run in runs:
+            run.release()
+        values.release()
+        result.release()
+        source.close()
+        target.close()
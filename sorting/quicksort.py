@@ -1,3 +1,9 @@
+from typing import Optional
+
+from .instrumentation import SortStats, instrumented
+from .keys import keyed
+
+
 class QuickSortLomuto:
     """
     Quicksort using Lomuto partition scheme.
@@ -6,26 +12,31 @@ class QuickSortLomuto:
     https://en.wikipedia.org/wiki/Quicksort#Lomuto_partition_scheme
     """
 
+    def __init__(self, stats: Optional[SortStats] = None) -> None:
+        self.stats = stats
+
+    @keyed
+    @instrumented
     def sort(self, elements: list) -> list:
-        # print(f'{elements=}')
         return self.quicksort(elements, 0, len(elements) - 1)
 
-    def quicksort(self, elements: list, left_index: int, right_index: int) -> list:
+    def quicksort(
+        self, elements: list, left_index: int, right_index: int, depth: int = 0
+    ) -> list:
         if left_index >= right_index or left_index < 0:
             return elements
 
+        if self.stats is not None:
+            self.stats.record_partition(right_index - left_index + 1, depth)
         pivot_index = self.partition(elements, left_index, right_index)
 
-        self.quicksort(elements, left_index, pivot_index - 1)
-        # print(f'sorted left: {elements}')
-        self.quicksort(elements, pivot_index, right_index)
-        # print(f'sorted right: {elements}')
+        self.quicksort(elements, left_index, pivot_index - 1, depth + 1)
+        self.quicksort(elements, pivot_index, right_index, depth + 1)
         return elements
 
     @staticmethod
     def partition(elements: list, low: int, high: int) -> int:
         pivot = elements[high]
-        # print(f'{pivot=}')
 
         i = low - 1
         for j in range(low, high):
@@ -35,8 +46,6 @@ class QuickSortLomuto:
 
         i += 1
         elements[high], elements[i] = elements[i], elements[high]
-        # print(f'pivot index = {i}')
-        # print(f'{elements=}')
         return i
 
 
@@ -48,33 +57,59 @@ class QuickSortHoare:
     https://en.wikipedia.org/wiki/Quicksort#Hoare_partition_scheme
     """
 
-    counter = 0
+    fat_pivot_strategies = ('three way',)
 
-    def sort(self, elements: list) -> list:
-        # print(f'{elements=}')
-        _sorted = self.quicksort(elements, 0, len(elements) - 1)
-        # print(f'{self.counter=}')
-        return _sorted
-
-    def quicksort(self, elements: list, left_index: int, right_index: int) -> list:
-        # print(f'{left_index=}, {right_index=}')
-        self.counter += 1
+    def __init__(self, stats: Optional[SortStats] = None) -> None:
+        self.stats = stats
+
+    @keyed
+    @instrumented
+    def sort(self, elements: list, strategy: str = 'last pivot') -> list:
+        return self.quicksort(elements, 0, len(elements) - 1, strategy)
+
+    def quicksort(
+        self,
+        elements: list,
+        left_index: int,
+        right_index: int,
+        strategy: str = 'last pivot',
+        depth: int = 0,
+    ) -> list:
         if 0 <= left_index < right_index:
-            pivot_index = self.partition('last pivot', elements, left_index, right_index)
+            if self.stats is not None:
+                self.stats.record_partition(right_index - left_index + 1, depth)
+            left, right = self.split(strategy, elements, left_index, right_index)
 
-            self.quicksort(elements, left_index, pivot_index)
-            # print(f'sorted left')
-            self.quicksort(elements, pivot_index + 1, right_index)
-            # print(f'sorted right')
+            self.quicksort(elements, *left, strategy, depth + 1)
+            self.quicksort(elements, *right, strategy, depth + 1)
         return elements
 
-    def partition(self, strategy: str, elements: list, low: int, high: int) -> int:
+    def partition(
+        self, strategy: str, elements: list, low: int, high: int
+    ) -> int | tuple[int, int]:
         methods = {
             'middle pivot': self.partition_with_middle_element,
             'last pivot': self.partition_with_last_element,
+            'median of three pivot': self.partition_with_median_of_three,
+            'three way': self.partition_three_way,
         }
         return methods[strategy](elements, low, high)
 
+    def split(
+        self, strategy: str, elements: list, low: int, high: int
+    ) -> tuple[tuple[int, int], tuple[int, int]]:
+        """
+        Partition a sublist and return the (low, high) ranges left to sort.
+
+        Three way strategies return the bounds of the block equal to the pivot,
+        that block is already in place and is left out of both ranges.
+        """
+        pivot_index = self.partition(strategy, elements, low, high)
+        if strategy in self.fat_pivot_strategies:
+            lower, upper = pivot_index
+            return (low, lower - 1), (upper + 1, high)
+        return (low, pivot_index), (pivot_index + 1, high)
+
     @staticmethod
     def partition_with_middle_element(elements: list, low: int, high: int) -> int:
         """
@@ -84,28 +119,24 @@ class QuickSortHoare:
         """
         pivot_index = (low + high) // 2
         pivot = elements[pivot_index]
-        # print(f'{pivot_index=}, {pivot=}')
 
-        left = low
-        right = high
+        left = low - 1
+        right = high + 1
 
         while True:
+            # step over the swapped pair first, so runs of elements equal
+            # to the pivot are split evenly instead of stopping the loop
+            left += 1
             while elements[left] < pivot:
                 left += 1
+            right -= 1
             while elements[right] > pivot:
                 right -= 1
 
             if left >= right:
                 return right
 
-            if elements[left] == elements[right]:
-                # when there are duplicates -> return pivot index
-                # because we are sure it's in the right place
-                return pivot_index
-
-            # print(f'Swap elements {elements[left]} <-> {elements[right]}')
             elements[left], elements[right] = elements[right], elements[left]
-            # print(f'{elements=}')
 
     @staticmethod
     def partition_with_last_element(elements: list, low: int, high: int) -> int:
@@ -116,7 +147,6 @@ class QuickSortHoare:
         """
         pivot_index = high
         pivot = elements[pivot_index]
-        # print(f'{pivot_index=}, {pivot=}')
 
         left = low
         right = high - 1
@@ -129,6 +159,200 @@ class QuickSortHoare:
             if left >= right:
                 elements[left], elements[pivot_index] = elements[pivot_index], elements[left]
                 return right
-            # print(f'Swap elements {elements[left]} <-> {elements[right]}')
             elements[left], elements[right] = elements[right], elements[left]
-            # print(f'{elements=}')
+
+    @staticmethod
+    def partition_with_median_of_three(elements: list, low: int, high: int) -> int:
+        """
+        Using median of three (ninther for bigger sublists) as pivot.
+
+        The pivot is moved to the middle of the sublist and then partitioned
+        with the classic Hoare scheme, so the returned index is always lower than
+        `high` and sorted or reversed input gets balanced splits.
+
+        Based on:
+        https://en.wikipedia.org/wiki/Quicksort#Choice_of_pivot
+        https://cs.fit.edu/~pkc/classes/writing/papers/bentley93engineering.pdf
+        """
+        middle = (low + high) // 2
+        if high - low >= 128:
+            step = (high - low) // 8
+            pivot_index = QuickSortHoare.median_of_three(
+                elements,
+                QuickSortHoare.median_of_three(
+                    elements, low, low + step, low + 2 * step
+                ),
+                QuickSortHoare.median_of_three(
+                    elements, middle - step, middle, middle + step
+                ),
+                QuickSortHoare.median_of_three(
+                    elements, high - 2 * step, high - step, high
+                ),
+            )
+        else:
+            pivot_index = QuickSortHoare.median_of_three(elements, low, middle, high)
+        elements[middle], elements[pivot_index] = (
+            elements[pivot_index],
+            elements[middle],
+        )
+        pivot = elements[middle]
+
+        left = low - 1
+        right = high + 1
+        while True:
+            left += 1
+            while elements[left] < pivot:
+                left += 1
+            right -= 1
+            while elements[right] > pivot:
+                right -= 1
+            if left >= right:
+                return right
+            elements[left], elements[right] = elements[right], elements[left]
+
+    @staticmethod
+    def median_of_three(elements: list, first: int, second: int, third: int) -> int:
+        """Return the index of the median of three elements."""
+        a, b, c = elements[first], elements[second], elements[third]
+        if a < b:
+            if b < c:
+                return second
+            return third if a < c else first
+        if a < c:
+            return first
+        return third if b < c else second
+
+    @staticmethod
+    def partition_three_way(elements: list, low: int, high: int) -> tuple[int, int]:
+        """
+        Using median of three as pivot and splitting the sublist into elements
+        lower than, equal to and greater than the pivot (Dutch national flag).
+
+        Returns bounds of the block equal to the pivot, so sorting n elements
+        with k distinct values takes O(n log k) comparisons.
+
+        Based on:
+        https://en.wikipedia.org/wiki/Dutch_national_flag_problem
+        """
+        middle = (low + high) // 2
+        pivot_index = QuickSortHoare.median_of_three(elements, low, middle, high)
+        return QuickSortHoare.three_way_split(
+            elements, low, high, elements[pivot_index]
+        )
+
+    @staticmethod
+    def three_way_split(
+        elements: list, low: int, high: int, pivot
+    ) -> tuple[int, int]:
+        """Split a sublist around the pivot value and return the equal block."""
+        lower, index, upper = low, low, high
+        while index <= upper:
+            value = elements[index]
+            if value < pivot:
+                elements[index], elements[lower] = elements[lower], value
+                lower += 1
+                index += 1
+            elif pivot < value:
+                elements[index], elements[upper] = elements[upper], value
+                upper -= 1
+            else:
+                index += 1
+        return lower, upper
+
+
+class IntroSort(QuickSortHoare):
+    """
+    Introsort - quicksort with a guaranteed O(n log n) worst case.
+
+    Partitions are kept on an explicit stack (the smaller side is always
+    handled first, so the stack holds at most log2(n) ranges), pivots are
+    chosen with median of three/ninther, small ranges are finished with
+    insertion sort and ranges deeper than 2 * log2(n) fall back to heapsort.
+
+    Source:
+    https://en.wikipedia.org/wiki/Introsort
+    """
+
+    insertion_sort_threshold = 16
+
+    @keyed
+    @instrumented
+    def sort(
+        self, elements: list, strategy: str = 'median of three pivot'
+    ) -> list:
+        return self.quicksort(elements, 0, len(elements) - 1, strategy)
+
+    def quicksort(
+        self,
+        elements: list,
+        left_index: int,
+        right_index: int,
+        strategy: str = 'median of three pivot',
+    ) -> list:
+        if left_index >= right_index:
+            return elements
+
+        max_depth = 2 * ((right_index - left_index + 1).bit_length() - 1)
+        stack = [(left_index, right_index, 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            if high - low < self.insertion_sort_threshold:
+                self.insertion_sort(elements, low, high)
+                continue
+            if depth > max_depth:
+                self.heapsort(elements, low, high)
+                continue
+
+            if self.stats is not None:
+                self.stats.record_partition(high - low + 1, depth)
+            left, right = self.split(strategy, elements, low, high)
+            # push the bigger side first so the smaller one is popped next
+            if left[1] - left[0] < right[1] - right[0]:
+                stack.extend(((*right, depth + 1), (*left, depth + 1)))
+            else:
+                stack.extend(((*left, depth + 1), (*right, depth + 1)))
+        return elements
+
+    @staticmethod
+    def insertion_sort(elements: list, low: int, high: int) -> None:
+        """Sort elements[low:high + 1] in place."""
+        for index in range(low + 1, high + 1):
+            value = elements[index]
+            position = index - 1
+            while position >= low and elements[position] > value:
+                elements[position + 1] = elements[position]
+                position -= 1
+            elements[position + 1] = value
+
+    def heapsort(self, elements: list, low: int, high: int) -> None:
+        """
+        Sort elements[low:high + 1] in place using a max heap.
+
+        Source:
+        https://en.wikipedia.org/wiki/Heapsort
+        """
+        size = high - low + 1
+        for root in range(size // 2 - 1, -1, -1):
+            self.sift_down(elements, low, root, size)
+        for end in range(size - 1, 0, -1):
+            elements[low], elements[low + end] = elements[low + end], elements[low]
+            self.sift_down(elements, low, 0, end)
+
+    @staticmethod
+    def sift_down(elements: list, offset: int, root: int, size: int) -> None:
+        """Move the root of a heap stored at elements[offset:] to its place."""
+        value = elements[offset + root]
+        while True:
+            child = 2 * root + 1
+            if child >= size:
+                break
+            if (
+                child + 1 < size
+                and elements[offset + child] < elements[offset + child + 1]
+            ):
+                child += 1
+            if not value < elements[offset + child]:
+                break
+            elements[offset + root] = elements[offset + child]
+            root = child
+        elements[offset + root] = value
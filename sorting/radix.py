@@ -0,0 +1,148 @@
+from itertools import chain
+from typing import Callable, Optional
+
+from .quicksort import IntroSort
+
+
+class DistributionSort:
+    """
+    Base class of non comparison sorts.
+
+    Keys are computed once, subclasses return the stable order of their
+    indices (`argsort`) and values are picked in that order. Reverse mode
+    reverses the values before and after sorting, so it stays stable.
+    """
+
+    def sort(
+        self,
+        elements: list,
+        key: Optional[Callable] = None,
+        reverse: bool = False,
+    ) -> list:
+        values = list(elements)
+        if len(values) < 2:
+            return values
+
+        if reverse:
+            values.reverse()
+        keys = values if key is None else [key(value) for value in values]
+        result = [values[index] for index in self.argsort(keys)]
+        if reverse:
+            result.reverse()
+        return result
+
+    def argsort(self, keys: list) -> list[int]:
+        raise NotImplementedError(
+            f"{self.__class__.__name__} has to implement .argsort() method."
+        )
+
+
+class CountingSort(DistributionSort):
+    """
+    Counting sort for integer keys from a small range.
+
+    Source:
+    https://en.wikipedia.org/wiki/Counting_sort
+    """
+
+    max_range = 1 << 20
+
+    def argsort(self, keys: list) -> list[int]:
+        low, high = min(keys), max(keys)
+        if high - low >= self.max_range:
+            raise ValueError(
+                f"Key range {high - low + 1} is bigger than {self.max_range}!"
+            )
+
+        counts = [0] * (high - low + 1)
+        for key in keys:
+            counts[key - low] += 1
+
+        # turn counts into first positions of every key
+        position = 0
+        for offset, count in enumerate(counts):
+            counts[offset] = position
+            position += count
+
+        order = [0] * len(keys)
+        for index, key in enumerate(keys):
+            offset = key - low
+            order[counts[offset]] = index
+            counts[offset] += 1
+        return order
+
+
+class LSDRadixSort(DistributionSort):
+    """
+    Least significant digit radix sort for integer keys, one byte per pass.
+
+    Signed keys are shifted by the smallest key, so every key becomes a non
+    negative offset and only as many passes as the key range needs are made.
+    The offset and the element index are packed into one integer, so a pass
+    reads a single object per element.
+
+    Source:
+    https://en.wikipedia.org/wiki/Radix_sort#Least_significant_digit
+    """
+
+    radix_bits = 8
+
+    def argsort(self, keys: list) -> list[int]:
+        low = min(keys)
+        span = max(keys) - low
+        index_bits = (len(keys) - 1).bit_length()
+        items = [((key - low) << index_bits) | index for index, key in enumerate(keys)]
+
+        mask = (1 << self.radix_bits) - 1
+        shift = index_bits
+        while span >> (shift - index_bits):
+            buckets = [[] for _ in range(mask + 1)]
+            for item in items:
+                buckets[(item >> shift) & mask].append(item)
+            items = list(chain.from_iterable(buckets))
+            shift += self.radix_bits
+
+        index_mask = (1 << index_bits) - 1
+        return [item & index_mask for item in items]
+
+
+class MSDRadixSort(DistributionSort):
+    """
+    Most significant digit radix sort for string keys.
+
+    Indices are bucketed by the character at the current depth (strings which
+    end there come first) and buckets are processed from an explicit stack.
+    Buckets of up to `cutoff` strings are sorted with IntroSort instead.
+
+    Source:
+    https://en.wikipedia.org/wiki/Radix_sort#Most_significant_digit
+    """
+
+    cutoff = 32
+
+    def argsort(self, keys: list) -> list[int]:
+        fallback = IntroSort()
+        order = []
+        # (indices, depth) - depth None marks indices which are already sorted
+        stack = [(list(range(len(keys))), 0)]
+        while stack:
+            indices, depth = stack.pop()
+            if depth is None:
+                order.extend(indices)
+                continue
+            if len(indices) <= self.cutoff:
+                order.extend(fallback.sort(indices, key=keys.__getitem__))
+                continue
+
+            buckets = {}
+            for index in indices:
+                key = keys[index]
+                character = ord(key[depth]) if depth < len(key) else -1
+                buckets.setdefault(character, []).append(index)
+
+            finished = buckets.pop(-1, None)
+            for character in sorted(buckets, reverse=True):
+                stack.append((buckets[character], depth + 1))
+            if finished:
+                stack.append((finished, None))
+        return order
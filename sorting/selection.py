@@ -0,0 +1,127 @@
+import heapq
+from typing import Iterable
+
+from .quicksort import IntroSort
+
+
+class QuickSelect(IntroSort):
+    """
+    Selection of the k smallest elements without sorting all of them.
+
+    `select` narrows the range around k with the three way partition of
+    QuickSortHoare and median of three pivots. When a range doesn't halve
+    within two partitions the pivots are taken with median of medians instead,
+    so the expected cost is O(n) and the worst case stays linear.
+
+    Based on:
+    https://en.wikipedia.org/wiki/Introselect
+    https://en.wikipedia.org/wiki/Median_of_medians
+    """
+
+    def select(self, elements: list, k: int):
+        """
+        Put the k-th smallest (0 based) element at index k and return it.
+
+        Elements before k are not greater and elements after k are not smaller
+        than it (C++ nth_element).
+        """
+        if not 0 <= k < len(elements):
+            raise IndexError(f"{k} is out of range for {len(elements)} elements!")
+        self.select_range(elements, 0, len(elements) - 1, k)
+        return elements[k]
+
+    def select_range(self, elements: list, low: int, high: int, k: int) -> None:
+        """Select the k-th element within elements[low:high + 1]."""
+        use_median_of_medians = False
+        rounds = 0
+        previous_size = high - low + 1
+        while low < high:
+            if high - low < self.insertion_sort_threshold:
+                self.insertion_sort(elements, low, high)
+                return
+
+            if use_median_of_medians:
+                pivot_index = self.median_of_medians(elements, low, high)
+            else:
+                middle = (low + high) // 2
+                pivot_index = self.median_of_three(elements, low, middle, high)
+            lower, upper = self.three_way_split(
+                elements, low, high, elements[pivot_index]
+            )
+            if k < lower:
+                high = lower - 1
+            elif k > upper:
+                low = upper + 1
+            else:
+                return
+
+            rounds += 1
+            if rounds % 2 == 0:
+                size = high - low + 1
+                use_median_of_medians = use_median_of_medians or (
+                    size > previous_size // 2
+                )
+                previous_size = size
+
+    def median_of_medians(self, elements: list, low: int, high: int) -> int:
+        """Return index of an approximate median found with groups of five."""
+        if high - low < 5:
+            self.insertion_sort(elements, low, high)
+            return (low + high) // 2
+
+        # gather medians of groups at the front of the range
+        store = low
+        for group_low in range(low, high + 1, 5):
+            group_high = min(group_low + 4, high)
+            self.insertion_sort(elements, group_low, group_high)
+            median = (group_low + group_high) // 2
+            elements[store], elements[median] = elements[median], elements[store]
+            store += 1
+
+        middle = (low + store - 1) // 2
+        self.select_range(elements, low, store - 1, middle)
+        return middle
+
+    def partial_sort(self, elements: list, k: int) -> list:
+        """Sort the k smallest elements in place at the front of the list."""
+        k = min(k, len(elements))
+        if k <= 0:
+            return elements
+        self.select(elements, k - 1)
+        self.quicksort(elements, 0, k - 2)
+        return elements
+
+    def top_k(
+        self,
+        iterable: Iterable,
+        k: int,
+        reverse: bool = False,
+        streaming: bool = False,
+    ) -> list:
+        """
+        Return the k smallest values in ascending order (k largest in descending
+        order with `reverse`).
+
+        The default mode copies the iterable and uses `select`. In streaming
+        mode only a heap of k values is kept, so iterables too big for memory
+        can be consumed in O(n log k) time.
+        """
+        if k <= 0:
+            return []
+        if streaming:
+            if reverse:
+                return heapq.nlargest(k, iterable)
+            return heapq.nsmallest(k, iterable)
+
+        values = list(iterable)
+        k = min(k, len(values))
+        if not reverse:
+            return self.partial_sort(values, k)[:k]
+
+        start = len(values) - k
+        if start > 0:
+            self.select(values, start)
+        self.quicksort(values, start, len(values) - 1)
+        result = values[start:]
+        result.reverse()
+        return result
@@ -0,0 +1,75 @@
+import json
+import os
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest import TestCase
+
+from ..benchmarks import DISTRIBUTIONS, compare, generate, main, run
+
+
+class BenchmarksTestCase(TestCase):
+    """TestCase for the sorting benchmarks."""
+
+    def test_distributions(self):
+        for distribution in DISTRIBUTIONS:
+            with self.subTest(distribution=distribution):
+                values = generate(distribution, 1_000, seed=1)
+
+                self.assertEqual(len(values), 1_000)
+                self.assertEqual(values, generate(distribution, 1_000, seed=1))
+
+    def test_run_records_metrics(self):
+        results = run(["IntroSort", "MergeSort"], ["random", "sorted"], [200])
+
+        self.assertEqual(len(results), 4)
+        for result in results:
+            with self.subTest(result=result):
+                self.assertGreater(result["seconds"], 0)
+                self.assertGreater(result["comparisons"], 0)
+                self.assertGreater(result["peak_memory"], 0)
+                self.assertIn("swaps", result)
+
+    def test_run_records_recursion_errors(self):
+        results = run(["QuickSortLomuto"], ["sorted"], [5_000], memory=False)
+
+        self.assertEqual(results[0]["error"], "RecursionError")
+
+    def test_compare(self):
+        baseline = [
+            {
+                "sorter": "IntroSort",
+                "distribution": "random",
+                "size": 100,
+                "seconds": 1.0,
+                "comparisons": 1_000,
+            }
+        ]
+        results = [dict(baseline[0], seconds=1.05, comparisons=1_500)]
+
+        regressions = compare(results, baseline, threshold=0.1)
+
+        self.assertEqual(regressions, [(results[0], "comparisons", 1_000)])
+
+    def test_main_fails_on_regression(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "baseline.json")
+            arguments = ["--sorters", "IntroSort", "--sizes", "300", "--no-memory"]
+            with redirect_stderr(StringIO()):
+                status = main(arguments + ["--output", output])
+            with open(output) as file:
+                report = json.load(file)
+            for result in report["results"]:
+                result["seconds"] = 1_000
+                result["comparisons"] = 1
+            with open(output, "w") as file:
+                json.dump(report, file)
+
+            with redirect_stderr(StringIO()), redirect_stdout(StringIO()) as stdout:
+                regression_status = main(
+                    arguments + ["--baseline", output, "--threshold", "0.5"]
+                )
+
+        self.assertEqual(status, 0)
+        self.assertEqual(regression_status, 1)
+        self.assertIn("comparisons", stdout.getvalue())
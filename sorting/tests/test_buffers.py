@@ -0,0 +1,99 @@
+import random
+from array import array
+from unittest import TestCase, skipIf
+
+from ..buffers import TypedBufferSort, numpy
+
+
+class TypedBufferSortTestCase(TestCase):
+    """TestCase for the TypedBufferSort algorithm."""
+
+    def test_array(self):
+        testcases = {
+            "b": [random.randint(-128, 127) for _ in range(2_000)],
+            "H": [random.randint(0, 2**16 - 1) for _ in range(2_000)],
+            "q": [random.randint(-(2**63), 2**63 - 1) for _ in range(2_000)],
+            "d": [random.uniform(-1, 1) for _ in range(2_000)],
+        }
+        for typecode, values in testcases.items():
+            with self.subTest(typecode=typecode):
+                buffer = array(typecode, values)
+
+                result = TypedBufferSort().sort(buffer)
+
+                self.assertIs(result, buffer)
+                self.assertEqual(buffer.tolist(), sorted(values))
+
+    def test_array_with_nans(self):
+        for typecode in "fd":
+            with self.subTest(typecode=typecode):
+                values = [random.uniform(-1, 1) for _ in range(2_000)]
+                buffer = array(typecode, values)
+                for index in range(0, len(buffer), 7):
+                    buffer[index] = float("nan")
+                numbers = sorted(value for value in buffer if value == value)
+
+                TypedBufferSort().sort(buffer)
+
+                self.assertEqual(buffer[: len(numbers)].tolist(), numbers)
+                self.assertTrue(all(value != value for value in buffer[len(numbers) :]))
+
+    def test_array_is_still_resizable_after_sorting(self):
+        buffer = array("i", [3, 1, 2])
+
+        TypedBufferSort().sort(buffer)
+        buffer.append(0)
+
+        self.assertEqual(buffer.tolist(), [1, 2, 3, 0])
+
+    def test_bytearray(self):
+        buffer = bytearray(random.randbytes(3_000))
+        expected_result = sorted(buffer)
+
+        TypedBufferSort().sort(buffer)
+
+        self.assertEqual(list(buffer), expected_result)
+
+    def test_memoryview_slice(self):
+        buffer = array("l", [9, 8, 7, 6, 5, 4, 3, 2, 1, 0])
+
+        TypedBufferSort().sort(memoryview(buffer)[2:8])
+
+        self.assertEqual(buffer.tolist(), [9, 8, 2, 3, 4, 5, 6, 7, 1, 0])
+
+    def test_read_only_buffer(self):
+        with self.assertRaises(TypeError):
+            TypedBufferSort().sort(b"\x03\x02\x01")
+
+    def test_multidimensional_buffer(self):
+        buffer = memoryview(bytearray(6)).cast("B", shape=[2, 3])
+
+        with self.assertRaises(ValueError):
+            TypedBufferSort().sort(buffer)
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_array(self):
+        testcases = {
+            "random": numpy.random.randint(-(10**9), 10**9, 50_000),
+            "few unique": numpy.random.randint(0, 3, 50_000).astype(numpy.int8),
+            "sorted": numpy.arange(50_000, dtype=numpy.uint32),
+            "floats": numpy.random.rand(50_000).astype(numpy.float32),
+        }
+        for name, values in testcases.items():
+            with self.subTest(name=name):
+                expected_result = numpy.sort(values)
+
+                result = TypedBufferSort().sort(values)
+
+                self.assertIs(result, values)
+                self.assertTrue((values == expected_result).all())
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_array_with_nans(self):
+        values = numpy.random.rand(20_000)
+        values[::7] = numpy.nan
+        expected_result = numpy.sort(values)
+
+        TypedBufferSort().sort(values)
+
+        self.assertTrue(numpy.array_equal(values, expected_result, equal_nan=True))
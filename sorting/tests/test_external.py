@@ -0,0 +1,69 @@
+import io
+import os
+import random
+import tempfile
+from array import array
+from unittest import TestCase
+
+from ..external import BOXED_ITEM_SIZE, ExternalMergeSort
+from ..quicksort import IntroSort
+
+
+class ExternalMergeSortTestCase(TestCase):
+    """TestCase for the ExternalMergeSort algorithm."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def make_sorter(self, chunk_size: int, **kwargs) -> ExternalMergeSort:
+        max_memory = chunk_size * (8 + BOXED_ITEM_SIZE)
+        return ExternalMergeSort(
+            max_memory=max_memory, directory=self.directory.name, **kwargs
+        )
+
+    def test_iterable(self):
+        testcases = [
+            [],
+            [1],
+            random.sample(range(-5_000, 5_000), 10_000),
+            [random.randint(0, 3) for _ in range(1_000)],
+        ]
+        for testcase in testcases:
+            with self.subTest(size=len(testcase)):
+                sorter = self.make_sorter(chunk_size=100, fan_in=4)
+
+                result = list(sorter.sort(iter(testcase)))
+
+                self.assertEqual(result, sorted(testcase))
+
+    def test_binary_file(self):
+        values = [random.randint(-(2**62), 2**62) for _ in range(5_000)]
+        source = io.BytesIO(array("q", values).tobytes())
+        sorter = self.make_sorter(chunk_size=64, fan_in=3)
+
+        result = list(sorter.sort(source))
+
+        self.assertEqual(result, sorted(values))
+
+    def test_floats_with_custom_sorter(self):
+        values = [random.uniform(-1, 1) for _ in range(3_000)]
+        sorter = self.make_sorter(chunk_size=250, typecode="d", sorter=IntroSort())
+
+        result = list(sorter.sort(values))
+
+        self.assertEqual(result, sorted(values))
+
+    def test_spill_files_are_removed(self):
+        sorter = self.make_sorter(chunk_size=10, fan_in=2)
+
+        stream = sorter.sort(range(1_000, 0, -1))
+        first_values = [next(stream) for _ in range(5)]
+        stream.close()
+
+        self.assertEqual(first_values, [1, 2, 3, 4, 5])
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_fan_in_has_to_merge_at_least_two_runs(self):
+        with self.assertRaises(ValueError):
+            ExternalMergeSort(fan_in=1)
@@ -0,0 +1,119 @@
+import random
+from unittest import TestCase
+
+from ..instrumentation import SortStats
+from ..mergesort import BottomUpMergeSort, MergeSort, NaturalMergeSort
+from ..quicksort import IntroSort, QuickSortHoare, QuickSortLomuto
+
+
+class SortStatsTestCase(TestCase):
+    """TestCase for sorters with SortStats attached."""
+
+    def test_sorted_output_is_unchanged(self):
+        array = [random.randint(0, 1_000) for _ in range(2_000)]
+        sorters = (
+            QuickSortLomuto,
+            QuickSortHoare,
+            IntroSort,
+            MergeSort,
+            BottomUpMergeSort,
+            NaturalMergeSort,
+        )
+        for sorter_class in sorters:
+            with self.subTest(sorter=sorter_class.__name__):
+                stats = SortStats()
+
+                result = sorter_class(stats=stats).sort(list(array))
+
+                self.assertEqual(result, sorted(array))
+                self.assertGreater(stats.comparisons, 0)
+
+    def test_in_place_sort_counts_swaps_and_partitions(self):
+        array = random.sample(range(5_000), 5_000)
+        stats = SortStats()
+
+        result = IntroSort(stats=stats).sort(array)
+
+        self.assertIs(result, array)
+        self.assertEqual(array, list(range(5_000)))
+        self.assertGreater(stats.swaps, 0)
+        self.assertEqual(stats.partition_sizes[0], 5_000)
+        self.assertEqual(stats.depths[0], 1)
+        self.assertEqual(sum(stats.depths.values()), len(stats.partition_sizes))
+        self.assertLessEqual(stats.max_depth, 2 * 12 + 1)
+
+    def test_allocations(self):
+        stats = SortStats()
+
+        BottomUpMergeSort(stats=stats).sort(list(range(100, 0, -1)))
+
+        self.assertEqual(stats.allocations, 2)
+        self.assertEqual(stats.allocated_items, 200)
+
+    def test_merge_sort_depth_histogram(self):
+        stats = SortStats()
+
+        MergeSort(stats=stats).sort(list(range(16)))
+
+        self.assertEqual(dict(stats.depths), {0: 1, 1: 2, 2: 4, 3: 8})
+
+    def test_merge_sorts_count_writes(self):
+        array = [random.randint(0, 1_000) for _ in range(2_000)]
+        for sorter_class in (MergeSort, BottomUpMergeSort, NaturalMergeSort):
+            with self.subTest(sorter=sorter_class.__name__):
+                stats = SortStats()
+
+                sorter_class(stats=stats).sort(list(array))
+
+                self.assertGreaterEqual(stats.writes, len(array))
+                self.assertGreater(stats.swaps, 0)
+
+    def test_bottom_up_merge_sort_depth_histogram(self):
+        stats = SortStats()
+
+        BottomUpMergeSort(stats=stats).sort(list(range(16, 0, -1)))
+
+        self.assertEqual(dict(stats.depths), {0: 8, 1: 4, 2: 2, 3: 1})
+        self.assertEqual(stats.partition_sizes[-1], 16)
+
+    def test_natural_merge_sort_depth_histogram(self):
+        stats = SortStats()
+
+        NaturalMergeSort(stats=stats).sort(random.sample(range(1_000), 1_000))
+
+        self.assertEqual(sum(stats.depths.values()), len(stats.partition_sizes))
+        self.assertGreater(stats.depths[0], 0)
+        self.assertGreater(stats.max_depth, 0)
+        self.assertEqual(stats.partition_sizes[-1], 1_000)
+
+    def test_stats_are_per_instance_and_resettable(self):
+        first, second = SortStats(), SortStats()
+        QuickSortHoare(stats=first).sort([3, 2, 1])
+
+        QuickSortHoare(stats=second).sort([3, 2, 1])
+        first.reset()
+
+        self.assertEqual(first.as_dict()["comparisons"], 0)
+        self.assertGreater(second.comparisons, 0)
+
+    def test_key_comparisons_are_counted(self):
+        stats = SortStats()
+
+        result = MergeSort(stats=stats).sort(["ccc", "a", "bb"], key=len)
+
+        self.assertEqual(result, ["a", "bb", "ccc"])
+        self.assertGreater(stats.comparisons, 0)
+
+    def test_without_stats_elements_are_not_wrapped(self):
+        received = []
+
+        class Sorter(IntroSort):
+            def quicksort(self, elements, *args):
+                received.append(elements)
+                return super().quicksort(elements, *args)
+
+        array = [2, 1, 3]
+
+        Sorter().sort(array)
+
+        self.assertIs(received[0], array)
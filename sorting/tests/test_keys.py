@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from ..keys import keyed
+
+
+class Sorter:
+    """Minimal in place sorter recording what it was asked to sort."""
+
+    def __init__(self, in_place: bool) -> None:
+        self.in_place = in_place
+        self.received = None
+
+    @keyed
+    def sort(self, elements: list) -> list:
+        self.received = list(elements)
+        if self.in_place:
+            elements.sort()
+            return elements
+        return sorted(elements)
+
+
+class KeyedTestCase(TestCase):
+    """TestCase for the keyed sort decorator."""
+
+    def test_without_key_and_reverse_elements_are_passed_through(self):
+        array = [3, 1, 2]
+        sorter = Sorter(in_place=True)
+
+        result = sorter.sort(array)
+
+        self.assertIs(result, array)
+        self.assertEqual(sorter.received, [3, 1, 2])
+
+    def test_sorter_receives_precomputed_keys(self):
+        sorter = Sorter(in_place=False)
+
+        result = sorter.sort(["ccc", "a", "bb"], key=len)
+
+        self.assertEqual(result, ["a", "bb", "ccc"])
+        self.assertEqual(sorter.received, [(3, 0), (1, 1), (2, 2)])
+
+    def test_key_is_called_once_per_element(self):
+        calls = []
+
+        def key(value: int) -> int:
+            calls.append(value)
+            return -value
+
+        result = Sorter(in_place=False).sort([1, 2, 3, 4], key=key)
+
+        self.assertEqual(result, [4, 3, 2, 1])
+        self.assertEqual(calls, [1, 2, 3, 4])
+
+    def test_in_place_sorter_writes_result_back(self):
+        array = ["bb", "a", "ccc"]
+
+        result = Sorter(in_place=True).sort(array, key=len, reverse=True)
+
+        self.assertIs(result, array)
+        self.assertEqual(array, ["ccc", "bb", "a"])
+
+    def test_reverse_keeps_equal_elements_in_input_order(self):
+        array = [(1, "a"), (2, "b"), (1, "c"), (2, "d")]
+
+        result = Sorter(in_place=False).sort(array, key=lambda x: x[0], reverse=True)
+
+        self.assertEqual(result, [(2, "b"), (2, "d"), (1, "a"), (1, "c")])
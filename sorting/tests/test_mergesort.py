@@ -2,7 +2,35 @@ import random
 from unittest import TestCase
 from typing import Iterable
 
-from ..mergesort import MergeSort
+from ..mergesort import BottomUpMergeSort, MergeSort, NaturalMergeSort
+
+
+class Record:
+    """Element compared only by its key, used to check stability."""
+
+    def __init__(self, key: int, position: int) -> None:
+        self.key = key
+        self.position = position
+
+    def __lt__(self, other: "Record") -> bool:
+        return self.key < other.key
+
+    def __le__(self, other: "Record") -> bool:
+        return self.key <= other.key
+
+
+class CountingRecord(Record):
+    """Record counting how many comparisons were made."""
+
+    comparisons = 0
+
+    def __lt__(self, other: "Record") -> bool:
+        CountingRecord.comparisons += 1
+        return super().__lt__(other)
+
+    def __le__(self, other: "Record") -> bool:
+        CountingRecord.comparisons += 1
+        return super().__le__(other)
 
 
 class MergeSortTestCase(TestCase):
@@ -25,3 +53,186 @@ class MergeSortTestCase(TestCase):
         result = MergeSort().sort(array)
 
         self.assertEqual(result, [x for x in elements])
+
+    def test_empty_list(self):
+        self.assertEqual(MergeSort().sort([]), [])
+
+    def test_is_stable(self):
+        array = [Record(random.randint(0, 9), position) for position in range(500)]
+
+        result = MergeSort().sort(array)
+
+        self.assertEqual(
+            [(x.key, x.position) for x in result],
+            sorted((x.key, x.position) for x in array),
+        )
+
+
+class BottomUpMergeSortTestCase(TestCase):
+    """TestCase for the BottomUpMergeSort algorithm."""
+
+    def test_1(self):
+        testcases = [
+            range(1, 2),
+            range(1, 20),
+            range(1, 200),
+            range(543, 56063),
+        ]
+        for testcase in testcases:
+            with self.subTest(testcase=testcase):
+                array = list(testcase)
+                random.shuffle(array)
+
+                result = BottomUpMergeSort().sort(array)
+
+                self.assertEqual(result, [x for x in testcase])
+
+    def test_empty_list(self):
+        self.assertEqual(BottomUpMergeSort().sort([]), [])
+
+    def test_does_not_modify_input(self):
+        array = [5, 3, 1, 4, 2]
+
+        result = BottomUpMergeSort().sort(array)
+
+        self.assertEqual(result, [1, 2, 3, 4, 5])
+        self.assertEqual(array, [5, 3, 1, 4, 2])
+
+    def test_matches_merge_sort_output(self):
+        array = [Record(random.randint(0, 9), position) for position in range(777)]
+
+        result = BottomUpMergeSort().sort(array)
+
+        self.assertEqual(
+            [(x.key, x.position) for x in result],
+            [(x.key, x.position) for x in MergeSort().sort(array)],
+        )
+
+    def test_merge_ranges_copies_without_slices(self):
+        class NoSlices(list):
+            def __getitem__(self, index):
+                if isinstance(index, slice):
+                    raise AssertionError("temporary list")
+                return super().__getitem__(index)
+
+            def __setitem__(self, index, value):
+                if isinstance(index, slice):
+                    raise AssertionError("temporary list")
+                super().__setitem__(index, value)
+
+        for source in ([1, 2, 3, 4, 5], [3, 4, 5, 1, 2], [1, 2, 6, 3, 4]):
+            with self.subTest(source=source):
+                target = NoSlices([None] * 5)
+
+                BottomUpMergeSort.merge_ranges(NoSlices(source), target, 0, 3, 5)
+
+                self.assertEqual(sorted(source), target)
+
+
+class NaturalMergeSortTestCase(TestCase):
+    """TestCase for the NaturalMergeSort algorithm."""
+
+    def test_1(self):
+        testcases = [
+            range(1, 2),
+            range(1, 20),
+            range(1, 200),
+            range(543, 56063),
+        ]
+        for testcase in testcases:
+            with self.subTest(testcase=testcase):
+                array = list(testcase)
+                random.shuffle(array)
+
+                result = NaturalMergeSort().sort(array)
+
+                self.assertEqual(result, [x for x in testcase])
+
+    def test_empty_list(self):
+        self.assertEqual(NaturalMergeSort().sort([]), [])
+
+    def test_presorted_runs(self):
+        segments = [sorted(random.sample(range(10_000), 1_000)) for _ in range(20)]
+        testcases = {
+            "sorted": list(range(5_000)),
+            "reversed": list(range(5_000, 0, -1)),
+            "concatenated runs": [x for segment in segments for x in segment],
+            "mixed runs": [
+                x
+                for index, segment in enumerate(segments)
+                for x in (segment if index % 2 else segment[::-1])
+            ],
+        }
+        for name, array in testcases.items():
+            with self.subTest(name=name):
+                result = NaturalMergeSort().sort(array)
+
+                self.assertEqual(result, sorted(array))
+
+    def test_is_stable(self):
+        keys = sorted(random.randint(0, 20) for _ in range(300))
+        keys = keys[::-1] + [random.randint(0, 20) for _ in range(300)] + keys
+        array = [Record(key, position) for position, key in enumerate(keys)]
+
+        result = NaturalMergeSort().sort(array)
+
+        self.assertEqual(
+            [(x.key, x.position) for x in result],
+            sorted((x.key, x.position) for x in array),
+        )
+
+    def test_sorted_input_takes_linear_comparisons(self):
+        size = 10_000
+        array = [CountingRecord(key, key) for key in range(size)]
+        CountingRecord.comparisons = 0
+
+        NaturalMergeSort().sort(array)
+
+        self.assertEqual(CountingRecord.comparisons, size - 1)
+
+    def test_galloping_merge_of_two_runs(self):
+        size = 10_000
+        array = [CountingRecord(key, key) for key in range(size // 2, size)]
+        array += [CountingRecord(key, key) for key in range(size // 2)]
+        CountingRecord.comparisons = 0
+
+        result = NaturalMergeSort().sort(array)
+
+        self.assertEqual([x.key for x in result], list(range(size)))
+        self.assertLess(CountingRecord.comparisons, 2 * size)
+
+
+class KeyAndReverseTestCase(TestCase):
+    """TestCase for key and reverse arguments of all merge sorts."""
+
+    def test_stable_in_reverse_mode(self):
+        array = [(random.randint(0, 9), position) for position in range(1_000)]
+        expected_result = sorted(array, key=lambda x: x[0], reverse=True)
+        for sorter in (MergeSort(), BottomUpMergeSort(), NaturalMergeSort()):
+            with self.subTest(sorter=sorter.__class__.__name__):
+                result = sorter.sort(array, key=lambda x: x[0], reverse=True)
+
+                self.assertEqual(result, expected_result)
+
+    def test_reverse_without_key(self):
+        array = [random.randint(-100, 100) for _ in range(1_000)]
+        for sorter in (MergeSort(), BottomUpMergeSort(), NaturalMergeSort()):
+            with self.subTest(sorter=sorter.__class__.__name__):
+                result = sorter.sort(array, reverse=True)
+
+                self.assertEqual(result, sorted(array, reverse=True))
+
+    def test_key_is_computed_once_per_element(self):
+        array = [random.randint(-100, 100) for _ in range(1_000)]
+        for sorter in (MergeSort(), BottomUpMergeSort(), NaturalMergeSort()):
+            with self.subTest(sorter=sorter.__class__.__name__):
+                calls = []
+
+                def key(value: int) -> int:
+                    calls.append(value)
+                    return abs(value)
+
+                result = sorter.sort(array, key=key)
+
+                self.assertEqual(result, sorted(array, key=abs))
+                self.assertEqual(len(calls), len(array))
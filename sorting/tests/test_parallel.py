@@ -0,0 +1,43 @@
+import random
+from unittest import TestCase
+from unittest.mock import patch
+
+from .. import parallel
+from ..parallel import ParallelSort
+
+
+class ParallelSortTestCase(TestCase):
+    """TestCase for the ParallelSort algorithm."""
+
+    def test_1(self):
+        testcases = {
+            "random": [random.randint(-(2**40), 2**40) for _ in range(20_000)],
+            "few unique": [random.randint(0, 3) for _ in range(5_000)],
+            "sorted": list(range(3_000)),
+            "reversed": list(range(3_000, 0, -1)),
+        }
+        for name, array in testcases.items():
+            with self.subTest(name=name):
+                sorter = ParallelSort(workers=3, threshold=100)
+
+                result = sorter.sort(array)
+
+                self.assertEqual(result, sorted(array))
+
+    def test_floats(self):
+        array = [random.uniform(-1, 1) for _ in range(1_000)]
+        sorter = ParallelSort(workers=2, threshold=100, typecode="d")
+
+        result = sorter.sort(array)
+
+        self.assertEqual(result, sorted(array))
+
+    def test_small_input_is_sorted_in_process(self):
+        array = [random.randint(0, 100) for _ in range(50)]
+        sorter = ParallelSort(workers=4, threshold=100)
+
+        with patch.object(parallel, "ProcessPoolExecutor") as executor:
+            result = sorter.sort(array)
+
+        self.assertEqual(result, sorted(array))
+        executor.assert_not_called()
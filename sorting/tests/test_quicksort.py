@@ -2,7 +2,7 @@ import random
 from unittest import TestCase
 from typing import Iterable
 
-from ..quicksort import QuickSortLomuto, QuickSortHoare
+from ..quicksort import IntroSort, QuickSortHoare, QuickSortLomuto
 
 
 class QuickSortLomutoTestCase(TestCase):
@@ -26,6 +26,14 @@ class QuickSortLomutoTestCase(TestCase):
 
         self.assertEqual(result, [x for x in elements])
 
+    def test_key_and_reverse(self):
+        array = [random.randint(-50, 50) for _ in range(300)]
+
+        result = QuickSortLomuto().sort(array, key=abs, reverse=True)
+
+        self.assertIs(result, array)
+        self.assertEqual(result, sorted(array, key=abs, reverse=True))
+
 
 class QuickSortHoareTestCase(TestCase):
     """TestCase for the QuickSort algorithm with Lomuto partition scheme."""
@@ -85,3 +93,128 @@ class QuickSortHoareTestCase(TestCase):
         result = QuickSortHoare().sort(array)
 
         self.assertEqual(result, expected_result)
+
+    def test_strategies(self):
+        testcases = [
+            [random.randint(0, 4) for _ in range(500)],
+            random.sample(range(500), 500),
+        ]
+        for strategy in ("middle pivot", "median of three pivot", "three way"):
+            for array in testcases:
+                with self.subTest(strategy=strategy, array=array):
+                    expected_result = sorted(array)
+
+                    result = QuickSortHoare().sort(list(array), strategy)
+
+                    self.assertEqual(result, expected_result)
+
+    def test_three_way_partition_returns_block_equal_to_pivot(self):
+        array = [3, 1, 3, 5, 3, 0, 6, 3]
+
+        lower, upper = QuickSortHoare.partition_three_way(array, 0, len(array) - 1)
+
+        self.assertEqual(array[lower : upper + 1], [3, 3, 3, 3])
+        self.assertTrue(all(x < 3 for x in array[:lower]))
+        self.assertTrue(all(x > 3 for x in array[upper + 1 :]))
+
+    def test_key_and_reverse(self):
+        array = [random.randint(-50, 50) for _ in range(300)]
+
+        result = QuickSortHoare().sort(array, "three way", key=abs, reverse=True)
+
+        self.assertIs(result, array)
+        self.assertEqual(result, sorted(array, key=abs, reverse=True))
+
+
+class IntroSortTestCase(TestCase):
+    """TestCase for the IntroSort algorithm."""
+
+    def test_1(self):
+        testcases = [
+            range(1, 8),
+            range(1, 20),
+            range(1, 200),
+            range(543, 56063),
+        ]
+        for testcase in testcases:
+            with self.subTest(testcase=testcase):
+                array = list(testcase)
+                random.shuffle(array)
+
+                result = IntroSort().sort(array)
+
+                self.assertEqual(result, [x for x in testcase])
+
+    def test_adversarial_inputs(self):
+        size = 100_000
+        testcases = {
+            "sorted": list(range(size)),
+            "reversed": list(range(size, 0, -1)),
+            "organ pipe": list(range(size // 2)) + list(range(size // 2, 0, -1)),
+            "few unique": [x % 3 for x in range(size)],
+            "all equal": [7] * size,
+        }
+        for name, array in testcases.items():
+            with self.subTest(name=name):
+                expected_result = sorted(array)
+
+                result = IntroSort().sort(array)
+
+                self.assertEqual(result, expected_result)
+
+    def test_empty_and_single_element(self):
+        self.assertEqual(IntroSort().sort([]), [])
+        self.assertEqual(IntroSort().sort([1]), [1])
+
+    def test_heapsort_sorts_only_given_range(self):
+        array = [9, 8, 5, 1, 4, 2, 3, 0]
+        expected_result = [9, 8, 1, 2, 3, 4, 5, 0]
+
+        IntroSort().heapsort(array, 2, 6)
+
+        self.assertEqual(array, expected_result)
+
+    def test_insertion_sort_sorts_only_given_range(self):
+        array = [9, 8, 5, 1, 4, 2, 3, 0]
+        expected_result = [9, 1, 2, 4, 5, 8, 3, 0]
+
+        IntroSort.insertion_sort(array, 1, 5)
+
+        self.assertEqual(array, expected_result)
+
+    def test_strategies(self):
+        size = 5_000
+        testcases = {
+            "random": random.sample(range(size), size),
+            "few unique": [random.randint(0, 4) for _ in range(size)],
+            "all equal": [3] * size,
+        }
+        for strategy in ("middle pivot", "median of three pivot", "three way"):
+            for name, array in testcases.items():
+                with self.subTest(strategy=strategy, name=name):
+                    expected_result = sorted(array)
+
+                    result = IntroSort().sort(list(array), strategy)
+
+                    self.assertEqual(result, expected_result)
+
+    def test_key_is_computed_once_per_element(self):
+        calls = []
+
+        def key(record: tuple) -> int:
+            calls.append(record)
+            return record[0]
+
+        array = [(random.randint(0, 20), position) for position in range(1_000)]
+
+        result = IntroSort().sort(list(array), key=key)
+
+        self.assertEqual(result, sorted(array, key=lambda x: x[0]))
+        self.assertEqual(len(calls), len(array))
+
+    def test_reverse(self):
+        array = random.sample(range(1_000), 1_000)
+
+        result = IntroSort().sort(array, reverse=True)
+
+        self.assertEqual(result, list(range(999, -1, -1)))
@@ -0,0 +1,96 @@
+import random
+from unittest import TestCase
+
+from ..radix import CountingSort, LSDRadixSort, MSDRadixSort
+
+
+class CountingSortTestCase(TestCase):
+    """TestCase for the CountingSort algorithm."""
+
+    def test_1(self):
+        testcases = [
+            [],
+            [5],
+            [random.randint(-100, 100) for _ in range(1_000)],
+            [random.randint(0, 3) for _ in range(1_000)],
+        ]
+        for testcase in testcases:
+            with self.subTest(size=len(testcase)):
+                result = CountingSort().sort(testcase)
+
+                self.assertEqual(result, sorted(testcase))
+
+    def test_key_and_reverse_are_stable(self):
+        array = [(random.randint(0, 9), position) for position in range(500)]
+        for reverse in (False, True):
+            with self.subTest(reverse=reverse):
+                result = CountingSort().sort(array, key=lambda x: x[0], reverse=reverse)
+
+                self.assertEqual(
+                    result, sorted(array, key=lambda x: x[0], reverse=reverse)
+                )
+
+    def test_key_range_too_big(self):
+        with self.assertRaises(ValueError):
+            CountingSort().sort([0, 2**40])
+
+
+class LSDRadixSortTestCase(TestCase):
+    """TestCase for the LSDRadixSort algorithm."""
+
+    def test_1(self):
+        testcases = [
+            [],
+            [5],
+            [3, 3],
+            random.sample(range(543, 56063), 56063 - 543),
+            [random.randint(-(2**63), 2**63 - 1) for _ in range(5_000)],
+            [random.randint(-3, 3) for _ in range(1_000)],
+        ]
+        for testcase in testcases:
+            with self.subTest(size=len(testcase)):
+                result = LSDRadixSort().sort(testcase)
+
+                self.assertEqual(result, sorted(testcase))
+
+    def test_key_and_reverse_are_stable(self):
+        array = [(random.randint(-1_000, 1_000), index) for index in range(2_000)]
+        for reverse in (False, True):
+            with self.subTest(reverse=reverse):
+                result = LSDRadixSort().sort(array, key=lambda x: x[0], reverse=reverse)
+
+                self.assertEqual(
+                    result, sorted(array, key=lambda x: x[0], reverse=reverse)
+                )
+
+
+class MSDRadixSortTestCase(TestCase):
+    """TestCase for the MSDRadixSort algorithm."""
+
+    def test_1(self):
+        testcases = [
+            [],
+            ["a"],
+            ["".join(random.choices("abc", k=8)) for _ in range(2_000)],
+            [
+                "".join(random.choices("xyz", k=random.randint(0, 6)))
+                for _ in range(2_000)
+            ],
+            ["prefix-" + str(random.randint(0, 10**6)) for _ in range(2_000)],
+            ["żółw", "zebra", "źdźbło", "", "a", "ą"] * 10,
+        ]
+        for testcase in testcases:
+            with self.subTest(size=len(testcase)):
+                result = MSDRadixSort().sort(testcase)
+
+                self.assertEqual(result, sorted(testcase))
+
+    def test_key_and_reverse_are_stable(self):
+        array = [("".join(random.choices("ab", k=4)), index) for index in range(500)]
+        for reverse in (False, True):
+            with self.subTest(reverse=reverse):
+                result = MSDRadixSort().sort(array, key=lambda x: x[0], reverse=reverse)
+
+                self.assertEqual(
+                    result, sorted(array, key=lambda x: x[0], reverse=reverse)
+                )
@@ -0,0 +1,74 @@
+import random
+from unittest import TestCase
+
+from ..selection import QuickSelect
+
+
+class QuickSelectTestCase(TestCase):
+    """TestCase for the QuickSelect algorithm."""
+
+    def test_select(self):
+        testcases = {
+            "random": random.sample(range(10_000), 10_000),
+            "few unique": [random.randint(0, 4) for _ in range(5_000)],
+            "sorted": list(range(5_000)),
+            "reversed": list(range(5_000, 0, -1)),
+            "small": [3, 1, 2],
+        }
+        for name, array in testcases.items():
+            expected_order = sorted(array)
+            for k in (0, len(array) // 2, len(array) - 1):
+                with self.subTest(name=name, k=k):
+                    elements = list(array)
+
+                    result = QuickSelect().select(elements, k)
+
+                    self.assertEqual(result, expected_order[k])
+                    self.assertTrue(all(x <= result for x in elements[:k]))
+                    self.assertTrue(all(x >= result for x in elements[k + 1 :]))
+
+    def test_select_out_of_range(self):
+        with self.assertRaises(IndexError):
+            QuickSelect().select([1, 2, 3], 3)
+
+    def test_median_of_medians_is_close_to_median(self):
+        elements = random.sample(range(1_000), 1_000)
+
+        index = QuickSelect().median_of_medians(elements, 0, len(elements) - 1)
+
+        self.assertTrue(300 <= elements[index] <= 700)
+
+    def test_median_of_medians_fallback(self):
+        selector = QuickSelect()
+        # pivots picked by median of three are always the worst ones
+        selector.median_of_three = lambda elements, first, second, third: first
+        array = random.sample(range(3_000), 3_000)
+        elements = sorted(array)
+
+        result = selector.select(elements, 1_500)
+
+        self.assertEqual(result, 1_500)
+
+    def test_partial_sort(self):
+        array = [random.randint(0, 1_000) for _ in range(2_000)]
+        for k in (0, 1, 10, 2_000, 5_000):
+            with self.subTest(k=k):
+                elements = list(array)
+
+                result = QuickSelect().partial_sort(elements, k)
+
+                self.assertIs(result, elements)
+                self.assertEqual(result[:k], sorted(array)[:k])
+                self.assertEqual(sorted(result), sorted(array))
+
+    def test_top_k(self):
+        array = [random.randint(-500, 500) for _ in range(3_000)]
+        for streaming in (False, True):
+            for reverse in (False, True):
+                for k in (0, 1, 25, 4_000):
+                    with self.subTest(streaming=streaming, reverse=reverse, k=k):
+                        result = QuickSelect().top_k(
+                            iter(array), k, reverse=reverse, streaming=streaming
+                        )
+
+                        self.assertEqual(result, sorted(array, reverse=reverse)[:k])